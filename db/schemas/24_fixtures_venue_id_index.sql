@@ -0,0 +1,8 @@
+-- CORE performance: venue backfill anti-join
+-- Used by scripts/venues_backfill.py:
+--   SELECT venue_id FROM core.fixtures WHERE venue_id IS NOT NULL
+--   EXCEPT SELECT id FROM core.venues ORDER BY 1 LIMIT <max>
+
+CREATE INDEX IF NOT EXISTS idx_core_fixtures_venue_id
+  ON core.fixtures (venue_id)
+  WHERE venue_id IS NOT NULL;
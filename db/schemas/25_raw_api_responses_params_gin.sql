@@ -0,0 +1,6 @@
+-- RAW performance: containment lookups on requested_params
+-- Used by coverage pipeline counts (src/coverage/calculator.py):
+--   WHERE endpoint = '/injuries' AND requested_params @> jsonb_build_object('league', <id>, 'season', <season>)
+
+CREATE INDEX IF NOT EXISTS idx_raw_api_responses_requested_params_gin
+  ON raw.api_responses USING GIN (requested_params jsonb_path_ops);
@@ -0,0 +1,17 @@
+-- MART pre-aggregation: per league/season fixture counts for coverage
+-- Refreshed by scripts/daily_sync.py (_refresh_mart_views) right before the coverage sweep;
+-- read by CoverageCalculator.calculate_all(..., preaggregated=True).
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mart.fixtures_league_counts AS
+SELECT
+  f.league_id,
+  f.season,
+  COUNT(*) AS actual,
+  MAX(f.updated_at) AS last_update
+FROM core.fixtures f
+WHERE f.season IS NOT NULL
+GROUP BY f.league_id, f.season;
+
+-- Unique index: required for REFRESH MATERIALIZED VIEW CONCURRENTLY (readers are never blocked).
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mart_fixtures_league_counts
+  ON mart.fixtures_league_counts (league_id, season);
@@ -0,0 +1,10 @@
+-- CORE performance: stale fixture selection (auto-finish job)
+-- Used by src/jobs/auto_finish_stale_fixtures.py (_select_stale_fixture_ids):
+--   WHERE league_id = ANY(...) AND status_short IN (<STALE_STATUSES literals>)
+--     AND date < NOW() - <threshold> AND updated_at < NOW() - <safety lag>
+-- Partial: only fixtures still in a stale-eligible status are indexed (a small fraction of the table).
+-- Keep the status list in sync with STALE_STATUSES.
+
+CREATE INDEX IF NOT EXISTS idx_core_fixtures_stale_candidates
+  ON core.fixtures (league_id, date, updated_at)
+  WHERE status_short IN ('NS', 'HT', '2H', '1H', 'LIVE', 'BT', 'ET', 'P', 'SUSP', 'INT');
@@ -128,6 +128,14 @@ def _refresh_mart_views(conn) -> None:
         # NOTE: mart.coverage_status is a TABLE in Phase 3 (written by CoverageCalculator).
 
 
+def _refresh_league_counts_view(conn) -> None:
+    # Own transaction: CONCURRENTLY fails if the view is missing/unpopulated or lacks its unique
+    # index (migration 26 not applied), and that must not roll back the dashboard refresh.
+    with conn.cursor() as cur:
+        # Unique (league_id, season) index -> CONCURRENTLY keeps coverage/read API readers unblocked.
+        cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mart.fixtures_league_counts;")
+
+
 def _count_existing(conn, table: str, id_col: str, ids: list[int]) -> int:
     if not ids:
         return 0
@@ -622,17 +630,28 @@ async def sync_daily_fixtures(
         except Exception as e:
             logger.error("mart_refresh_failed", err=str(e))
 
+        # Only the league-counts view feeds calculate_all(preaggregated=True).
+        mart_refreshed = False
+        try:
+            with get_transaction() as conn:
+                _refresh_league_counts_view(conn)
+            mart_refreshed = True
+            logger.info("mart_refreshed", views=["mart.fixtures_league_counts"])
+        except Exception as e:
+            logger.error("mart_refresh_failed", view="mart.fixtures_league_counts", err=str(e))
+
         # Coverage calculator (Phase 3): write per-league coverage rows into mart.coverage_status
         try:
             calc = CoverageCalculator()
             # Keep existing coverage behavior: compute coverage for configured tracked leagues.
             # In global_by_date mode we also ingest cups/UEFA etc, but we intentionally do not
             # expand coverage rows for every competition to avoid unbounded mart growth.
-            for l in tracked:
-                cov_season = int(l.season) if l.season is not None else int(season)
-                cov = calc.calculate_fixtures_coverage(l.id, cov_season)
-                upsert_mart_coverage(coverage_data=cov)
-                logger.info("coverage_calculated", league_id=l.id, season=season, endpoint="/fixtures", overall=cov.get("overall_coverage"))
+            # One batched query for all tracked leagues instead of per-league round-trips.
+            pairs = [(l.id, int(l.season) if l.season is not None else int(season)) for l in tracked]
+            # Season counts come from the just-refreshed mart view; fall back to CORE if the refresh failed.
+            for cov in calc.calculate_all(pairs, preaggregated=mart_refreshed):
+                upsert_mart_coverage(coverage_data=cov.to_dict())
+                logger.info("coverage_calculated", league_id=cov.league_id, season=season, endpoint="/fixtures", overall=cov.overall_coverage)
         except Exception as e:
             logger.error("coverage_calculation_failed", err=str(e))
 
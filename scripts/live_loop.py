@@ -306,9 +306,9 @@ async def run_iteration(
 
     fixtures_written = len(fixtures_rows)
 
-    # Update cache only after successful DB write
-    for fid, state, diff, league_name in changed_meta:
-        detector.update_cache(fid, state)
+    # Update cache only after successful DB write (one pipelined round-trip per tick)
+    detector.update_cache_many({fid: state for fid, state, _diff, _league_name in changed_meta})
+    for fid, _state, diff, league_name in changed_meta:
         logger.info("fixture_updated", fixture_id=fid, league=league_name, diff=diff)
 
     q = limiter.quota
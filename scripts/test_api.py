@@ -13,18 +13,11 @@ sys.path.insert(0, str(SRC_DIR))
 from collector.api_client import APIClient  # noqa: E402
 
 
-def _get_header_ci(headers: dict[str, str], key: str) -> str | None:
-    for k, v in headers.items():
-        if k.lower() == key.lower():
-            return v
-    return None
-
-
 async def main() -> int:
     load_dotenv()
 
     try:
-        client = APIClient()
+        client = APIClient.get_or_create()
     except Exception as e:
         print(f"❌ APIClient init failed: {e}")
         return 1
@@ -38,10 +31,10 @@ async def main() -> int:
 
     print("✅ /status call succeeded")
 
-    daily_limit = _get_header_ci(result.headers, "x-ratelimit-requests-limit")
-    daily_remaining = _get_header_ci(result.headers, "x-ratelimit-requests-remaining")
-    minute_limit = _get_header_ci(result.headers, "X-RateLimit-Limit")
-    minute_remaining = _get_header_ci(result.headers, "X-RateLimit-Remaining")
+    daily_limit = result.headers.get("x-ratelimit-requests-limit")
+    daily_remaining = result.headers.get("x-ratelimit-requests-remaining")
+    minute_limit = result.headers.get("X-RateLimit-Limit")
+    minute_remaining = result.headers.get("X-RateLimit-Remaining")
 
     if daily_remaining is not None or minute_remaining is not None:
         print("✅ Quota headers:")
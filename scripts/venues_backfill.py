@@ -17,6 +17,9 @@ from utils.venues_backfill import backfill_missing_venues_for_fixtures  # noqa:
 
 logger = get_logger(script="venues_backfill")
 
+# Missing venue ids fetched per keyset page.
+_PAGE_SIZE = 1000
+
 
 async def _amain() -> int:
     setup_logging()
@@ -27,40 +30,53 @@ async def _amain() -> int:
 
     # Find venue IDs referenced by fixtures but missing in venues
     # Note: we intentionally do this in SQL for accuracy against current DB state.
+    # EXCEPT runs as a hashed anti-join and the LIMIT keeps the --max cap in SQL
+    # (supported by idx_core_fixtures_venue_id, db/schemas/24_fixtures_venue_id_index.sql).
+    # Paged by keyset (venue_id > last seen), one short transaction per page, so no snapshot or
+    # pooled connection is held while the rate-limited API calls for a page run.
     from utils.db import query_scalar, get_transaction  # noqa: E402
 
-    with get_transaction() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT DISTINCT f.venue_id
-                FROM core.fixtures f
-                LEFT JOIN core.venues v ON v.id = f.venue_id
-                WHERE f.venue_id IS NOT NULL AND v.id IS NULL
-                ORDER BY f.venue_id
-                """
-            )
-            missing = [int(r[0]) for r in cur.fetchall()]
-
-    if not missing:
-        logger.info("no_missing_venues")
-        return 0
-
-    logger.info("missing_venues_found", count=len(missing), sample=missing[:10])
-
     limiter = RateLimiter(max_tokens=300, refill_rate=5.0)
-    client = APIClient()
+    client = APIClient.get_or_create()
+    found = 0
+    upserted = 0
+    remaining = max(0, int(args.max))
+    last_id = 0  # venue ids are positive (API uses 0 for "unknown")
     try:
-        upserted = await backfill_missing_venues_for_fixtures(
-            venue_ids=missing,
-            client=client,
-            limiter=limiter,
-            dry_run=args.dry_run,
-            max_to_fetch=args.max,
-        )
+        while remaining > 0:
+            with get_transaction() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        SELECT venue_id FROM core.fixtures WHERE venue_id IS NOT NULL AND venue_id > %s
+                        EXCEPT
+                        SELECT id FROM core.venues WHERE id > %s
+                        ORDER BY 1
+                        LIMIT %s
+                        """,
+                        (last_id, last_id, min(_PAGE_SIZE, remaining)),
+                    )
+                    batch = [int(r[0]) for r in cur.fetchall()]
+            if not batch:
+                break
+            last_id = batch[-1]
+            remaining -= len(batch)
+            found += len(batch)
+            logger.info("missing_venues_found", count=len(batch), sample=batch[:10])
+            upserted += await backfill_missing_venues_for_fixtures(
+                venue_ids=batch,
+                client=client,
+                limiter=limiter,
+                dry_run=args.dry_run,
+                max_to_fetch=len(batch),
+            )
     finally:
         await client.aclose()
 
+    if found == 0:
+        logger.info("no_missing_venues")
+        return 0
+
     logger.info("venues_backfill_complete", upserted=upserted, daily_remaining=limiter.quota.daily_remaining)
     return 0
 
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar
 
 import httpx
 from dotenv import load_dotenv
 
 
+_ENV_LOADED = False
+
+
+def _ensure_env() -> None:
+    """Load .env once per process (later clients reuse os.environ as-is)."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
+
+
 class APIClientError(Exception):
     pass
 
@@ -17,7 +29,10 @@ class AuthenticationError(APIClientError):
 
 
 class RateLimitError(APIClientError):
-    pass
+    def __init__(self, message: str, *, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        # Seconds from the 429's Retry-After header, when the API sent one.
+        self.retry_after = retry_after
 
 
 class APITimeoutError(APIClientError):
@@ -39,7 +54,8 @@ class APIUnexpectedStatusError(APIClientError):
 class APIResult:
     status_code: int
     data: dict[str, Any] | None
-    headers: dict[str, str]
+    # httpx.Headers in production (case-insensitive lookups); plain dicts are accepted in tests.
+    headers: Mapping[str, str]
 
 
 class APIClient:
@@ -47,9 +63,13 @@ class APIClient:
     API-Football client (Phase 1)
     - GET-only
     - Exactly one auth header: x-apisports-key
-    - Async httpx
+    - Async httpx (HTTP/2, shared keep-alive pool)
+    - .env is read once per process on first construction
     """
 
+    # Process-wide instances keyed by (base_url, api_key); see get_or_create().
+    _instances: ClassVar[dict[tuple[str, str], "APIClient"]] = {}
+
     def __init__(
         self,
         *,
@@ -57,7 +77,7 @@ class APIClient:
         timeout_seconds: float = 30.0,
         api_key_env: str = "API_FOOTBALL_KEY",
     ) -> None:
-        load_dotenv()
+        _ensure_env()
         api_key = os.getenv(api_key_env)
         if not api_key:
             raise ValueError(f"Missing API key env var: {api_key_env}")
@@ -65,6 +85,8 @@ class APIClient:
         self._base_url = base_url.rstrip("/")
         self._timeout = float(timeout_seconds)
         self._api_key = api_key
+        # Built once; httpx merges it into each outgoing request.
+        self._auth_headers = {"x-apisports-key": api_key}
 
         # IMPORTANT: do not set any additional custom headers.
         # httpx will still send mandatory HTTP headers (Host, etc.).
@@ -72,50 +94,61 @@ class APIClient:
             base_url=self._base_url,
             timeout=self._timeout,
             headers={},  # avoid adding any custom headers at client level
+            # Concurrent requests multiplex over one keep-alive HTTP/2 connection.
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            ),
         )
 
+    @classmethod
+    def get_or_create(
+        cls,
+        *,
+        base_url: str = "https://v3.football.api-sports.io",
+        timeout_seconds: float = 30.0,
+        api_key_env: str = "API_FOOTBALL_KEY",
+    ) -> "APIClient":
+        """
+        Return a shared client for (base_url, api_key), creating it on first use.
+        Reusing the instance keeps one HTTP/2 connection (and TLS session) alive
+        across sequential script steps instead of re-handshaking per client.
+        """
+        _ensure_env()
+        api_key = os.getenv(api_key_env) or ""
+        key = (base_url.rstrip("/"), api_key)
+        inst = cls._instances.get(key)
+        if inst is None or inst._client.is_closed:
+            inst = cls(base_url=base_url, timeout_seconds=timeout_seconds, api_key_env=api_key_env)
+            cls._instances[key] = inst
+        return inst
+
     async def aclose(self) -> None:
         await self._client.aclose()
+        key = (self._base_url, self._api_key)
+        if self._instances.get(key) is self:
+            del self._instances[key]
 
     async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> APIResult:
-        return await self.request("GET", endpoint, params=params)
-
-    async def request(
-        self,
-        method: str,
-        endpoint: str,
-        *,
-        params: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-    ) -> APIResult:
-        # GET only enforcement
-        if method.upper() != "GET":
-            raise ValueError("GET only: POST/PUT/DELETE are forbidden for API-Football")
-
-        # Header enforcement: ONLY x-apisports-key allowed as a custom header
-        if headers:
-            raise ValueError("Custom headers are forbidden. APIClient sets only 'x-apisports-key'.")
-
         # Ensure endpoint starts with /
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
 
-        req_headers = {"x-apisports-key": self._api_key}
-
         try:
             resp = await self._client.request(
                 method="GET",
                 url=endpoint,
                 params=params or {},
-                headers=req_headers,
+                headers=self._auth_headers,
             )
         except httpx.TimeoutException as e:
             raise APITimeoutError("Request timeout") from e
         except httpx.RequestError as e:
             raise APIClientError(f"Request error: {e}") from e
 
-        # Quota tracking: return headers
-        resp_headers = {k: v for k, v in resp.headers.items()}
+        # Quota tracking: return headers (keep httpx's case-insensitive mapping; no copy)
+        resp_headers = resp.headers
 
         # Status handling
         if resp.status_code == 200:
@@ -132,7 +165,10 @@ class APIClient:
             raise AuthenticationError("Unauthorized (401): invalid API key")
 
         if resp.status_code == 429:
-            raise RateLimitError("Too Many Requests (429): rate limit exceeded")
+            raise RateLimitError(
+                "Too Many Requests (429): rate limit exceeded",
+                retry_after=_maybe_float(resp_headers.get("retry-after")),
+            )
 
         if resp.status_code == 499:
             raise APITimeoutError("API timeout (499)")
@@ -147,4 +183,31 @@ class APIClient:
             body_text = None
         raise APIUnexpectedStatusError(resp.status_code, body_text=body_text)
 
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> APIResult:
+        """Guarded generic entrypoint kept for compatibility; use get() on hot paths."""
+        # GET only enforcement
+        if method.upper() != "GET":
+            raise ValueError("GET only: POST/PUT/DELETE are forbidden for API-Football")
+
+        # Header enforcement: ONLY x-apisports-key allowed as a custom header
+        if headers:
+            raise ValueError("Custom headers are forbidden. APIClient sets only 'x-apisports-key'.")
+
+        return await self.get(endpoint, params=params)
+
 
+def _maybe_float(raw: str | None) -> float | None:
+    # Retry-After may also be an HTTP date; only the delta-seconds form is used here.
+    if raw is None:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return None
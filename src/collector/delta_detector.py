@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, TypedDict
 
@@ -12,6 +13,9 @@ from utils.logging import get_logger
 
 logger = get_logger(component="delta_detector")
 
+# Pre-encoded key template: redis-py sends bytes keys as-is (no per-call str->bytes encode).
+_KEY_FMT = b"fixture:%d"
+
 
 class FixtureState(TypedDict, total=False):
     status: str | None
@@ -20,6 +24,15 @@ class FixtureState(TypedDict, total=False):
     elapsed: int | None
 
 
+# Compared fields, in the order used by the normalized state tuple.
+_FIELDS = ("status", "goals_home", "goals_away", "elapsed")
+_StateTuple = tuple[str | None, int | None, int | None, int | None]
+
+# Upper bound for cached reads handed from has_changed() to get_diff().
+_LAST_CACHED_MAX = 4096
+_MISSING = object()
+
+
 @dataclass(frozen=True)
 class DeltaResult:
     changed: bool
@@ -48,12 +61,16 @@ class DeltaDetector:
     def __init__(self, redis_client: redis.Redis, *, ttl_seconds: int = 7200) -> None:
         self.redis = redis_client
         self.ttl_seconds = int(ttl_seconds)
+        # Cached state read by has_changed() when it returned True; consumed by the
+        # get_diff() call that follows so each changed fixture costs one Redis GET.
+        self._last_cached: OrderedDict[int, _StateTuple | None] = OrderedDict()
 
-    def _key(self, fixture_id: int) -> str:
-        return f"fixture:{int(fixture_id)}"
+    def _key(self, fixture_id: int) -> bytes:
+        # fixture_id is already an int (callers parse it once via _fixture_id).
+        return _KEY_FMT % fixture_id
 
-    def _normalize_state(self, current_state: dict[str, Any]) -> FixtureState:
-        # Only keep the compared fields; tolerate missing keys.
+    def _normalize_state(self, current_state: dict[str, Any]) -> _StateTuple:
+        # Only keep the compared fields (in _FIELDS order); tolerate missing keys.
         def _to_int(v: Any) -> int | None:
             if v is None:
                 return None
@@ -66,14 +83,14 @@ class DeltaDetector:
         if status is not None:
             status = str(status)
 
-        return {
-            "status": status,
-            "goals_home": _to_int(current_state.get("goals_home")),
-            "goals_away": _to_int(current_state.get("goals_away")),
-            "elapsed": _to_int(current_state.get("elapsed")),
-        }
+        return (
+            status,
+            _to_int(current_state.get("goals_home")),
+            _to_int(current_state.get("goals_away")),
+            _to_int(current_state.get("elapsed")),
+        )
 
-    def _get_cached(self, fixture_id: int) -> FixtureState | None:
+    def _get_cached(self, fixture_id: int) -> _StateTuple | None:
         key = self._key(fixture_id)
         try:
             raw = self.redis.get(key)
@@ -108,17 +125,14 @@ class DeltaDetector:
             True if changed, False if same.
             Fail-open: if cache is missing OR Redis is unavailable, returns True.
         """
-        current = self._normalize_state(current_state)
         cached = self._get_cached(fixture_id)
-        if cached is None:
-            return True
-
-        return (
-            cached.get("status") != current.get("status")
-            or cached.get("goals_home") != current.get("goals_home")
-            or cached.get("goals_away") != current.get("goals_away")
-            or cached.get("elapsed") != current.get("elapsed")
-        )
+        changed = cached is None or cached != self._normalize_state(current_state)
+        if changed:
+            self._last_cached[fixture_id] = cached
+            self._last_cached.move_to_end(fixture_id)
+            if len(self._last_cached) > _LAST_CACHED_MAX:
+                self._last_cached.popitem(last=False)
+        return changed
 
     def get_diff(self, fixture_id: int, current_state: dict[str, Any]) -> dict[str, Any]:
         """
@@ -127,7 +141,9 @@ class DeltaDetector:
         If Redis is unavailable/corrupt cache, returns {"_cache_unavailable": True}.
         """
         current = self._normalize_state(current_state)
-        cached = self._get_cached(fixture_id)
+        cached = self._last_cached.pop(fixture_id, _MISSING)
+        if cached is _MISSING:
+            cached = self._get_cached(fixture_id)
 
         if cached is None:
             # Could be first-seen OR redis failure; we can't distinguish perfectly here without more signals.
@@ -137,31 +153,49 @@ class DeltaDetector:
             except redis.exceptions.RedisError:
                 return {"_cache_unavailable": True}
             if not exists:
-                return {
-                    k: {"old": None, "new": current.get(k)}
-                    for k in ("status", "goals_home", "goals_away", "elapsed")
-                }
+                return {k: {"old": None, "new": new} for k, new in zip(_FIELDS, current)}
             return {"_cache_unavailable": True}
 
-        diff: dict[str, Any] = {}
-        for k in ("status", "goals_home", "goals_away", "elapsed"):
-            old = cached.get(k)
-            new = current.get(k)
-            if old != new:
-                diff[k] = {"old": old, "new": new}
-        return diff
+        return {
+            k: {"old": old, "new": new}
+            for k, old, new in zip(_FIELDS, cached, current)
+            if old != new
+        }
 
     def update_cache(self, fixture_id: int, current_state: dict[str, Any]) -> None:
         """Store current state in Redis with TTL."""
+        self._last_cached.pop(fixture_id, None)
         key = self._key(fixture_id)
-        payload = self._normalize_state(current_state)
+        payload = dict(zip(_FIELDS, self._normalize_state(current_state)))
         try:
             self.redis.setex(key, self.ttl_seconds, json.dumps(payload, separators=(",", ":")))
         except redis.exceptions.RedisError:
             logger.warning("redis_setex_failed", fixture_id=fixture_id)
 
+    def update_cache_many(self, states: dict[int, dict[str, Any]]) -> None:
+        """
+        Store many fixture states in one Redis round-trip (pipelined MSET + per-key EXPIRE).
+        Equivalent to calling update_cache() for each item.
+        """
+        if not states:
+            return
+        mapping: dict[bytes, str] = {}
+        for fixture_id, current_state in states.items():
+            self._last_cached.pop(fixture_id, None)
+            payload = dict(zip(_FIELDS, self._normalize_state(current_state)))
+            mapping[self._key(fixture_id)] = json.dumps(payload, separators=(",", ":"))
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.mset(mapping)
+            for key in mapping:
+                pipe.expire(key, self.ttl_seconds)
+            pipe.execute()
+        except redis.exceptions.RedisError:
+            logger.warning("redis_mset_failed", fixtures=len(mapping))
+
     def clear_cache(self, fixture_id: int) -> None:
         """Delete fixture state from Redis."""
+        self._last_cached.pop(fixture_id, None)
         try:
             self.redis.delete(self._key(fixture_id))
         except redis.exceptions.RedisError:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from threading import Lock
 
 
+# Refills closer together than this are deferred (amortizes bucket math under high call rates).
+_MIN_REFILL_STEP_SECONDS = 0.001
+
+
 @dataclass(frozen=True)
 class QuotaSnapshot:
     daily_remaining: int | None
@@ -90,7 +95,7 @@ class RateLimiter:
             # Sleep outside lock to allow other threads to progress/refill.
             time.sleep(max(0.0, wait_seconds))
 
-    def update_from_headers(self, headers: dict[str, str]) -> None:
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
         """
         Update internal state from API-Football quota headers.
 
@@ -107,9 +112,10 @@ class RateLimiter:
             self._raise_if_emergency_stop_locked()
 
             # If API reports a lower minute remaining than our local tokens, clamp.
-            if minute is not None:
-                self._tokens = min(self._tokens, float(minute))
-                self._tokens = max(0.0, self._tokens)
+            # Refill first so the clamp compares against the current bucket, not a stale one.
+            self._refill_locked()
+            if minute is not None and minute < self._max_tokens:
+                self._tokens = max(0.0, min(self._tokens, float(minute)))
 
     def _raise_if_emergency_stop_locked(self) -> None:
         thr = self._emergency_stop_threshold
@@ -124,22 +130,17 @@ class RateLimiter:
     def _refill_locked(self) -> None:
         now = time.monotonic()
         elapsed = now - self._last_refill
-        if elapsed <= 0:
+        if elapsed < _MIN_REFILL_STEP_SECONDS:
+            # Sub-millisecond bursts: leave _last_refill untouched so the time still accrues next call.
             return
 
         self._tokens = min(self._max_tokens, self._tokens + elapsed * self._refill_rate)
         self._last_refill = now
 
 
-def _parse_int_header(headers: dict[str, str], key: str) -> int | None:
-    # Work with normal dicts and httpx.Headers (case-insensitive mapping).
-    raw = headers.get(key) if hasattr(headers, "get") else None
-    if raw is None:
-        # fallback to case-insensitive scan
-        for k, v in headers.items():
-            if k.lower() == key.lower():
-                raw = v
-                break
+def _parse_int_header(headers: Mapping[str, str], key: str) -> int | None:
+    # APIResult.headers is an httpx.Headers (case-insensitive), so a single lookup suffices.
+    raw = headers.get(key)
     if raw is None:
         return None
     try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import signal
 from dataclasses import dataclass
@@ -8,7 +9,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Awaitable
 
-import yaml
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
@@ -40,8 +40,8 @@ from src.jobs.static_bootstrap import (
     run_bootstrap_teams,
     run_bootstrap_timezones,
 )
-from src.utils.config import load_api_config, load_rate_limiter_config
-from src.utils.db import query_scalar
+from src.utils.config import load_api_config, load_rate_limiter_config, load_yaml_cached
+from src.utils.db import query_row
 from src.utils.job_config import apply_bootstrap_scope_inheritance
 from src.utils.logging import get_logger, setup_logging
 
@@ -60,6 +60,9 @@ class Job:
     dependencies: list[str]
     filters: dict[str, Any]
     mode: dict[str, Any]
+    # Derived once at load time (see _load_jobs_from_yaml); runners read these instead of re-parsing.
+    cached_season: int | None = None
+    cached_tracked: frozenset[int] = frozenset()
 
 
 def _utc_now() -> datetime:
@@ -71,7 +74,12 @@ def _scheduler_tz() -> ZoneInfo:
     - DB timestamps remain UTC (non-negotiable)
     - This only affects when cron triggers fire
     """
-    tz_name = os.getenv("SCHEDULER_TIMEZONE", "UTC")
+    return _scheduler_tz_for(os.getenv("SCHEDULER_TIMEZONE", "UTC"))
+
+
+@functools.lru_cache(maxsize=4)
+def _scheduler_tz_for(tz_name: str) -> ZoneInfo:
+    # Cached per name: the tzdata lookup (and the fallback warning) happens once.
     try:
         return ZoneInfo(tz_name)
     except Exception:
@@ -79,13 +87,31 @@ def _scheduler_tz() -> ZoneInfo:
         return ZoneInfo("UTC")
 
 
+@functools.cache
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+# Job runners all read tracked leagues / params from daily.yaml.
+_DAILY_YAML = _project_root() / "config" / "jobs" / "daily.yaml"
+
+
+def _parse_tracked_leagues(filters: dict[str, Any], mode: dict[str, Any]) -> frozenset[int]:
+    tl = filters.get("tracked_leagues") or mode.get("tracked_leagues") or []
+    if not isinstance(tl, list) or not tl:
+        return frozenset()
+    return frozenset(int(x) for x in tl)
+
+
+def _parse_season(params: dict[str, Any]) -> int | None:
+    s = params.get("season")
+    if s is None:
+        return None
+    return int(s)
+
 
 def _load_jobs_from_yaml(path: Path) -> list[Job]:
-    cfg = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(path)
     raw = cfg.get("jobs") or []
     out: list[Job] = []
     jobs_dir = path.parent
@@ -93,16 +119,21 @@ def _load_jobs_from_yaml(path: Path) -> list[Job]:
         if not isinstance(j, dict):
             continue
         j = apply_bootstrap_scope_inheritance(j, jobs_dir=jobs_dir)
+        params = j.get("params") or {}
+        filters = j.get("filters") or {}
+        mode = j.get("mode") or {}
         job = Job(
             job_id=str(j.get("job_id") or ""),
             enabled=bool(j.get("enabled", False)),
             type=str(j.get("type") or ""),
             endpoint=(str(j.get("endpoint")) if j.get("endpoint") is not None else None),
-            params=(j.get("params") or {}),
+            params=params,
             interval=(j.get("interval") or None),
             dependencies=[str(x) for x in (j.get("dependencies") or []) if x],
-            filters=(j.get("filters") or {}),
-            mode=(j.get("mode") or {}),
+            filters=filters,
+            mode=mode,
+            cached_season=_parse_season(params),
+            cached_tracked=_parse_tracked_leagues(filters, mode),
         )
         out.append(job)
     return [x for x in out if x.job_id and x.type]
@@ -115,14 +146,21 @@ def _job_files() -> list[Path]:
     return [p for p in files if p.exists()]
 
 
+@functools.lru_cache(maxsize=None)
+def _cron_trigger(cron: str, tz_key: str) -> CronTrigger:
+    # Project uses 5-field cron (min hour day month weekday) in config.
+    # CronTrigger is stateless between fire-time computations, so jobs with the same schedule share one.
+    # (IntervalTrigger is not cached: it anchors start_date at construction time.)
+    return CronTrigger.from_crontab(cron, timezone=ZoneInfo(tz_key))
+
+
 def _to_trigger(interval_cfg: dict[str, Any], tz: ZoneInfo) -> CronTrigger | IntervalTrigger:
     t = str(interval_cfg.get("type") or "").strip().lower()
     if t == "cron":
         cron = interval_cfg.get("cron")
         if not cron:
             raise ValueError("Missing interval.cron")
-        # Project uses 5-field cron (min hour day month weekday) in config.
-        return CronTrigger.from_crontab(str(cron), timezone=tz)
+        return _cron_trigger(str(cron).strip(), tz.key)
     if t == "interval":
         seconds = interval_cfg.get("seconds")
         if seconds is None:
@@ -131,19 +169,97 @@ def _to_trigger(interval_cfg: dict[str, Any], tz: ZoneInfo) -> CronTrigger | Int
     raise ValueError(f"Unsupported interval.type: {t}")
 
 
-def _tracked_leagues(job: Job) -> set[int]:
-    tl = job.filters.get("tracked_leagues") or job.mode.get("tracked_leagues") or []
-    if not isinstance(tl, list) or not tl:
-        return set()
-    return {int(x) for x in tl}
+_Runner = Callable[[Job, APIClient, RateLimiter], Awaitable[None]]
 
 
-def _season(job: Job) -> int | None:
-    params = job.params or {}
-    s = params.get("season")
-    if s is None:
-        return None
-    return int(s)
+async def _run_bootstrap_timezones(job: Job, client: APIClient, limiter: RateLimiter) -> None:
+    await run_bootstrap_timezones(client=client, limiter=limiter)
+
+
+async def _run_bootstrap_countries(job: Job, client: APIClient, limiter: RateLimiter) -> None:
+    await run_bootstrap_countries(client=client, limiter=limiter)
+
+
+async def _run_bootstrap_leagues(job: Job, client: APIClient, limiter: RateLimiter) -> None:
+    season = job.cached_season
+    tracked = job.cached_tracked
+    if season is None or not tracked:
+        raise ValueError("bootstrap_leagues requires params.season and filters.tracked_leagues")
+    await run_bootstrap_leagues(client=client, limiter=limiter, season=season, tracked_leagues=tracked)
+
+
+async def _run_bootstrap_teams(job: Job, client: APIClient, limiter: RateLimiter) -> None:
+    season = job.cached_season
+    tracked = job.cached_tracked
+    if season is None or not tracked:
+        raise ValueError("bootstrap_teams requires params.season and mode.tracked_leagues")
+    await run_bootstrap_teams(client=client, limiter=limiter, season=season, tracked_leagues=tracked)
+
+
+async def _run_daily_fixtures_by_date(job: Job, client: APIClient, limiter: RateLimiter) -> None:
+    # Config prohibits assuming date in YAML; we compute UTC "today" at runtime.
+    date_utc = _utc_now().date().isoformat()
+    await run_daily_fixtures_by_date(
+        target_date_utc=date_utc,
+        client=client,
+        limiter=limiter,
+        config_path=_DAILY_YAML,
+    )
+
+
+async def _run_daily_standings(job: Job, client: APIClient, limiter: RateLimiter) -> None:
+    max_leagues = None
+    try:
+        v = (job.mode or {}).get("max_leagues_per_run")
+        if v is not None and str(v).strip() != "":
+            max_leagues = int(v)
+    except Exception:
+        max_leagues = None
+    await run_daily_standings(
+        client=client,
+        limiter=limiter,
+        config_path=_DAILY_YAML,
+        max_leagues_per_run=max_leagues,
+    )
+
+
+def _daily_config_runner(fn: Callable[..., Awaitable[None]]) -> _Runner:
+    """Adapter for runners whose only job-specific input is config/jobs/daily.yaml."""
+
+    async def _run(job: Job, client: APIClient, limiter: RateLimiter) -> None:
+        await fn(client=client, limiter=limiter, config_path=_DAILY_YAML)
+
+    return _run
+
+
+# job.type -> job.job_id -> runner. Built once at import; _build_runner resolves each job with a lookup.
+_DISPATCH: dict[str, dict[str, _Runner]] = {
+    "static_bootstrap": {
+        "bootstrap_timezones": _run_bootstrap_timezones,
+        "bootstrap_countries": _run_bootstrap_countries,
+        "bootstrap_leagues": _run_bootstrap_leagues,
+        "bootstrap_teams": _run_bootstrap_teams,
+    },
+    "incremental_daily": {
+        "daily_fixtures_by_date": _run_daily_fixtures_by_date,
+        "daily_standings": _run_daily_standings,
+        "injuries_hourly": _daily_config_runner(run_injuries_hourly),
+        "fixture_details_recent_finalize": _daily_config_runner(run_fixture_details_recent_finalize),
+        "fixture_details_backfill_90d": _daily_config_runner(run_fixture_details_backfill_90d),
+        "fixture_details_backfill_season": _daily_config_runner(run_fixture_details_backfill_season),
+        "fixtures_backfill_league_season": _daily_config_runner(run_fixtures_backfill_league_season),
+        "standings_backfill_league_season": _daily_config_runner(run_standings_backfill_league_season),
+        "season_rollover_watch": _daily_config_runner(run_season_rollover_watch),
+        "stale_live_refresh": _daily_config_runner(run_stale_live_refresh),
+        "stale_scheduled_finalize": _daily_config_runner(run_stale_scheduled_finalize),
+        # DB-only job by default, but can optionally fetch from API if try_fetch_first=True
+        "auto_finish_stale_fixtures": _daily_config_runner(run_auto_finish_stale_fixtures),
+        # Refresh auto-finished matches flagged for verification when quota allows
+        "auto_finish_verification": _daily_config_runner(run_auto_finish_verification),
+        "top_scorers_daily": _daily_config_runner(run_top_scorers_daily),
+        "team_statistics_refresh": _daily_config_runner(run_team_statistics_refresh),
+    },
+}
 
 
 def _build_runner(
@@ -153,145 +269,23 @@ def _build_runner(
     limiter: RateLimiter,
 ) -> Callable[[], Awaitable[None]]:
     """
-    Map job configs to concrete job runner coroutines.
+    Map job configs to concrete job runner coroutines (see _DISPATCH).
 
     Supported:
     - static_bootstrap: bootstrap_timezones, bootstrap_countries, bootstrap_leagues, bootstrap_teams
     - incremental_daily: daily_fixtures_by_date, daily_standings, injuries_hourly, fixture_details_recent_finalize, fixture_details_backfill_90d,
       fixtures_backfill_league_season, standings_backfill_league_season
     """
+    by_id = _DISPATCH.get(job.type)
+    target = by_id.get(job.job_id) if by_id is not None else None
 
     async def _run() -> None:
         logger.info("job_started", job_id=job.job_id, type=job.type, endpoint=job.endpoint, ts_utc=_utc_now().isoformat())
-        if job.type == "static_bootstrap":
-            if job.job_id == "bootstrap_timezones":
-                await run_bootstrap_timezones(client=client, limiter=limiter)
-            elif job.job_id == "bootstrap_countries":
-                await run_bootstrap_countries(client=client, limiter=limiter)
-            elif job.job_id == "bootstrap_leagues":
-                season = _season(job)
-                tracked = _tracked_leagues(job)
-                if season is None or not tracked:
-                    raise ValueError("bootstrap_leagues requires params.season and filters.tracked_leagues")
-                await run_bootstrap_leagues(client=client, limiter=limiter, season=season, tracked_leagues=tracked)
-            elif job.job_id == "bootstrap_teams":
-                season = _season(job)
-                tracked = _tracked_leagues(job)
-                if season is None or not tracked:
-                    raise ValueError("bootstrap_teams requires params.season and mode.tracked_leagues")
-                await run_bootstrap_teams(client=client, limiter=limiter, season=season, tracked_leagues=tracked)
-            else:
-                raise ValueError(f"Unknown static_bootstrap job_id: {job.job_id}")
-
-        elif job.type == "incremental_daily":
-            if job.job_id == "daily_fixtures_by_date":
-                # Config prohibits assuming date in YAML; we compute UTC "today" at runtime.
-                date_utc = _utc_now().date().isoformat()
-                await run_daily_fixtures_by_date(
-                    target_date_utc=date_utc,
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "daily_standings":
-                max_leagues = None
-                try:
-                    v = (job.mode or {}).get("max_leagues_per_run")
-                    if v is not None and str(v).strip() != "":
-                        max_leagues = int(v)
-                except Exception:
-                    max_leagues = None
-                await run_daily_standings(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                    max_leagues_per_run=max_leagues,
-                )
-            elif job.job_id == "injuries_hourly":
-                await run_injuries_hourly(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "fixture_details_recent_finalize":
-                await run_fixture_details_recent_finalize(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "fixture_details_backfill_90d":
-                await run_fixture_details_backfill_90d(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "fixture_details_backfill_season":
-                await run_fixture_details_backfill_season(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "fixtures_backfill_league_season":
-                await run_fixtures_backfill_league_season(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "standings_backfill_league_season":
-                await run_standings_backfill_league_season(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "season_rollover_watch":
-                await run_season_rollover_watch(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "stale_live_refresh":
-                await run_stale_live_refresh(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "stale_scheduled_finalize":
-                await run_stale_scheduled_finalize(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "auto_finish_stale_fixtures":
-                # DB-only job by default, but can optionally fetch from API if try_fetch_first=True
-                await run_auto_finish_stale_fixtures(
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                    client=client,
-                    limiter=limiter,
-                )
-            elif job.job_id == "auto_finish_verification":
-                # Refresh auto-finished matches flagged for verification when quota allows
-                await run_auto_finish_verification(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "top_scorers_daily":
-                await run_top_scorers_daily(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            elif job.job_id == "team_statistics_refresh":
-                await run_team_statistics_refresh(
-                    client=client,
-                    limiter=limiter,
-                    config_path=_project_root() / "config" / "jobs" / "daily.yaml",
-                )
-            else:
-                raise ValueError(f"Unknown incremental_daily job_id: {job.job_id}")
-        else:
-            raise ValueError(f"Unsupported job type for scheduler: {job.type}")
-
+        if target is None:
+            if by_id is None:
+                raise ValueError(f"Unsupported job type for scheduler: {job.type}")
+            raise ValueError(f"Unknown {job.type} job_id: {job.job_id}")
+        await target(job, client, limiter)
         logger.info("job_complete", job_id=job.job_id, ts_utc=_utc_now().isoformat())
 
     return _run
@@ -331,8 +325,12 @@ async def amain() -> int:
             return
 
         try:
-            countries_cnt = int(await asyncio.to_thread(lambda: query_scalar("SELECT COUNT(*) FROM core.countries") or 0))
-            timezones_cnt = int(await asyncio.to_thread(lambda: query_scalar("SELECT COUNT(*) FROM core.timezones") or 0))
+            row = await asyncio.to_thread(
+                query_row,
+                "SELECT (SELECT COUNT(*) FROM core.countries), (SELECT COUNT(*) FROM core.timezones)",
+            )
+            countries_cnt = int((row or (0, 0))[0] or 0)
+            timezones_cnt = int((row or (0, 0))[1] or 0)
         except Exception as e:
             # If schemas aren't applied yet, later jobs will fail anyway; log but don't crash scheduler here.
             logger.warning("bootstrap_static_on_start_db_check_failed", err=str(e))
@@ -354,13 +352,14 @@ async def amain() -> int:
     await _maybe_bootstrap_countries_timezones_if_empty()
 
     # Load all enabled jobs (excluding live_loop which should run as a dedicated service).
-    jobs: list[Job] = []
-    for p in _job_files():
-        jobs.extend(_load_jobs_from_yaml(p))
+    # Parse job files off the event loop, concurrently.
+    job_files = _job_files()
+    results = await asyncio.gather(*[asyncio.to_thread(_load_jobs_from_yaml, p) for p in job_files])
+    jobs: list[Job] = [j for r in results for j in r]
 
     enabled = [j for j in jobs if j.enabled and j.type != "live_loop"]
     if not enabled:
-        logger.warning("no_enabled_jobs", job_files=[str(x) for x in _job_files()])
+        logger.warning("no_enabled_jobs", job_files=[str(x) for x in job_files])
 
     scheduler = AsyncIOScheduler(timezone=sched_tz)
 
@@ -402,17 +401,29 @@ async def amain() -> int:
         except NotImplementedError:
             signal.signal(sig, lambda *_: _stop())
 
+    async def _quota_watch() -> None:
+        # Emergency stop check: if quota already observed and too low, stop.
+        try:
+            _ = limiter.quota  # no-op, but keeps interface
+        except EmergencyStopError as e:
+            logger.error("emergency_stop_daily_quota_low", err=str(e))
+            stop_event.set()
+
+    # Runs on the scheduler itself so the main coroutine can idle on stop_event
+    # instead of waking every second.
+    scheduler.add_job(
+        _quota_watch,
+        trigger=IntervalTrigger(seconds=30, timezone=sched_tz),
+        id="__quota_watch__",
+        name="__quota_watch__",
+        max_instances=1,
+        coalesce=True,
+    )
+
     try:
         scheduler.start()
         logger.info("scheduler_started")
-        while not stop_event.is_set():
-            # Emergency stop check: if quota already observed and too low, stop.
-            try:
-                _ = limiter.quota  # no-op, but keeps interface
-            except EmergencyStopError as e:
-                logger.error("emergency_stop_daily_quota_low", err=str(e))
-                break
-            await asyncio.sleep(1.0)
+        await stop_event.wait()
     finally:
         try:
             scheduler.shutdown(wait=False)
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, NamedTuple
 
 try:
     # scripts/ context (adds /src to sys.path)
-    from utils.db import query_scalar  # type: ignore
+    from utils.config import _parse_yaml_file  # type: ignore
+    from utils.db import query_all, query_row_prepared, query_scalar, query_scalar_prepared  # type: ignore
 except ImportError:  # pragma: no cover
     # src/ package context
-    from src.utils.db import query_scalar  # type: ignore
+    from src.utils.config import _parse_yaml_file  # type: ignore
+    from src.utils.db import query_all, query_row_prepared, query_scalar, query_scalar_prepared  # type: ignore
+
+
+# League names rarely change; cache per process with a short TTL so renames still show up.
+_LEAGUE_NAME_TTL_SECONDS = 600.0
+_LEAGUE_NAMES: dict[int, tuple[float, str | None]] = {}
+
+
+def _as_utc(v: Any) -> datetime | None:
+    # psycopg2 returns datetime already
+    if isinstance(v, datetime):
+        if v.tzinfo is None:
+            return v.replace(tzinfo=timezone.utc)
+        return v.astimezone(timezone.utc)
+    return None
+
+
+def _iso_z(v: datetime | None) -> str | None:
+    # Inputs are already UTC (see _as_utc): format once with a literal Z instead of isoformat() + replace().
+    return v.strftime("%Y-%m-%dT%H:%M:%S.%fZ") if v is not None else None
 
 
 @dataclass(frozen=True)
@@ -24,198 +45,278 @@ class CoverageConfig:
     fixtures_freshness: dict[str, Any]
 
 
+@dataclass(frozen=True, slots=True)
+class CoverageResult:
+    """Coverage for one league+season+endpoint (one mart.coverage_status row); to_dict() is the mart/JSON boundary."""
+
+    league_id: int
+    league_name: str | None
+    season: int
+    endpoint: str
+    expected_count: int | None
+    actual_count: int
+    count_coverage: float | None
+    last_update: str | None
+    lag_minutes: int
+    freshness_coverage: float
+    raw_count: int
+    core_count: int
+    pipeline_coverage: float
+    overall_coverage: float
+    flags: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_coverage_config(path_str: str, mtime_ns: int) -> CoverageConfig:
+    """
+    Parse coverage.yaml into a CoverageConfig.
+    Cached per (path, mtime_ns): new calculators reuse the frozen config until the file changes.
+    """
+    cfg = _parse_yaml_file(Path(path_str))
+
+    expected_raw = cfg.get("expected_fixtures") or {}
+    expected: dict[int, int] = {}
+    for k, v in expected_raw.items():
+        try:
+            expected[int(k)] = int(v)
+        except Exception:
+            continue
+
+    max_lag = cfg.get("max_lag_minutes") or {}
+    weights = cfg.get("weights") or {}
+    fixtures_freshness = cfg.get("fixtures_freshness") or {}
+
+    return CoverageConfig(
+        expected_fixtures=expected,
+        max_lag_minutes_daily=int(max_lag.get("daily", 1440)),
+        max_lag_minutes_live=int(max_lag.get("live", 5)),
+        weights={
+            "count_coverage": float(weights.get("count_coverage", 0.5)),
+            "freshness_coverage": float(weights.get("freshness_coverage", 0.3)),
+            "pipeline_coverage": float(weights.get("pipeline_coverage", 0.2)),
+        },
+        fixtures_freshness={
+            "ignore_lag_when_no_matches_scheduled": bool(
+                fixtures_freshness.get("ignore_lag_when_no_matches_scheduled", True)
+            ),
+            "schedule_lookback_days": int(fixtures_freshness.get("schedule_lookback_days", 7)),
+            "schedule_lookahead_days": int(fixtures_freshness.get("schedule_lookahead_days", 7)),
+        },
+    )
+
+
+class _CoverageScoring(NamedTuple):
+    """Loop-invariant scoring inputs, derived once per CoverageConfig."""
+
+    max_lag: int
+    # 100 / max_lag (0.0 when max_lag <= 0): freshness is one multiply + clamp.
+    fresh_per_lag_minute: float
+    w_count: float
+    w_fresh: float
+    w_pipe: float
+    # Renormalization denominator when expected_count is unknown.
+    w_fresh_pipe: float
+    lookback_days: int
+    lookahead_days: int
+    ignore_lag: bool
+
+
+def _coverage_scoring(cfg: CoverageConfig) -> _CoverageScoring:
+    w = cfg.weights
+    ff = cfg.fixtures_freshness
+    w_fresh = float(w["freshness_coverage"])
+    w_pipe = float(w["pipeline_coverage"])
+    max_lag = int(cfg.max_lag_minutes_daily)
+    return _CoverageScoring(
+        max_lag=max_lag,
+        fresh_per_lag_minute=(100.0 / max_lag) if max_lag > 0 else 0.0,
+        w_count=float(w["count_coverage"]),
+        w_fresh=w_fresh,
+        w_pipe=w_pipe,
+        w_fresh_pipe=(w_fresh + w_pipe) or 1.0,
+        lookback_days=int(ff.get("schedule_lookback_days", 7)),
+        lookahead_days=int(ff.get("schedule_lookahead_days", 7)),
+        ignore_lag=bool(ff.get("ignore_lag_when_no_matches_scheduled", True)),
+    )
+
+
 class CoverageCalculator:
     def __init__(self, config_path: str | Path = "config/coverage.yaml") -> None:
-        p = Path(config_path)
-        cfg = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
-
-        expected_raw = cfg.get("expected_fixtures") or {}
-        expected: dict[int, int] = {}
-        for k, v in expected_raw.items():
-            try:
-                expected[int(k)] = int(v)
-            except Exception:
-                continue
-
-        max_lag = cfg.get("max_lag_minutes") or {}
-        weights = cfg.get("weights") or {}
-        fixtures_freshness = cfg.get("fixtures_freshness") or {}
-
-        self.config = CoverageConfig(
-            expected_fixtures=expected,
-            max_lag_minutes_daily=int(max_lag.get("daily", 1440)),
-            max_lag_minutes_live=int(max_lag.get("live", 5)),
-            weights={
-                "count_coverage": float(weights.get("count_coverage", 0.5)),
-                "freshness_coverage": float(weights.get("freshness_coverage", 0.3)),
-                "pipeline_coverage": float(weights.get("pipeline_coverage", 0.2)),
-            },
-            fixtures_freshness={
-                "ignore_lag_when_no_matches_scheduled": bool(
-                    fixtures_freshness.get("ignore_lag_when_no_matches_scheduled", True)
-                ),
-                "schedule_lookback_days": int(fixtures_freshness.get("schedule_lookback_days", 7)),
-                "schedule_lookahead_days": int(fixtures_freshness.get("schedule_lookahead_days", 7)),
-            },
+        p = Path(config_path).resolve()
+        self.config = _load_coverage_config(str(p), p.stat().st_mtime_ns)
+        self._scoring = _coverage_scoring(self.config)
+
+    def _freshness_coverage(self, lag_minutes: int) -> float:
+        sc = self._scoring
+        if sc.max_lag <= 0:
+            return 0.0
+        freshness_cov = 100.0 - lag_minutes * sc.fresh_per_lag_minute
+        if freshness_cov < 0.0:
+            freshness_cov = 0.0
+        return freshness_cov
+
+    def calculate_fixtures_coverage(self, league_id: int, season: int) -> CoverageResult:
+        # Single cast at the boundary; everything below works on ints.
+        league_id, season = int(league_id), int(season)
+        actual, last_update, raw_count, league_name, scheduled_in_window = self._query_coverage_row(
+            league_id, season
+        )
+        return self._fixtures_coverage_from_inputs(
+            league_id=league_id,
+            season=season,
+            actual=actual,
+            last_update=last_update,
+            raw_count=raw_count,
+            league_name=league_name,
+            scheduled_in_window=scheduled_in_window,
         )
 
-    def calculate_fixtures_coverage(self, league_id: int, season: int) -> dict[str, Any]:
-        league_id_i = int(league_id)
-        expected_cfg = self.config.expected_fixtures
-        expected_known = league_id_i in expected_cfg and int(expected_cfg.get(league_id_i) or 0) > 0
-        expected = int(expected_cfg.get(league_id_i, 0))
-        actual = int(self._query_actual_fixtures(league_id, season) or 0)
+    def calculate_all(self, leagues: list[tuple[int, int]], *, preaggregated: bool = False) -> list[CoverageResult]:
+        """
+        /fixtures coverage for many (league_id, season) pairs in one DB round-trip.
+        Returns one result per distinct pair (input order), same shape as calculate_fixtures_coverage().
+
+        preaggregated=True reads fixture counts/last update from mart.fixtures_league_counts;
+        only use it right after that view was refreshed (daily_sync does).
+        """
+        pairs = list(dict.fromkeys((int(lid), int(season)) for lid, season in leagues))
+        if not pairs:
+            return []
+        inputs = self._query_coverage_rows(pairs, preaggregated=preaggregated)
+        out: list[CoverageResult] = []
+        for lid, season in pairs:
+            actual, last_update, raw_count, league_name, scheduled_in_window, lag_minutes = inputs.get(
+                (lid, season), (0, None, 0, None, 0, 9999)
+            )
+            out.append(
+                self._fixtures_coverage_from_inputs(
+                    league_id=lid,
+                    season=season,
+                    actual=actual,
+                    last_update=last_update,
+                    raw_count=raw_count,
+                    league_name=league_name,
+                    scheduled_in_window=scheduled_in_window,
+                    lag_minutes=lag_minutes,
+                )
+            )
+        return out
+
+    def _fixtures_coverage_from_inputs(
+        self,
+        *,
+        league_id: int,
+        season: int,
+        actual: int,
+        last_update: datetime | None,
+        raw_count: int,
+        league_name: str | None,
+        scheduled_in_window: int | None,
+        lag_minutes: int | None = None,
+    ) -> CoverageResult:
+        # expected_fixtures is int -> int (normalized when the config is loaded).
+        expected = self.config.expected_fixtures.get(league_id, 0)
+        expected_known = expected > 0
 
         count_cov: float | None = (actual / expected * 100.0) if expected_known else None
 
-        last_update = self._query_last_update(league_id, season)
-        lag_minutes = self._calculate_lag_minutes(last_update)
+        if lag_minutes is None:
+            lag_minutes = self._calculate_lag_minutes(last_update)
 
-        max_lag = int(self.config.max_lag_minutes_daily)
-        freshness_cov = max(0.0, 100.0 - (lag_minutes / max_lag * 100.0)) if max_lag > 0 else 0.0
+        sc = self._scoring
+        freshness_cov = self._freshness_coverage(lag_minutes)
 
         # Off-season / break handling:
         # If we already have fixtures for this league+season (actual_count > 0) but there are no fixtures
         # scheduled in a lookback/lookahead window, treat the league as "no_matches_scheduled" and avoid
         # penalizing freshness_coverage due to a lack of updates.
-        ff = self.config.fixtures_freshness
-        lookback_days = int(ff.get("schedule_lookback_days", 7))
-        lookahead_days = int(ff.get("schedule_lookahead_days", 7))
-        ignore_lag = bool(ff.get("ignore_lag_when_no_matches_scheduled", True))
-
-        scheduled_in_window = None
         no_matches_scheduled = False
-        try:
-            scheduled_in_window = int(
-                self._query_scheduled_fixtures_in_window(
-                    league_id=league_id, season=season, lookback_days=lookback_days, lookahead_days=lookahead_days
-                )
-                or 0
-            )
-            if actual > 0 and scheduled_in_window == 0:
-                no_matches_scheduled = True
-                if ignore_lag:
-                    # Keep last_update as evidence, but do not penalize freshness for known quiet periods.
-                    freshness_cov = 100.0
-                    lag_minutes = 0
-        except Exception:
-            # Best-effort: never fail coverage calculation due to schedule window query.
-            scheduled_in_window = None
+        if scheduled_in_window is not None and actual > 0 and scheduled_in_window == 0:
+            no_matches_scheduled = True
+            if sc.ignore_lag:
+                # Keep last_update as evidence, but do not penalize freshness for known quiet periods.
+                freshness_cov = 100.0
+                lag_minutes = 0
 
-        raw_count = int(self._query_raw_count_24h(league_id, season) or 0)
         # Pipeline coverage for /fixtures:
         # - "raw_count" is a proxy for whether the fixtures ingestion pipeline is active in the last 24h.
         # - ratio actual/raw_count can exceed 100 (actual = fixtures rows; raw_count = request count), so cap to 100.
         pipeline_cov = min(100.0, (actual / raw_count * 100.0)) if raw_count > 0 else 0.0
 
-        w = self.config.weights
-        w_count = float(w["count_coverage"])
-        w_fresh = float(w["freshness_coverage"])
-        w_pipe = float(w["pipeline_coverage"])
         if expected_known and count_cov is not None:
-            overall = count_cov * w_count + freshness_cov * w_fresh + pipeline_cov * w_pipe
+            overall = count_cov * sc.w_count + freshness_cov * sc.w_fresh + pipeline_cov * sc.w_pipe
         else:
             # If expected fixture count isn't configured, don't punish leagues with a bogus 0% count_coverage.
             # Instead, compute overall from freshness + pipeline only (renormalized to 0..100).
-            denom = (w_fresh + w_pipe) or 1.0
-            overall = (freshness_cov * w_fresh + pipeline_cov * w_pipe) / denom
-
-        league_name = self._query_league_name(league_id)
-        last_update_iso = last_update.isoformat().replace("+00:00", "Z") if last_update else None
-
-        return {
-            "league_id": league_id_i,
-            "league_name": league_name,
-            "season": int(season),
-            "endpoint": "/fixtures",
-            "expected_count": (expected if expected_known else None),
-            "actual_count": actual,
-            "count_coverage": (round(float(count_cov), 2) if count_cov is not None else None),
-            "last_update": last_update_iso,
-            "lag_minutes": int(lag_minutes),
-            "freshness_coverage": round(freshness_cov, 2),
-            "raw_count": raw_count,
-            "core_count": actual,
-            "pipeline_coverage": round(pipeline_cov, 2),
-            "overall_coverage": round(overall, 2),
-            "flags": {
+            overall = (freshness_cov * sc.w_fresh + pipeline_cov * sc.w_pipe) / sc.w_fresh_pipe
+
+        last_update_iso = _iso_z(last_update)
+
+        return CoverageResult(
+            league_id=league_id,
+            league_name=league_name,
+            season=season,
+            endpoint="/fixtures",
+            expected_count=(expected if expected_known else None),
+            actual_count=actual,
+            count_coverage=(round(count_cov, 2) if count_cov is not None else None),
+            last_update=last_update_iso,
+            lag_minutes=lag_minutes,
+            freshness_coverage=round(freshness_cov, 2),
+            raw_count=raw_count,
+            core_count=actual,
+            pipeline_coverage=round(pipeline_cov, 2),
+            overall_coverage=round(overall, 2),
+            flags={
                 "no_matches_scheduled": bool(no_matches_scheduled),
                 "scheduled_fixtures_in_window": scheduled_in_window,
-                "schedule_window_days": {"lookback": int(lookback_days), "lookahead": int(lookahead_days)},
-                "ignore_lag_when_no_matches_scheduled": bool(ignore_lag),
+                "schedule_window_days": {"lookback": sc.lookback_days, "lookahead": sc.lookahead_days},
+                "ignore_lag_when_no_matches_scheduled": sc.ignore_lag,
             },
-        }
+        )
 
-    def calculate_injuries_coverage(self, league_id: int, season: int) -> dict[str, Any]:
+    def calculate_injuries_coverage(self, league_id: int, season: int) -> CoverageResult:
         """
         Coverage for /injuries (current-only):
         - expected_count = 1 (we only need "present + fresh")
         - actual_count = 1 if we have any injuries rows for league+season, else 0
         """
-        core_total = int(
-            query_scalar(
-                "SELECT COUNT(*) FROM core.injuries WHERE league_id = %s AND season = %s",
-                (int(league_id), int(season)),
-            )
-            or 0
-        )
+        core_total, last_update, raw_count, league_name = self._query_injuries_coverage_row(league_id, season)
         actual = 1 if core_total > 0 else 0
         expected = 1
         count_cov = 100.0 if actual >= expected else 0.0
 
-        last_update = self._query_last_update_generic(
-            table="core.injuries",
-            where="league_id = %s AND season = %s",
-            params=(int(league_id), int(season)),
-        )
         lag_minutes = self._calculate_lag_minutes(last_update)
-        max_lag = int(self.config.max_lag_minutes_daily)
-        freshness_cov = max(0.0, 100.0 - (lag_minutes / max_lag * 100.0)) if max_lag > 0 else 0.0
-
-        raw_count = int(
-            query_scalar(
-                """
-                SELECT COUNT(*)
-                FROM raw.api_responses
-                WHERE endpoint = '/injuries'
-                  AND fetched_at > NOW() - INTERVAL '24 hours'
-                  AND requested_params->>'league' = %s
-                  AND requested_params->>'season' = %s
-                """,
-                (str(int(league_id)), str(int(season))),
-            )
-            or 0
-        )
+        freshness_cov = self._freshness_coverage(lag_minutes)
 
         # For injuries, "pipeline" is best represented as freshness/presence (counts aren't comparable to RAW envelopes).
         pipeline_cov = 100.0 if raw_count > 0 and core_total >= 0 else 0.0
 
-        w = self.config.weights
-        overall = (
-            count_cov * float(w["count_coverage"])
-            + freshness_cov * float(w["freshness_coverage"])
-            + pipeline_cov * float(w["pipeline_coverage"])
+        sc = self._scoring
+        overall = count_cov * sc.w_count + freshness_cov * sc.w_fresh + pipeline_cov * sc.w_pipe
+
+        last_update_iso = _iso_z(last_update)
+        return CoverageResult(
+            league_id=int(league_id),
+            league_name=league_name,
+            season=int(season),
+            endpoint="/injuries",
+            expected_count=expected,
+            actual_count=actual,
+            count_coverage=round(count_cov, 2),
+            last_update=last_update_iso,
+            lag_minutes=int(lag_minutes),
+            freshness_coverage=round(freshness_cov, 2),
+            raw_count=raw_count,
+            core_count=core_total,
+            pipeline_coverage=round(pipeline_cov, 2),
+            overall_coverage=round(overall, 2),
         )
 
-        last_update_iso = last_update.isoformat().replace("+00:00", "Z") if last_update else None
-        return {
-            "league_id": int(league_id),
-            "league_name": self._query_league_name(league_id),
-            "season": int(season),
-            "endpoint": "/injuries",
-            "expected_count": expected,
-            "actual_count": actual,
-            "count_coverage": round(count_cov, 2),
-            "last_update": last_update_iso,
-            "lag_minutes": int(lag_minutes),
-            "freshness_coverage": round(freshness_cov, 2),
-            "raw_count": raw_count,
-            "core_count": core_total,
-            "pipeline_coverage": round(pipeline_cov, 2),
-            "overall_coverage": round(overall, 2),
-        }
-
-    def calculate_top_scorers_coverage(self, league_id: int, season: int) -> dict[str, Any]:
+    def calculate_top_scorers_coverage(self, league_id: int, season: int) -> CoverageResult:
         """
         Coverage for /players/topscorers (leaderboard, league+season):
         - expected_count = 1 (we only need "present + fresh")
@@ -238,8 +339,7 @@ class CoverageCalculator:
             params=(int(league_id), int(season)),
         )
         lag_minutes = self._calculate_lag_minutes(last_update)
-        max_lag = int(self.config.max_lag_minutes_daily)
-        freshness_cov = max(0.0, 100.0 - (lag_minutes / max_lag * 100.0)) if max_lag > 0 else 0.0
+        freshness_cov = self._freshness_coverage(lag_minutes)
 
         raw_count = int(
             query_scalar(
@@ -248,42 +348,37 @@ class CoverageCalculator:
                 FROM raw.api_responses
                 WHERE endpoint = '/players/topscorers'
                   AND fetched_at > NOW() - INTERVAL '24 hours'
-                  AND requested_params->>'league' = %s
-                  AND requested_params->>'season' = %s
+                  AND requested_params @> jsonb_build_object('league', %s::bigint, 'season', %s::int)
                 """,
-                (str(int(league_id)), str(int(season))),
+                (int(league_id), int(season)),
             )
             or 0
         )
 
         pipeline_cov = 100.0 if raw_count > 0 and core_total >= 0 else 0.0
 
-        w = self.config.weights
-        overall = (
-            count_cov * float(w["count_coverage"])
-            + freshness_cov * float(w["freshness_coverage"])
-            + pipeline_cov * float(w["pipeline_coverage"])
+        sc = self._scoring
+        overall = count_cov * sc.w_count + freshness_cov * sc.w_fresh + pipeline_cov * sc.w_pipe
+
+        last_update_iso = _iso_z(last_update)
+        return CoverageResult(
+            league_id=int(league_id),
+            league_name=self._query_league_name(league_id),
+            season=int(season),
+            endpoint="/players/topscorers",
+            expected_count=expected,
+            actual_count=actual,
+            count_coverage=round(count_cov, 2),
+            last_update=last_update_iso,
+            lag_minutes=int(lag_minutes),
+            freshness_coverage=round(freshness_cov, 2),
+            raw_count=raw_count,
+            core_count=core_total,
+            pipeline_coverage=round(pipeline_cov, 2),
+            overall_coverage=round(overall, 2),
         )
 
-        last_update_iso = last_update.isoformat().replace("+00:00", "Z") if last_update else None
-        return {
-            "league_id": int(league_id),
-            "league_name": self._query_league_name(league_id),
-            "season": int(season),
-            "endpoint": "/players/topscorers",
-            "expected_count": expected,
-            "actual_count": actual,
-            "count_coverage": round(count_cov, 2),
-            "last_update": last_update_iso,
-            "lag_minutes": int(lag_minutes),
-            "freshness_coverage": round(freshness_cov, 2),
-            "raw_count": raw_count,
-            "core_count": core_total,
-            "pipeline_coverage": round(pipeline_cov, 2),
-            "overall_coverage": round(overall, 2),
-        }
-
-    def calculate_team_statistics_coverage(self, league_id: int, season: int) -> dict[str, Any]:
+    def calculate_team_statistics_coverage(self, league_id: int, season: int) -> CoverageResult:
         """
         Coverage for /teams/statistics (team-level season profile):
         - expected_count = number of teams discovered for league+season (progress table)
@@ -321,8 +416,7 @@ class CoverageCalculator:
             params=(int(league_id), int(season)),
         )
         lag_minutes = self._calculate_lag_minutes(last_update)
-        max_lag = int(self.config.max_lag_minutes_daily)
-        freshness_cov = max(0.0, 100.0 - (lag_minutes / max_lag * 100.0)) if max_lag > 0 else 0.0
+        freshness_cov = self._freshness_coverage(lag_minutes)
 
         raw_count = int(
             query_scalar(
@@ -331,41 +425,36 @@ class CoverageCalculator:
                 FROM raw.api_responses
                 WHERE endpoint = '/teams/statistics'
                   AND fetched_at > NOW() - INTERVAL '24 hours'
-                  AND requested_params->>'league' = %s
-                  AND requested_params->>'season' = %s
+                  AND requested_params @> jsonb_build_object('league', %s::bigint, 'season', %s::int)
                 """,
-                (str(int(league_id)), str(int(season))),
+                (int(league_id), int(season)),
             )
             or 0
         )
 
         pipeline_cov = min(100.0, (actual / expected * 100.0)) if expected > 0 else 0.0
 
-        w = self.config.weights
-        overall = (
-            count_cov * float(w["count_coverage"])
-            + freshness_cov * float(w["freshness_coverage"])
-            + pipeline_cov * float(w["pipeline_coverage"])
+        sc = self._scoring
+        overall = count_cov * sc.w_count + freshness_cov * sc.w_fresh + pipeline_cov * sc.w_pipe
+
+        last_update_iso = _iso_z(last_update)
+        return CoverageResult(
+            league_id=int(league_id),
+            league_name=self._query_league_name(league_id),
+            season=int(season),
+            endpoint="/teams/statistics",
+            expected_count=expected,
+            actual_count=actual,
+            count_coverage=round(float(count_cov), 2),
+            last_update=last_update_iso,
+            lag_minutes=int(lag_minutes),
+            freshness_coverage=round(freshness_cov, 2),
+            raw_count=raw_count,
+            core_count=actual,
+            pipeline_coverage=round(float(pipeline_cov), 2),
+            overall_coverage=round(float(overall), 2),
         )
 
-        last_update_iso = last_update.isoformat().replace("+00:00", "Z") if last_update else None
-        return {
-            "league_id": int(league_id),
-            "league_name": self._query_league_name(league_id),
-            "season": int(season),
-            "endpoint": "/teams/statistics",
-            "expected_count": expected,
-            "actual_count": actual,
-            "count_coverage": round(float(count_cov), 2),
-            "last_update": last_update_iso,
-            "lag_minutes": int(lag_minutes),
-            "freshness_coverage": round(freshness_cov, 2),
-            "raw_count": raw_count,
-            "core_count": actual,
-            "pipeline_coverage": round(float(pipeline_cov), 2),
-            "overall_coverage": round(float(overall), 2),
-        }
-
     def calculate_fixture_endpoint_coverage(
         self,
         *,
@@ -374,209 +463,286 @@ class CoverageCalculator:
         endpoint: str,
         core_table: str,
         days: int = 90,
-    ) -> dict[str, Any]:
+    ) -> CoverageResult:
         """
         Coverage for per-fixture endpoints (players/events/statistics/lineups) over a rolling window.
         - expected_count = completed fixtures in last N days
         - actual_count   = distinct fixtures with RAW call for endpoint in last N days
         - pipeline_cov   = distinct fixtures with CORE rows / distinct fixtures with RAW call
         """
-        expected = int(
-            query_scalar(
-                """
-                SELECT COUNT(*)
-                FROM core.fixtures
-                WHERE league_id = %s AND season = %s
-                  AND date >= NOW() - (%s::text || ' days')::interval
-                  AND status_short = ANY(ARRAY['FT','AET','PEN'])
-                """,
-                (int(league_id), int(season), int(days)),
-            )
-            or 0
-        )
-
-        raw_fixtures = int(
-            query_scalar(
-                """
-                SELECT COUNT(DISTINCT f.id)
-                FROM raw.api_responses r
-                JOIN core.fixtures f ON f.id = (r.requested_params->>'fixture')::bigint
-                WHERE r.endpoint = %s
-                  AND f.league_id = %s
-                  AND f.season = %s
-                  AND f.date >= NOW() - (%s::text || ' days')::interval
-                  AND f.status_short = ANY(ARRAY['FT','AET','PEN'])
-                """,
-                (str(endpoint), int(league_id), int(season), int(days)),
-            )
-            or 0
-        )
-
-        core_fixtures = int(
-            query_scalar(
-                f"""
-                SELECT COUNT(DISTINCT t.fixture_id)
-                FROM {core_table} t
-                JOIN core.fixtures f ON f.id = t.fixture_id
-                WHERE f.league_id = %s
-                  AND f.season = %s
-                  AND f.date >= NOW() - (%s::text || ' days')::interval
-                  AND f.status_short = ANY(ARRAY['FT','AET','PEN'])
-                """,
-                (int(league_id), int(season), int(days)),
-            )
-            or 0
+        (
+            expected,
+            raw_fixtures,
+            core_fixtures,
+            last_update,
+            raw_count_24h,
+            league_name,
+        ) = self._query_fixture_endpoint_coverage_row(
+            league_id=league_id, season=season, endpoint=endpoint, core_table=core_table, days=days
         )
 
         count_cov = (raw_fixtures / expected * 100.0) if expected > 0 else 0.0
 
-        last_update = self._query_last_raw_endpoint_update_joined(endpoint=endpoint, league_id=league_id, season=season)
         lag_minutes = self._calculate_lag_minutes(last_update)
-        max_lag = int(self.config.max_lag_minutes_daily)
-        freshness_cov = max(0.0, 100.0 - (lag_minutes / max_lag * 100.0)) if max_lag > 0 else 0.0
-
-        raw_count_24h = int(
-            query_scalar(
-                """
-                SELECT COUNT(*)
-                FROM raw.api_responses r
-                JOIN core.fixtures f ON f.id = (r.requested_params->>'fixture')::bigint
-                WHERE r.endpoint = %s
-                  AND r.fetched_at > NOW() - INTERVAL '24 hours'
-                  AND f.league_id = %s
-                  AND f.season = %s
-                """,
-                (str(endpoint), int(league_id), int(season)),
-            )
-            or 0
-        )
+        freshness_cov = self._freshness_coverage(lag_minutes)
 
         pipeline_cov = (core_fixtures / raw_fixtures * 100.0) if raw_fixtures > 0 else 0.0
 
-        w = self.config.weights
-        overall = (
-            count_cov * float(w["count_coverage"])
-            + freshness_cov * float(w["freshness_coverage"])
-            + pipeline_cov * float(w["pipeline_coverage"])
+        sc = self._scoring
+        overall = count_cov * sc.w_count + freshness_cov * sc.w_fresh + pipeline_cov * sc.w_pipe
+
+        last_update_iso = _iso_z(last_update)
+        return CoverageResult(
+            league_id=int(league_id),
+            league_name=league_name,
+            season=int(season),
+            endpoint=str(endpoint),
+            expected_count=expected,
+            actual_count=raw_fixtures,
+            count_coverage=round(count_cov, 2),
+            last_update=last_update_iso,
+            lag_minutes=int(lag_minutes),
+            freshness_coverage=round(freshness_cov, 2),
+            raw_count=raw_count_24h,
+            core_count=core_fixtures,
+            pipeline_coverage=round(pipeline_cov, 2),
+            overall_coverage=round(overall, 2),
         )
 
-        last_update_iso = last_update.isoformat().replace("+00:00", "Z") if last_update else None
-        return {
-            "league_id": int(league_id),
-            "league_name": self._query_league_name(league_id),
-            "season": int(season),
-            "endpoint": str(endpoint),
-            "expected_count": expected,
-            "actual_count": raw_fixtures,
-            "count_coverage": round(count_cov, 2),
-            "last_update": last_update_iso,
-            "lag_minutes": int(lag_minutes),
-            "freshness_coverage": round(freshness_cov, 2),
-            "raw_count": raw_count_24h,
-            "core_count": core_fixtures,
-            "pipeline_coverage": round(pipeline_cov, 2),
-            "overall_coverage": round(overall, 2),
-        }
-
-    def _query_actual_fixtures(self, league_id: int, season: int) -> int:
-        return int(
-            query_scalar(
-                "SELECT COUNT(*) FROM core.fixtures WHERE league_id = %s AND season = %s",
-                (int(league_id), int(season)),
+    def _query_coverage_row(self, league_id: int, season: int) -> tuple[int, datetime | None, int, str | None, int]:
+        """
+        One round-trip for the /fixtures coverage inputs:
+        (actual fixtures, last fixtures update, RAW /fixtures requests in 24h, league name, fixtures in schedule window).
+        The schedule-window count is a FILTER over the same league+season scan as the totals.
+        """
+        sc = self._scoring
+        row = query_row_prepared(
+            "cov_fixtures_row",
+            """
+            WITH actual AS (
+              SELECT COUNT(*) AS c,
+                     MAX(updated_at) AS u,
+                     COUNT(*) FILTER (
+                       WHERE date >= (NOW() AT TIME ZONE 'UTC') - ($3::int::text || ' days')::interval
+                         AND date <= (NOW() AT TIME ZONE 'UTC') + ($4::int::text || ' days')::interval
+                     ) AS scheduled
+              FROM core.fixtures
+              WHERE league_id = $1::bigint AND season = $2::int
+            ),
+            raw AS (
+              SELECT COUNT(*) AS c
+              FROM raw.api_responses
+              WHERE endpoint = '/fixtures'
+                AND fetched_at > NOW() - INTERVAL '24 hours'
+                AND (
+                  -- Per-league requests (league+season)
+                  requested_params @> jsonb_build_object('league', $1::bigint, 'season', $2::int)
+                  -- Or date-based daily sync (global_by_date/per-league-by-date); indicates pipeline activity
+                  OR (requested_params ? 'date')
+                )
             )
-            or 0
+            SELECT actual.c, actual.u, raw.c, (SELECT name FROM core.leagues WHERE id = $1::bigint), actual.scheduled
+            FROM actual, raw
+            """,
+            (league_id, season, max(0, sc.lookback_days), max(0, sc.lookahead_days)),
         )
-
-    def _query_last_update(self, league_id: int, season: int) -> datetime | None:
-        v = query_scalar(
-            "SELECT MAX(updated_at) FROM core.fixtures WHERE league_id = %s AND season = %s",
-            (int(league_id), int(season)),
+        if not row:
+            return 0, None, 0, None, 0
+        # COUNT(*) over the single-row CTEs is never NULL.
+        actual, last_update, raw_count, league_name, scheduled_in_window = row
+        return actual, _as_utc(last_update), raw_count, league_name, scheduled_in_window
+
+    def _query_coverage_rows(
+        self, pairs: list[tuple[int, int]], *, preaggregated: bool = False
+    ) -> dict[tuple[int, int], tuple[int, datetime | None, int, str | None, int, int]]:
+        """
+        Batched _query_coverage_row (plus the schedule-window count) for many league/season pairs:
+        {(league_id, season): (actual, last_update, raw_count_24h, league_name, scheduled_in_window, lag_minutes)}.
+        lag_minutes is computed by Postgres against one NOW() for the whole batch (9999 without updates).
+        """
+        lookback = max(0, self._scoring.lookback_days)
+        lookahead = max(0, self._scoring.lookahead_days)
+        values_sql = ", ".join(["(%s::bigint, %s::int)"] * len(pairs))
+        params: list[Any] = [v for pair in pairs for v in pair]
+        if preaggregated:
+            # Season totals come from the mart view; only the (date-indexed) window is scanned live.
+            fx_sql = """
+            fx AS (
+              SELECT p.league_id, p.season,
+                     m.actual AS c,
+                     m.last_update AS u,
+                     (
+                       SELECT COUNT(*)
+                       FROM core.fixtures f
+                       WHERE f.league_id = p.league_id AND f.season = p.season
+                         AND f.date >= (NOW() AT TIME ZONE 'UTC') - (%s::text || ' days')::interval
+                         AND f.date <= (NOW() AT TIME ZONE 'UTC') + (%s::text || ' days')::interval
+                     ) AS scheduled
+              FROM pairs p
+              JOIN mart.fixtures_league_counts m ON m.league_id = p.league_id AND m.season = p.season
+            ),"""
+        else:
+            fx_sql = """
+            fx AS (
+              SELECT f.league_id, f.season,
+                     COUNT(*) AS c,
+                     MAX(f.updated_at) AS u,
+                     COUNT(*) FILTER (
+                       WHERE f.date >= (NOW() AT TIME ZONE 'UTC') - (%s::text || ' days')::interval
+                         AND f.date <= (NOW() AT TIME ZONE 'UTC') + (%s::text || ' days')::interval
+                     ) AS scheduled
+              FROM core.fixtures f
+              JOIN pairs p ON p.league_id = f.league_id AND p.season = f.season
+              GROUP BY f.league_id, f.season
+            ),"""
+        rows = query_all(
+            f"""
+            WITH pairs(league_id, season) AS (
+              VALUES {values_sql}
+            ),{fx_sql}
+            raw_recent AS (
+              SELECT requested_params
+              FROM raw.api_responses
+              WHERE endpoint = '/fixtures'
+                AND fetched_at > NOW() - INTERVAL '24 hours'
+            ),
+            raw_by_league AS (
+              -- Per-league requests (league+season); date-based rows are counted once below.
+              -- Same containment match as the single-league query; only requested pairs are grouped.
+              SELECT p.league_id, p.season, COUNT(*) AS c
+              FROM raw_recent r
+              JOIN pairs p
+                ON r.requested_params @> jsonb_build_object('league', p.league_id, 'season', p.season)
+              WHERE NOT (r.requested_params ? 'date')
+              GROUP BY p.league_id, p.season
+            ),
+            raw_by_date AS (
+              -- Date-based daily sync (global_by_date/per-league-by-date); indicates pipeline activity
+              SELECT COUNT(*) AS c FROM raw_recent WHERE requested_params ? 'date'
+            )
+            SELECT p.league_id, p.season,
+                   COALESCE(fx.c, 0), fx.u,
+                   COALESCE(rl.c, 0) + rd.c,
+                   l.name,
+                   COALESCE(fx.scheduled, 0),
+                   COALESCE(TRUNC(EXTRACT(EPOCH FROM (NOW() - fx.u)) / 60), 9999)::int
+            FROM pairs p
+            LEFT JOIN fx ON fx.league_id = p.league_id AND fx.season = p.season
+            LEFT JOIN raw_by_league rl ON rl.league_id = p.league_id AND rl.season = p.season
+            CROSS JOIN raw_by_date rd
+            LEFT JOIN core.leagues l ON l.id = p.league_id
+            """,
+            tuple(params) + (lookback, lookahead),
         )
-        # psycopg2 returns datetime already
-        if isinstance(v, datetime):
-            if v.tzinfo is None:
-                return v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc)
-        return None
+        # The batch already joined core.leagues: warm the name cache used by the per-endpoint calculators.
+        now = time.monotonic()
+        for lid, _season, *_counts, league_name, _scheduled, _lag in rows:
+            _LEAGUE_NAMES[lid] = (now, league_name)
+        # Counts are COALESCEd in SQL and pairs are typed in VALUES: rows already hold ints.
+        return {
+            (lid, season): (actual, _as_utc(last_update), raw_count, league_name, scheduled, lag)
+            for lid, season, actual, last_update, raw_count, league_name, scheduled, lag in rows
+        }
 
-    def _query_last_update_generic(self, *, table: str, where: str, params: tuple[Any, ...]) -> datetime | None:
-        v = query_scalar(f"SELECT MAX(updated_at) FROM {table} WHERE {where}", params)
-        if isinstance(v, datetime):
-            if v.tzinfo is None:
-                return v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc)
-        return None
-
-    def _query_last_raw_endpoint_update_joined(self, *, endpoint: str, league_id: int, season: int) -> datetime | None:
-        v = query_scalar(
+    def _query_injuries_coverage_row(self, league_id: int, season: int) -> tuple[int, datetime | None, int, str | None]:
+        """
+        One round-trip for the /injuries coverage inputs:
+        (CORE injuries rows, last CORE update, RAW /injuries requests in 24h, league name).
+        """
+        row = query_row_prepared(
+            "cov_injuries_row",
             """
-            SELECT MAX(r.fetched_at)
-            FROM raw.api_responses r
-            JOIN core.fixtures f ON f.id = (r.requested_params->>'fixture')::bigint
-            WHERE r.endpoint = %s
-              AND f.league_id = %s
-              AND f.season = %s
-            """,
-            (str(endpoint), int(league_id), int(season)),
-        )
-        if isinstance(v, datetime):
-            if v.tzinfo is None:
-                return v.replace(tzinfo=timezone.utc)
-            return v.astimezone(timezone.utc)
-        return None
-
-    def _query_raw_count_24h(self, league_id: int, season: int) -> int:
-        return int(
-            query_scalar(
-                """
+            SELECT
+              (SELECT COUNT(*) FROM core.injuries WHERE league_id = $1::bigint AND season = $2::int),
+              (SELECT MAX(updated_at) FROM core.injuries WHERE league_id = $1::bigint AND season = $2::int),
+              (
                 SELECT COUNT(*)
                 FROM raw.api_responses
-                WHERE endpoint = '/fixtures'
+                WHERE endpoint = '/injuries'
                   AND fetched_at > NOW() - INTERVAL '24 hours'
-                  AND (
-                    -- Per-league requests (league+season)
-                    (requested_params->>'league' = %s AND requested_params->>'season' = %s)
-                    -- Or date-based daily sync (global_by_date/per-league-by-date); indicates pipeline activity
-                    OR (requested_params ? 'date')
-                  )
-                """,
-                (str(int(league_id)), str(int(season))),
-            )
-            or 0
+                  AND requested_params @> jsonb_build_object('league', $1::bigint, 'season', $2::int)
+              ),
+              (SELECT name FROM core.leagues WHERE id = $1::bigint)
+            """,
+            (int(league_id), int(season)),
         )
-
-    def _query_scheduled_fixtures_in_window(
-        self, *, league_id: int, season: int, lookback_days: int, lookahead_days: int
-    ) -> int:
+        if not row:
+            return 0, None, 0, None
+        core_total, last_update, raw_count, league_name = row
+        return core_total, _as_utc(last_update), raw_count, league_name
+
+    def _query_fixture_endpoint_coverage_row(
+        self, *, league_id: int, season: int, endpoint: str, core_table: str, days: int
+    ) -> tuple[int, int, int, datetime | None, int, str | None]:
         """
-        Count fixtures scheduled around "now" to detect off-season/break windows.
-        Important: this is best-effort and only used to avoid false positives when we already have fixtures.
+        One round-trip for per-fixture endpoint coverage inputs:
+        (completed fixtures in window, of those with a RAW call, of those with CORE rows,
+         last RAW fetch for the endpoint, RAW calls in 24h, league name).
         """
-        lookback = max(0, int(lookback_days))
-        lookahead = max(0, int(lookahead_days))
-        return int(
-            query_scalar(
-                """
-                SELECT COUNT(*)
-                FROM core.fixtures
-                WHERE league_id = %s AND season = %s
-                  AND date >= (NOW() AT TIME ZONE 'UTC') - (%s::text || ' days')::interval
-                  AND date <= (NOW() AT TIME ZONE 'UTC') + (%s::text || ' days')::interval
-                """,
-                (int(league_id), int(season), int(lookback), int(lookahead)),
+        # The CORE table is part of the statement text, so each table gets its own prepared statement.
+        row = query_row_prepared(
+            "cov_fx_ep_" + core_table.replace(".", "_"),
+            f"""
+            WITH done AS (
+              SELECT id
+              FROM core.fixtures
+              WHERE league_id = $1::bigint AND season = $2::int
+                AND date >= NOW() - ($3::int::text || ' days')::interval
+                AND status_short = ANY(ARRAY['FT','AET','PEN'])
+            ),
+            league_raw AS (
+              -- Freshness inputs only: plain aggregates over the league's RAW calls, no DISTINCT.
+              SELECT
+                MAX(r.fetched_at) AS last_fetch,
+                COUNT(*) FILTER (WHERE r.fetched_at > NOW() - INTERVAL '24 hours') AS raw_24h
+              FROM raw.api_responses r
+              JOIN core.fixtures f ON f.id = (r.requested_params->>'fixture')::bigint
+              WHERE r.endpoint = $4::text
+                AND f.league_id = $1::bigint
+                AND f.season = $2::int
             )
-            or 0
+            -- done.id is unique: counting done rows with a matching RAW/CORE row needs no DISTINCT.
+            -- The EXISTS probes use idx_raw_api_responses_endpoint_fixture and the fixture_id-leading PKs.
+            SELECT
+              (SELECT COUNT(*) FROM done),
+              (
+                SELECT COUNT(*) FROM done d
+                WHERE EXISTS (
+                  SELECT 1 FROM raw.api_responses r
+                  WHERE r.endpoint = $4::text AND (r.requested_params->>'fixture')::bigint = d.id
+                )
+              ),
+              (SELECT COUNT(*) FROM done d WHERE EXISTS (SELECT 1 FROM {core_table} t WHERE t.fixture_id = d.id)),
+              league_raw.last_fetch,
+              league_raw.raw_24h,
+              (SELECT name FROM core.leagues WHERE id = $1::bigint)
+            FROM league_raw
+            """,
+            (int(league_id), int(season), int(days), str(endpoint)),
         )
+        if not row:
+            return 0, 0, 0, None, 0, None
+        expected, raw_fixtures, core_fixtures, last_update, raw_count_24h, league_name = row
+        return expected, raw_fixtures, core_fixtures, _as_utc(last_update), raw_count_24h, league_name
+
+    def _query_last_update_generic(self, *, table: str, where: str, params: tuple[Any, ...]) -> datetime | None:
+        return _as_utc(query_scalar(f"SELECT MAX(updated_at) FROM {table} WHERE {where}", params))
 
     def _query_league_name(self, league_id: int) -> str | None:
-        v = query_scalar("SELECT name FROM core.leagues WHERE id = %s", (int(league_id),))
-        return str(v) if v is not None else None
+        lid = int(league_id)
+        now = time.monotonic()
+        hit = _LEAGUE_NAMES.get(lid)
+        if hit is not None and now - hit[0] < _LEAGUE_NAME_TTL_SECONDS:
+            return hit[1]
+        v = query_scalar_prepared("cov_league_name", "SELECT name FROM core.leagues WHERE id = $1::bigint", (lid,))
+        name = str(v) if v is not None else None
+        _LEAGUE_NAMES[lid] = (now, name)
+        return name
 
     def _calculate_lag_minutes(self, last_update: datetime | None) -> int:
+        """Minutes since last_update (per-league path; calculate_all gets lag from SQL instead)."""
         if not last_update:
             return 9999
-        now = datetime.now(timezone.utc)
-        delta = now - last_update
-        return int(delta.total_seconds() / 60)
+        return int((time.time() - last_update.timestamp()) / 60)
 
 
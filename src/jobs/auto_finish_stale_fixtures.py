@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-import yaml
+import psycopg2.extras
 
-from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
+from src.collector.api_client import APIClient, APIClientError, APIServerError, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
-from src.transforms.fixtures import transform_fixtures
-from src.utils.db import get_transaction, upsert_core, upsert_raw
-from src.utils.dependencies import ensure_fixtures_dependencies
+from src.utils.config import load_yaml
+from src.utils.db import get_transaction
 from src.utils.logging import get_logger
 
 
@@ -19,20 +20,33 @@ logger = get_logger(component="jobs_auto_finish_stale_fixtures")
 
 # Fixtures in "live" or intermediate states that should have finished.
 # These can be safely auto-finished if they're stale.
+# Mirrored by the partial index in db/schemas/27_fixtures_stale_partial_index.sql.
 STALE_STATUSES = ("NS", "HT", "2H", "1H", "LIVE", "BT", "ET", "P", "SUSP", "INT")
 
 # Final statuses we won't auto-finish (already finished or abandoned)
 FINAL_STATUSES = ("FT", "AET", "PEN", "AWD", "WO", "ABD", "CANC", "PST")
 
+# Built once: SQL ANY(%s) parameter (list -> text[]) and Python membership checks.
+_STALE_STATUSES_LIST = list(STALE_STATUSES)
+STALE_STATUSES_SET = frozenset(STALE_STATUSES)
+FINAL_STATUSES_SET = frozenset(FINAL_STATUSES)
+
+# Literal IN list for candidate selection: the partial index predicate (migration 27) can only be
+# matched when the statuses are constants in the statement text, not a bound array.
+_STALE_STATUSES_SQL_IN = "(" + ", ".join(f"'{s}'" for s in STALE_STATUSES) + ")"
+
 
 @dataclass(frozen=True)
 class AutoFinishConfig:
     threshold_hours: int
     safety_lag_hours: int
     max_fixtures_per_run: int
-    scoped_league_ids: set[int]
+    # Instances are cached and shared between runs (see _load_config): treat as read-only.
+    scoped_league_ids: frozenset[int]
     dry_run: bool
     try_fetch_first: bool
+    # Sorted once at load time; passed as-is to `league_id = ANY(%s)` (psycopg2 adapts lists, not tuples, to arrays).
+    scoped_league_ids_list: list[int]
 
 
 def _load_daily_tracked_league_ids(cfg: dict[str, Any], *, config_path: Path) -> set[int]:
@@ -51,49 +65,46 @@ def _load_daily_tracked_league_ids(cfg: dict[str, Any], *, config_path: Path) ->
     return tracked
 
 
+# (param, cast, default) for the auto_finish_stale_fixtures job; defaults are safe + conservative.
+_PARAM_SPEC: tuple[tuple[str, Callable[[Any], Any], Any], ...] = (
+    ("threshold_hours", int, 2),  # 2 hours after kickoff, treat as stale
+    ("safety_lag_hours", int, 3),  # 3 hours since last update (safety check)
+    ("max_fixtures_per_run", int, 1000),
+    ("dry_run", bool, False),
+    ("try_fetch_first", bool, False),  # Default: DB-only (no API calls) to maintain current behavior
+)
+
+
 def _load_config(config_path: Path) -> AutoFinishConfig:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
-
-    # defaults (safe + conservative)
-    threshold = 2  # 2 hours after kickoff, treat as stale
-    safety_lag = 3  # 3 hours since last update (safety check)
-    max_fixtures = 1000
-    dry_run = False
-    try_fetch_first = False  # Default: DB-only (no API calls) to maintain current behavior
-
-    for j in cfg.get("jobs") or []:
-        if not isinstance(j, dict):
-            continue
-        if str(j.get("job_id") or "") != "auto_finish_stale_fixtures":
-            continue
-        params = j.get("params") or {}
-        if isinstance(params, dict):
-            try:
-                if params.get("threshold_hours") is not None:
-                    threshold = int(params.get("threshold_hours"))
-            except Exception:
-                pass
-            try:
-                if params.get("safety_lag_hours") is not None:
-                    safety_lag = int(params.get("safety_lag_hours"))
-            except Exception:
-                pass
-            try:
-                if params.get("max_fixtures_per_run") is not None:
-                    max_fixtures = int(params.get("max_fixtures_per_run"))
-            except Exception:
-                pass
-            try:
-                if params.get("dry_run") is not None:
-                    dry_run = bool(params.get("dry_run"))
-            except Exception:
-                pass
-            try:
-                if params.get("try_fetch_first") is not None:
-                    try_fetch_first = bool(params.get("try_fetch_first"))
-            except Exception:
-                pass
-        break
+    # Built once per (mtime, size) of daily.yaml; this job fires every few minutes.
+    st = config_path.stat()
+    return _load_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AutoFinishConfig:
+    config_path = Path(path_str)
+    cfg = load_yaml(config_path)
+
+    jobs_by_id = {str(j.get("job_id") or ""): j for j in (cfg.get("jobs") or []) if isinstance(j, dict)}
+    params = (jobs_by_id.get("auto_finish_stale_fixtures") or {}).get("params") or {}
+    if not isinstance(params, dict):
+        params = {}
+
+    # Explicit nulls and malformed values keep that param's default; 0 must still reach the guardrails below.
+    values: dict[str, Any] = {}
+    for key, cast, default in _PARAM_SPEC:
+        v = params.get(key)
+        try:
+            values[key] = default if v is None else cast(v)
+        except (TypeError, ValueError):
+            values[key] = default
+
+    threshold = values["threshold_hours"]
+    safety_lag = values["safety_lag_hours"]
+    max_fixtures = values["max_fixtures_per_run"]
+    dry_run = values["dry_run"]
+    try_fetch_first = values["try_fetch_first"]
 
     # Guardrails
     threshold = max(1, min(int(threshold), 7 * 24))  # 1h .. 7d
@@ -106,9 +117,10 @@ def _load_config(config_path: Path) -> AutoFinishConfig:
         threshold_hours=threshold,
         safety_lag_hours=safety_lag,
         max_fixtures_per_run=max_fixtures,
-        scoped_league_ids=scoped,
+        scoped_league_ids=frozenset(scoped),
         dry_run=dry_run,
         try_fetch_first=try_fetch_first,
+        scoped_league_ids_list=sorted(scoped),
     )
 
 
@@ -117,7 +129,7 @@ def _select_stale_fixture_ids(
     threshold_hours: int,
     safety_lag_hours: int,
     limit: int,
-    tracked_league_ids: set[int] | None = None,
+    tracked_league_ids: list[int],
 ) -> list[int]:
     """
     Select fixtures that are in stale intermediate states but haven't been updated recently.
@@ -128,31 +140,161 @@ def _select_stale_fixture_ids(
 
     This prevents accidentally finishing a live match that's been recently updated.
     """
+    # One row back: the ids as a single bigint[] (psycopg2 -> list[int]) instead of one tuple per fixture.
+    sql = """
+    SELECT COALESCE(array_agg(s.id ORDER BY s.date), '{}')
+    FROM (
+      SELECT f.id, f.date
+      FROM core.fixtures f
+      WHERE f.league_id = ANY(%s)
+        AND f.status_short IN """ + _STALE_STATUSES_SQL_IN + """
+        AND f.date < NOW() - (%s::text || ' hours')::interval
+        AND f.updated_at < NOW() - (%s::text || ' hours')::interval
+      ORDER BY f.date ASC
+      LIMIT %s
+    ) s
+    """
+    with get_transaction() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                sql,
+                (
+                    tracked_league_ids,
+                    str(threshold_hours),
+                    str(safety_lag_hours),
+                    int(limit),
+                ),
+            )
+            (ids,) = cur.fetchone()
+            conn.commit()
+    return ids
+
+
+# DB-only auto-finish: FT + current goals as fulltime score, flagged for later score verification.
+_AUTO_FINISH_SET_SQL = """
+              status_short = 'FT',
+              status_long = 'Match Finished (Auto-finished)',
+              elapsed = 90,
+              -- Shallow merge of the single top-level key; no jsonb_set path walk.
+              score = COALESCE(score, '{}'::jsonb)
+                || jsonb_build_object('fulltime', jsonb_build_object('home', goals_home, 'away', goals_away)),
+              needs_score_verification = TRUE,
+              verification_state = 'pending',
+              verification_attempt_count = 0,
+              verification_last_attempt_at = NULL,
+              updated_at = NOW()
+"""
+
+
+def _claim_and_auto_finish_stale_fixtures(
+    *,
+    threshold_hours: int,
+    safety_lag_hours: int,
+    limit: int,
+    tracked_league_ids: list[int],
+) -> dict[str, Any]:
+    """
+    DB-only fast path: select and auto-finish stale fixtures in one statement.
+
+    FOR UPDATE SKIP LOCKED lets overlapping runs (cron overlap, several pods) claim disjoint
+    batches instead of racing on the same ids; same double-threshold check as _select_stale_fixture_ids.
+    """
     sql = """
-    SELECT f.id, f.league_id, f.status_short, f.date, f.updated_at
-    FROM core.fixtures f
-    WHERE f.league_id = ANY(%s)
-      AND f.status_short = ANY(%s)
-      AND f.date < NOW() - (%s::text || ' hours')::interval
-      AND f.updated_at < NOW() - (%s::text || ' hours')::interval
-    ORDER BY f.date ASC
-    LIMIT %s
+    WITH picked AS (
+      SELECT f.id
+      FROM core.fixtures f
+      WHERE f.league_id = ANY(%s)
+        AND f.status_short IN """ + _STALE_STATUSES_SQL_IN + """
+        AND f.date < NOW() - (%s::text || ' hours')::interval
+        AND f.updated_at < NOW() - (%s::text || ' hours')::interval
+      ORDER BY f.date ASC
+      LIMIT %s
+      FOR UPDATE SKIP LOCKED
+    ),
+    upd AS (
+      UPDATE core.fixtures
+      SET """ + _AUTO_FINISH_SET_SQL + """
+      FROM picked
+      WHERE core.fixtures.id = picked.id
+      RETURNING core.fixtures.league_id
+    )
+    SELECT COUNT(*), COALESCE(array_agg(DISTINCT league_id), '{}') FROM upd
     """
     with get_transaction() as conn:
         with conn.cursor() as cur:
             cur.execute(
                 sql,
                 (
-                    sorted(list(tracked_league_ids or [])),
-                    list(STALE_STATUSES),
+                    tracked_league_ids,
                     str(threshold_hours),
                     str(safety_lag_hours),
                     int(limit),
                 ),
             )
-            rows = cur.fetchall()
+            n_updated, league_ids = cur.fetchone()
             conn.commit()
-    return [int(r[0]) for r in rows]
+    return {
+        "updated_count": int(n_updated),
+        "leagues_affected": len(league_ids),
+        "dry_run": False,
+        "fetched_from_api": 0,
+        "marked_for_verification": int(n_updated),
+    }
+
+
+def _project_fixture_for_finish(item: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Narrow projection of one /fixtures response item: only what auto-finish writes back.
+    Skips the full transform_fixtures() validation/mapping (teams, venue, details) for these rows.
+    """
+    fixture = item.get("fixture") or {}
+    fixture_id = fixture.get("id")
+    if fixture_id is None:
+        return None
+    status = fixture.get("status") or {}
+    goals = item.get("goals") or {}
+    return {
+        "id": int(fixture_id),
+        "status_short": status.get("short"),
+        "status_long": status.get("long"),
+        "elapsed": status.get("elapsed"),
+        "goals_home": goals.get("home"),
+        "goals_away": goals.get("away"),
+        "score": item.get("score"),
+    }
+
+
+# Writes the projected API fields for existing fixtures and clears the verification state in one statement.
+_APPLY_FETCHED_SQL = """
+UPDATE core.fixtures AS f
+SET status_short = v.status_short,
+    status_long = v.status_long,
+    elapsed = v.elapsed,
+    goals_home = v.goals_home,
+    goals_away = v.goals_away,
+    score = v.score,
+    needs_score_verification = FALSE,
+    verification_state = 'verified',
+    verification_attempt_count = 0,
+    verification_last_attempt_at = NOW(),
+    updated_at = NOW()
+FROM (VALUES %s) AS v(id, status_short, status_long, elapsed, goals_home, goals_away, score)
+WHERE f.id = v.id
+RETURNING f.league_id
+"""
+_APPLY_FETCHED_TEMPLATE = "(%s::bigint, %s::text, %s::text, %s::int, %s::int, %s::int, %s::jsonb)"
+
+# API still reports these as live / not started: only restart their safety-lag clock (no status change).
+_TOUCH_STILL_LIVE_SQL = """
+UPDATE core.fixtures
+SET updated_at = NOW()
+WHERE id = ANY(%s)
+  AND status_short = ANY(%s)
+"""
+
+
+# Max ids per `id = ANY(%s)` UPDATE in the DB-only fallback.
+_UPDATE_CHUNK_SIZE = 1000
 
 
 def _chunk(ids: list[int], *, size: int) -> list[list[int]]:
@@ -162,6 +304,59 @@ def _chunk(ids: list[int], *, size: int) -> list[list[int]]:
     return [ids[i : i + size] for i in range(0, len(ids), size)]
 
 
+def _low_quota_pause_seconds(headers: Any) -> float:
+    """
+    Proactive pause from the per-minute quota headers of a successful response.
+
+    When X-RateLimit-Remaining drops to max(2, 10% of X-RateLimit-Limit), wait roughly as long as the
+    per-minute window needs to free the missing slots, instead of running into the next 429.
+    """
+    try:
+        remaining = int(headers.get("x-ratelimit-remaining"))
+        limit = int(headers.get("x-ratelimit-limit"))
+    except (TypeError, ValueError):
+        return 0.0
+    if limit <= 0:
+        return 0.0
+    threshold = max(2, limit // 10)
+    if remaining > threshold:
+        return 0.0
+    return 60.0 / limit * (threshold - remaining + 1)
+
+
+class _AimdWindow:
+    """
+    Adaptive in-flight limit for API batches (additive increase, multiplicative decrease).
+
+    Each successful batch widens the window by `step` up to `max_limit`; a 429/5xx halves it
+    (never below 1). Replaces a fixed-size semaphore plus a blind sleep on rate limiting.
+    """
+
+    def __init__(self, max_limit: int, *, step: float = 0.5) -> None:
+        self.max_limit = max(1, int(max_limit))
+        self.limit = float(self.max_limit)
+        self.step = step
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> "_AimdWindow":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        self.limit = min(float(self.max_limit), self.limit + self.step)
+
+    def on_overload(self) -> None:
+        self.limit = max(1.0, self.limit * 0.5)
+
+
 async def _try_fetch_fixtures_batch_from_api(
     *,
     fixture_ids: list[int],
@@ -170,44 +365,66 @@ async def _try_fetch_fixtures_batch_from_api(
 ) -> dict[int, dict[str, Any]]:
     """
     Batch fetch fixtures from API.
-    
+
+    Batches of 20 ids run concurrently (up to AUTO_FINISH_CONCURRENCY in flight, default 8);
+    the window backs off on 429/5xx (see _AimdWindow) and the shared RateLimiter still paces requests.
+
     Returns dict mapping fixture_id -> transformed_fixture_data for successful fetches.
     Returns empty dict if API call fails (quota, network, etc.).
     """
     fetched_data: dict[int, dict[str, Any]] = {}
-    
-    for batch in _chunk(fixture_ids, size=20):
+    window = _AimdWindow(int(os.getenv("AUTO_FINISH_CONCURRENCY", "8")))
+    stop = asyncio.Event()
+
+    async def _fetch_one(batch: list[int]) -> None:
         ids_param = "-".join(str(int(x)) for x in batch)
         params = {"ids": ids_param}
         label = f"/fixtures(ids={ids_param})"
-        
-        try:
-            limiter.acquire_token()
-            res = await client.get("/fixtures", params=params)
-            limiter.update_from_headers(res.headers)
-            env = res.data or {}
-            errors = env.get("errors") or {}
-            
-            if errors:
-                logger.warning("auto_finish_api_errors", label=label, errors=errors)
-                continue
-                
-            # Transform and store by fixture_id
-            fixtures_rows, _ = transform_fixtures(env)
-            for row in fixtures_rows:
-                fetched_data[row["id"]] = row
-                
-        except EmergencyStopError as e:
-            logger.warning("auto_finish_emergency_stop", err=str(e))
-            break
-        except RateLimitError as e:
-            logger.warning("auto_finish_rate_limited", err=str(e))
-            await asyncio.sleep(5)
-            continue
-        except (APIClientError, RuntimeError) as e:
-            logger.warning("auto_finish_api_failed", err=str(e), ids=len(batch))
-            continue
-    
+
+        async with window:
+            if stop.is_set():
+                return
+            try:
+                # acquire_token() may sleep: keep it off the event loop so in-flight batches progress.
+                await asyncio.to_thread(limiter.acquire_token)
+                res = await client.get("/fixtures", params=params)
+                limiter.update_from_headers(res.headers)
+                pause = _low_quota_pause_seconds(res.headers)
+                if pause > 0:
+                    # Near the minute cap: shrink the window and hold this slot until quota frees up.
+                    window.on_overload()
+                    logger.info("auto_finish_low_quota_pause", seconds=round(pause, 2), window=window.limit)
+                    await asyncio.sleep(pause)
+                else:
+                    window.on_success()
+                env = res.data or {}
+                errors = env.get("errors") or {}
+
+                if errors:
+                    logger.warning("auto_finish_api_errors", label=label, errors=errors)
+                    return
+
+                # Project only the fields auto-finish writes, keyed by fixture_id
+                for item in env.get("response") or []:
+                    row = _project_fixture_for_finish(item)
+                    if row is not None:
+                        fetched_data[row["id"]] = row
+
+            except EmergencyStopError as e:
+                logger.warning("auto_finish_emergency_stop", err=str(e))
+                stop.set()
+            except RateLimitError as e:
+                window.on_overload()
+                retry_after = e.retry_after if e.retry_after is not None else 5.0
+                logger.warning("auto_finish_rate_limited", err=str(e), retry_after=retry_after, window=window.limit)
+                await asyncio.sleep(retry_after)
+            except APIServerError as e:
+                window.on_overload()
+                logger.warning("auto_finish_api_failed", err=str(e), ids=len(batch))
+            except (APIClientError, RuntimeError) as e:
+                logger.warning("auto_finish_api_failed", err=str(e), ids=len(batch))
+
+    await asyncio.gather(*(_fetch_one(batch) for batch in _chunk(fixture_ids, size=20)))
     return fetched_data
 
 
@@ -233,95 +450,84 @@ def _auto_finish_fixtures(
         return {"updated_count": 0, "leagues_affected": 0, "dry_run": True}
 
     fetched_ids = set(fetched_data.keys()) if fetched_data else set()
-    missing_ids = [fid for fid in fixture_ids if fid not in fetched_ids]
+    # Order is irrelevant downstream (chunked `id = ANY(%s)` updates).
+    missing_ids = list(set(fixture_ids) - fetched_ids)
+    # Only apply API rows that actually finished; a fixture the API still reports as live (or not started)
+    # is left alone here and neither force-finished nor marked verified.
+    finished_rows = [row for row in (fetched_data or {}).values() if row["status_short"] in FINAL_STATUSES_SET]
+    still_live_ids = [
+        row["id"] for row in (fetched_data or {}).values() if row["status_short"] not in FINAL_STATUSES_SET
+    ]
 
     updated_count = 0
     leagues_affected_set: set[int] = set()
 
-    # Update fixtures with fresh API data
-    if fetched_data:
-        for fixture_id, row in fetched_data.items():
-            try:
-                with get_transaction() as conn:
-                    upsert_core(
-                        full_table_name="core.fixtures",
-                        rows=[row],
-                        conflict_cols=["id"],
-                        update_cols=[
-                            "league_id",
-                            "season",
-                            "round",
-                            "date",
-                            "api_timestamp",
-                            "referee",
-                            "timezone",
-                            "venue_id",
-                            "home_team_id",
-                            "away_team_id",
-                            "status_short",
-                            "status_long",
-                            "elapsed",
-                            "goals_home",
-                            "goals_away",
-                            "score",
-                        ],
-                        conn=conn,
-                    )
-                    # Set needs_score_verification = FALSE for successfully fetched fixtures
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            UPDATE core.fixtures
-                            SET needs_score_verification = FALSE,
-                                verification_state = 'verified',
-                                verification_attempt_count = 0,
-                                verification_last_attempt_at = NOW()
-                            WHERE id = %s
-                            """,
-                            (fixture_id,),
+    # Update fixtures with fresh API data: one transaction, one multi-row UPDATE that also clears the
+    # verification flag. Still-live fixtures only get updated_at bumped in the same transaction, so the
+    # safety lag applies before they are selected (and fetched) again.
+    if finished_rows or still_live_ids:
+        values = [
+            (
+                row["id"],
+                row["status_short"],
+                row["status_long"],
+                row["elapsed"],
+                row["goals_home"],
+                row["goals_away"],
+                psycopg2.extras.Json(row["score"]) if row["score"] is not None else None,
+            )
+            for row in finished_rows
+        ]
+        try:
+            with get_transaction() as conn:
+                with conn.cursor() as cur:
+                    updated = (
+                        psycopg2.extras.execute_values(
+                            cur, _APPLY_FETCHED_SQL, values, template=_APPLY_FETCHED_TEMPLATE, fetch=True
                         )
-                    conn.commit()
-                updated_count += 1
-                leagues_affected_set.add(row["league_id"])
-            except Exception as e:
-                logger.error("auto_finish_upsert_failed", fixture_id=fixture_id, err=str(e))
-                # Fallback: mark as needing verification
-                missing_ids.append(fixture_id)
+                        if values
+                        else []
+                    )
+                    if still_live_ids:
+                        cur.execute(_TOUCH_STILL_LIVE_SQL, (still_live_ids, _STALE_STATUSES_LIST))
+                conn.commit()
+            updated_count += len(updated)
+            leagues_affected_set.update(r[0] for r in updated)
+        except Exception as e:
+            logger.error("auto_finish_upsert_failed", fixtures=len(values), err=str(e))
+            # Fallback: mark the whole batch as needing verification
+            missing_ids.extend(row["id"] for row in finished_rows)
 
     # Update missing/failed fixtures with current score + verification flag
     if missing_ids:
+        # Summarize in SQL: only the row count and the distinct leagues cross the wire, not every updated row.
         sql = """
-        UPDATE core.fixtures
-        SET status_short = 'FT',
-            status_long = 'Match Finished (Auto-finished)',
-            elapsed = 90,
-            score = jsonb_set(
-              COALESCE(score, '{}'::jsonb),
-              '{fulltime}',
-              jsonb_build_object('home', goals_home, 'away', goals_away),
-              true
-            ),
-            needs_score_verification = TRUE,
-            verification_state = 'pending',
-            verification_attempt_count = 0,
-            verification_last_attempt_at = NULL,
-            updated_at = NOW()
-        WHERE id = ANY(%s)
-        RETURNING id, league_id, season, status_short, date, updated_at
+        WITH upd AS (
+          UPDATE core.fixtures
+          SET """ + _AUTO_FINISH_SET_SQL + """
+          WHERE id = ANY(%s)
+            -- Another runner may have finished these while we were calling the API.
+            AND status_short = ANY(%s)
+          RETURNING league_id
+        )
+        SELECT COUNT(*), COALESCE(array_agg(DISTINCT league_id), '{}') FROM upd
         """
+        # Bounded id arrays (~1k) keep each statement's plan index-driven; one transaction for all chunks.
         with get_transaction() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (list(missing_ids),))
-                rows = cur.fetchall()
+                for chunk in _chunk(missing_ids, size=_UPDATE_CHUNK_SIZE):
+                    cur.execute(sql, (chunk, _STALE_STATUSES_LIST))
+                    n_updated, league_ids = cur.fetchone()
+                    updated_count += n_updated
+                    leagues_affected_set.update(league_ids)
                 conn.commit()
-        updated_count += len(rows)
-        leagues_affected_set.update(int(r[1]) for r in rows)
 
     return {
         "updated_count": updated_count,
         "leagues_affected": len(leagues_affected_set),
         "dry_run": False,
         "fetched_from_api": len(fetched_ids),
+        "still_live_skipped": len(still_live_ids),
         "marked_for_verification": len(missing_ids),
     }
 
@@ -349,11 +555,41 @@ async def run_auto_finish_stale_fixtures(
     """
     cfg = _load_config(config_path)
 
+    # DB-only runs claim + update in one statement; dry-run and the API path still select first.
+    if not cfg.dry_run and not (cfg.try_fetch_first and client is not None and limiter is not None):
+        result = _claim_and_auto_finish_stale_fixtures(
+            threshold_hours=cfg.threshold_hours,
+            safety_lag_hours=cfg.safety_lag_hours,
+            limit=cfg.max_fixtures_per_run,
+            tracked_league_ids=cfg.scoped_league_ids_list,
+        )
+        if not result["updated_count"]:
+            logger.info(
+                "auto_finish_no_work",
+                threshold_hours=cfg.threshold_hours,
+                safety_lag_hours=cfg.safety_lag_hours,
+                scoped_leagues=len(cfg.scoped_league_ids),
+                dry_run=cfg.dry_run,
+            )
+            return
+        logger.info(
+            "auto_finish_complete",
+            threshold_hours=cfg.threshold_hours,
+            safety_lag_hours=cfg.safety_lag_hours,
+            selected=result["updated_count"],
+            updated_count=result["updated_count"],
+            leagues_affected=result["leagues_affected"],
+            fetched_from_api=0,
+            marked_for_verification=result["marked_for_verification"],
+            dry_run=False,
+        )
+        return
+
     stale_ids = _select_stale_fixture_ids(
         threshold_hours=cfg.threshold_hours,
         safety_lag_hours=cfg.safety_lag_hours,
         limit=cfg.max_fixtures_per_run,
-        tracked_league_ids=cfg.scoped_league_ids,
+        tracked_league_ids=cfg.scoped_league_ids_list,
     )
 
     if not stale_ids:
@@ -401,5 +637,6 @@ async def run_auto_finish_stale_fixtures(
         leagues_affected=result["leagues_affected"],
         fetched_from_api=result.get("fetched_from_api", 0),
         marked_for_verification=result.get("marked_for_verification", 0),
+        still_live_skipped=result.get("still_live_skipped", 0),
         dry_run=cfg.dry_run,
     )
@@ -3,84 +3,105 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import functools
+from itertools import islice
 import os
 from pathlib import Path
-from typing import Any
-
-import yaml
+import random
+from typing import Any, Callable, Iterator
 
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
 from src.jobs.fixture_details import (
+    _DETAIL_ENDPOINT_SPECS,
     _fetch_and_store_fixture_details,
-    _missing_or_stale_detail_endpoints_for_fixture,
+    _missing_or_stale_detail_endpoints_bulk,
 )
 from src.transforms.fixtures import transform_fixtures
+from src.utils.config import load_yaml
 from src.utils.db import get_transaction, upsert_core, upsert_raw
-from src.utils.dependencies import ensure_fixtures_dependencies
+from src.utils.dependencies import (
+    _extract_team_ids_from_fixtures_envelope,
+    _extract_venue_rows_from_fixtures_envelope,
+    ensure_fixtures_dependencies,
+)
 from src.utils.logging import get_logger
 
 
 logger = get_logger(component="jobs_auto_finish_verification")
 
+# Lower bound of the min_daily_quota guardrail.
+_MIN_DAILY_QUOTA_FLOOR = 1000
+
+# Background RAW archive writes each hold a pooled connection next to the event loop's own.
+# Together with fixture_details' _COVERAGE_CONCURRENCY workers this must fit utils.db.POOL_MAXCONN.
+_RAW_ARCHIVE_CONCURRENCY = 1
+
 
 @dataclass(frozen=True)
 class AutoFinishVerificationConfig:
     min_daily_quota: int
     batch_size: int
     max_fixtures_per_run: int
-    scoped_league_ids: set[int]
+    scoped_league_ids: frozenset[int]
+    # SQL ANY(%s) parameter, sorted once at load (stable statement params, no per-run sort).
+    scoped_league_ids_list: list[int]
+    detail_concurrency: int = 4
 
 
-def _chunk(ids: list[int], *, size: int) -> list[list[int]]:
-    """Split list into chunks of specified size."""
+def _chunk(ids: list[int], *, size: int) -> Iterator[list[int]]:
+    """Yield chunks of specified size lazily (the batch loop may stop early)."""
     if size <= 0:
-        return [ids]
-    return [ids[i : i + size] for i in range(0, len(ids), size)]
-
-
-def _record_verification_attempt(*, fixture_ids: list[int]) -> None:
-    """
-    Record an attempt for pending verification fixtures.
-    Uses dedicated columns (not core.fixtures.updated_at).
-    """
-    if not fixture_ids:
+        yield ids
         return
-    with get_transaction() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                UPDATE core.fixtures
-                SET verification_last_attempt_at = NOW(),
-                    verification_attempt_count = COALESCE(verification_attempt_count, 0) + 1,
-                    verification_state = COALESCE(verification_state, 'pending')
-                WHERE id = ANY(%s)
-                  AND (COALESCE(verification_state, 'pending') = 'pending' OR needs_score_verification = TRUE)
-                """,
-                (fixture_ids,),
-            )
-        conn.commit()
-
-
-def _mark_not_found(*, fixture_ids: list[int]) -> None:
+    it = iter(ids)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+# Records one attempt and, once attempts reach the cap, moves pending rows to not_found (clearing the flag).
+_RECORD_ATTEMPT_SQL = """
+UPDATE core.fixtures f
+SET verification_last_attempt_at = NOW(),
+    verification_attempt_count = COALESCE(f.verification_attempt_count, 0) + 1,
+    verification_state = CASE WHEN v.hit THEN 'not_found'
+                              ELSE COALESCE(f.verification_state, 'pending') END,
+    needs_score_verification = CASE WHEN v.hit THEN FALSE
+                                    ELSE f.needs_score_verification END
+FROM (
+  SELECT id,
+         (COALESCE(verification_state, 'pending') = 'pending'
+          AND COALESCE(verification_attempt_count, 0) + 1 >= %s) AS hit
+  FROM core.fixtures
+  WHERE id = ANY(%s)
+) v
+WHERE f.id = v.id
+  AND (COALESCE(f.verification_state, 'pending') = 'pending' OR f.needs_score_verification = TRUE)
+RETURNING f.id, v.hit
+"""
+
+
+def _record_verification_attempt(*, fixture_ids: list[int], max_attempts: int) -> list[int]:
     """
-    Mark fixtures as not_found (upstream API consistently returns empty response).
-    This removes them from the verification backlog but keeps an explicit state for reporting.
+    Record an attempt for pending verification fixtures and, in the same statement,
+    mark those that reach `max_attempts` as not_found (upstream API consistently returns
+    no data). not_found removes them from the verification backlog but keeps an explicit
+    state for reporting.
+
+    Uses dedicated columns (not core.fixtures.updated_at).
+    Returns the ids transitioned to not_found.
     """
     if not fixture_ids:
-        return
+        return []
     with get_transaction() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                """
-                UPDATE core.fixtures
-                SET verification_state = 'not_found',
-                    needs_score_verification = FALSE
-                WHERE id = ANY(%s)
-                """,
-                (fixture_ids,),
+                _RECORD_ATTEMPT_SQL,
+                (int(max_attempts), fixture_ids),
             )
+            rows = cur.fetchall()
         conn.commit()
+    return [int(fid) for fid, hit in rows if hit]
 
 
 def _reconcile_not_found(*, max_attempts: int) -> int:
@@ -127,57 +148,93 @@ def _load_daily_tracked_league_ids(cfg: dict[str, Any], *, config_path: Path) ->
     return tracked
 
 
+# (param, min, max, default) for the auto_finish_verification job; values are clamped to [min, max].
+_INT_PARAMS: tuple[tuple[str, int, int, int], ...] = (
+    ("min_daily_quota", _MIN_DAILY_QUOTA_FLOOR, 100000, 50000),
+    ("batch_size", 1, 20, 20),  # /fixtures?ids= accepts at most 20 ids
+    ("max_fixtures_per_run", 1, 10000, 200),
+    ("detail_concurrency", 1, 8, 4),
+)
+
+
 def _load_config(config_path: Path) -> AutoFinishVerificationConfig:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    # Built once per (mtime, size) of daily.yaml; this job fires every 30 minutes.
+    st = config_path.stat()
+    return _load_config_cached(str(config_path), st.st_mtime_ns, st.st_size)
 
-    # defaults
-    min_daily_quota = 50000
-    batch_size = 20
-    max_fixtures = 200
 
-    for j in cfg.get("jobs") or []:
-        if not isinstance(j, dict):
-            continue
-        if str(j.get("job_id") or "") != "auto_finish_verification":
-            continue
-        params = j.get("params") or {}
-        if isinstance(params, dict):
-            try:
-                if params.get("min_daily_quota") is not None:
-                    min_daily_quota = int(params.get("min_daily_quota"))
-            except Exception:
-                pass
-            try:
-                if params.get("batch_size") is not None:
-                    batch_size = int(params.get("batch_size"))
-            except Exception:
-                pass
-            try:
-                if params.get("max_fixtures_per_run") is not None:
-                    max_fixtures = int(params.get("max_fixtures_per_run"))
-            except Exception:
-                pass
-        break
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int, size: int) -> AutoFinishVerificationConfig:
+    config_path = Path(path_str)
+    cfg = load_yaml(config_path)
 
-    # Guardrails
-    min_daily_quota = max(1000, min(int(min_daily_quota), 100000))
-    batch_size = max(1, min(int(batch_size), 20))
-    max_fixtures = max(1, min(int(max_fixtures), 10000))
+    jobs_by_id = {str(j.get("job_id") or ""): j for j in (cfg.get("jobs") or []) if isinstance(j, dict)}
+    params = (jobs_by_id.get("auto_finish_verification") or {}).get("params") or {}
+    if not isinstance(params, dict):
+        params = {}
+
+    # One guarded int() per param; nulls and malformed values keep the default, then clamp.
+    values: dict[str, int] = {}
+    for key, lo, hi, default in _INT_PARAMS:
+        v = params.get(key)
+        try:
+            n = default if v is None else int(v)
+        except (TypeError, ValueError):
+            n = default
+        values[key] = max(lo, min(hi, n))
 
     scoped = _load_daily_tracked_league_ids(cfg, config_path=config_path)
 
     return AutoFinishVerificationConfig(
-        min_daily_quota=min_daily_quota,
-        batch_size=batch_size,
-        max_fixtures_per_run=max_fixtures,
-        scoped_league_ids=scoped,
+        min_daily_quota=values["min_daily_quota"],
+        batch_size=values["batch_size"],
+        max_fixtures_per_run=values["max_fixtures_per_run"],
+        scoped_league_ids=frozenset(scoped),
+        scoped_league_ids_list=sorted(scoped),
+        detail_concurrency=values["detail_concurrency"],
+    )
+
+
+# Selector for both verification buckets (see _select_verification_fixture_ids).
+_SELECT_VERIFICATION_SQL = """
+SELECT f.id
+FROM core.fixtures f
+WHERE f.league_id = ANY(%s)
+  AND f.status_short = 'FT'
+  AND (
+    -- Bucket 1: verification backlog with 24h cooldown
+    (
+      (COALESCE(f.verification_state, 'pending') = 'pending' OR f.needs_score_verification = TRUE)
+      AND COALESCE(f.verification_attempt_count, 0) < %s
+      AND (
+        f.verification_last_attempt_at IS NULL
+        OR f.verification_last_attempt_at < NOW() - (%s::text || ' hours')::interval
+      )
+    )
+    OR
+    -- Bucket 2: broken FT (auto-finished) with short cooldown
+    (
+      f.status_long ILIKE %s
+      AND (
+        f.elapsed IS NULL OR f.elapsed < 90
+        OR (f.score IS NULL OR (f.score->'fulltime') IS NULL)
+      )
+      AND COALESCE(f.verification_state, 'pending') <> 'not_found'
+      AND (
+        f.verification_last_attempt_at IS NULL
+        OR f.verification_last_attempt_at < NOW() - INTERVAL '15 minutes'
+      )
     )
+  )
+ORDER BY f.date DESC
+LIMIT %s
+"""
 
 
 def _select_verification_fixture_ids(
     *,
     limit: int,
-    tracked_league_ids: set[int],
+    tracked_league_ids: list[int],
 ) -> list[int]:
     """
     Select fixtures that need score verification OR are "broken FT".
@@ -198,44 +255,11 @@ def _select_verification_fixture_ids(
     cooldown_hours = int(os.getenv("VERIFICATION_COOLDOWN_HOURS", "24"))
     max_attempts = int(os.getenv("VERIFICATION_MAX_ATTEMPTS", "3"))
 
-    sql = """
-    SELECT f.id
-    FROM core.fixtures f
-    WHERE f.league_id = ANY(%s)
-      AND f.status_short = 'FT'
-      AND (
-        -- Bucket 1: verification backlog with 24h cooldown
-        (
-          (COALESCE(f.verification_state, 'pending') = 'pending' OR f.needs_score_verification = TRUE)
-          AND COALESCE(f.verification_attempt_count, 0) < %s
-          AND (
-            f.verification_last_attempt_at IS NULL
-            OR f.verification_last_attempt_at < NOW() - (%s::text || ' hours')::interval
-          )
-        )
-        OR
-        -- Bucket 2: broken FT (auto-finished) with short cooldown
-        (
-          f.status_long ILIKE %s
-          AND (
-            f.elapsed IS NULL OR f.elapsed < 90
-            OR (f.score IS NULL OR (f.score->'fulltime') IS NULL)
-          )
-          AND COALESCE(f.verification_state, 'pending') <> 'not_found'
-          AND (
-            f.verification_last_attempt_at IS NULL
-            OR f.verification_last_attempt_at < NOW() - INTERVAL '15 minutes'
-          )
-        )
-      )
-    ORDER BY f.date DESC
-    LIMIT %s
-    """
     with get_transaction() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                sql,
-                (sorted(list(tracked_league_ids)), int(max_attempts), str(cooldown_hours), "%Auto-finished%", int(limit)),
+                _SELECT_VERIFICATION_SQL,
+                (tracked_league_ids, int(max_attempts), str(cooldown_hours), "%Auto-finished%", int(limit)),
             )
             rows = cur.fetchall()
             conn.commit()
@@ -248,13 +272,14 @@ async def _safe_get_envelope(
     limiter: RateLimiter,
     endpoint: str,
     params: dict[str, Any],
-    label: str,
+    label_factory: Callable[[], str],
     max_retries: int = 6,
 ) -> tuple[APIResult, dict[str, Any]]:
-    """Safe API call with retry logic."""
+    """Safe API call with retry logic. `label_factory` builds the error label only when raising."""
     backoff = 2.0
     for attempt in range(max_retries):
-        limiter.acquire_token()
+        # acquire_token() may sleep: keep it off the event loop so concurrent fetches progress.
+        await asyncio.to_thread(limiter.acquire_token)
         res = await client.get(endpoint, params=params)
         limiter.update_from_headers(res.headers)
         env = res.data or {}
@@ -262,14 +287,184 @@ async def _safe_get_envelope(
 
         if isinstance(errors, dict) and errors.get("rateLimit"):
             if attempt == max_retries - 1:
-                raise RuntimeError(f"api_errors:{label}:{errors}")
-            await asyncio.sleep(min(backoff, 30.0))
+                raise RuntimeError(f"api_errors:{label_factory()}:{errors}")
+            # Jittered so concurrent callers (prefetch + detail fetches) don't retry in lockstep.
+            sleep_s = random.uniform(0.5, min(backoff, 30.0))
+            logger.warning("api_rate_limited_backoff", label=label_factory(), attempt=attempt, sleep_seconds=round(sleep_s, 2))
+            await asyncio.sleep(sleep_s)
             backoff = min(backoff * 2.0, 30.0)
             continue
         if errors:
-            raise RuntimeError(f"api_errors:{label}:{errors}")
+            raise RuntimeError(f"api_errors:{label_factory()}:{errors}")
         return res, env
-    raise RuntimeError(f"api_errors:{label}:max_retries_exceeded")
+    raise RuntimeError(f"api_errors:{label_factory()}:max_retries_exceeded")
+
+
+async def _fetch_details_for_verified(
+    *,
+    client: APIClient,
+    limiter: RateLimiter,
+    fixture_ids: list[int],
+    concurrency: int,
+    stop: asyncio.Event,
+    embedded: dict[int, set[str]] | None = None,
+) -> tuple[int, int]:
+    """
+    Fetch per-fixture detail endpoints for freshly verified fixtures.
+
+    Fixtures are fetched concurrently (bounded by `concurrency`); the limiter token
+    bucket inside `_safe_get_envelope` still caps the global request rate.
+    Sets `stop` on EmergencyStopError so in-flight siblings and the caller bail out.
+    Endpoints in `embedded` (already stored from the /fixtures?ids= payload) are not requested.
+
+    Returns (fixtures_with_details_fetched, endpoints_fetched).
+    """
+    stale_minutes = int(os.getenv("FIXTURE_DETAILS_STALE_MINUTES", "15"))
+    try:
+        # One RAW round-trip for the whole batch instead of one per fixture.
+        missing_by_fixture = _missing_or_stale_detail_endpoints_bulk(
+            fixture_ids=fixture_ids,
+            stale_minutes=stale_minutes,
+        )
+    except Exception as e:
+        logger.warning("auto_finish_verification_details_fetch_failed", fixture_ids=fixture_ids, err=str(e))
+        return 0, 0
+    embedded = embedded or {}
+    # All endpoints present and fresh (or just stored from the batch payload) -> skip
+    todo = [(fid, eps - embedded.get(fid, set())) for fid, eps in missing_by_fixture.items()]
+    todo = [(fid, eps) for fid, eps in todo if eps]
+    if not todo:
+        return 0, 0
+
+    sem = asyncio.Semaphore(max(1, int(concurrency)))
+
+    async def _one(fixture_id: int, endpoints: set[str]) -> bool:
+        async with sem:
+            if stop.is_set():
+                return False
+            try:
+                await _fetch_and_store_fixture_details(
+                    client=client, limiter=limiter, fixture_id=fixture_id, endpoints=endpoints
+                )
+            except EmergencyStopError:
+                stop.set()
+                raise
+            return True
+
+    results = await asyncio.gather(*(_one(fid, eps) for fid, eps in todo), return_exceptions=True)
+
+    fetched = 0
+    endpoints_fetched = 0
+    for (fixture_id, missing_or_stale), r in zip(todo, results):
+        if r is True:
+            fetched += 1
+            endpoints_fetched += len(missing_or_stale)
+        elif isinstance(r, BaseException) and not isinstance(r, EmergencyStopError):
+            # Details fetch failed, but verification succeeded
+            logger.warning("auto_finish_verification_details_fetch_failed", fixture_id=fixture_id, err=str(r))
+    return fetched, endpoints_fetched
+
+
+def _embedded_endpoint_rows(
+    envelope: dict[str, Any],
+) -> tuple[dict[str, list[dict[str, Any]]], dict[int, set[str]]]:
+    """
+    Per-endpoint CORE rows from the detail blocks embedded in a /fixtures?ids= envelope.
+
+    Each block has the shape of the matching /fixtures/<endpoint>?fixture= response.
+    Returns ({endpoint: rows}, {fixture_id: endpoints covered}). Empty or unparseable
+    blocks cover nothing, so those endpoints still go through the per-fixture fetch.
+    """
+    rows_by_endpoint: dict[str, list[dict[str, Any]]] = {}
+    covered: dict[int, set[str]] = {}
+    for item in envelope.get("response") or []:
+        if not isinstance(item, dict):
+            continue
+        fid = (item.get("fixture") or {}).get("id")
+        if fid is None:
+            continue
+        for endpoint, transform_fn, _table, _conflict_cols, _update_cols in _DETAIL_ENDPOINT_SPECS:
+            # "/fixtures/events" -> item["events"]
+            block = item.get(endpoint.rsplit("/", 1)[-1])
+            if not block:
+                continue
+            try:
+                rows = transform_fn(envelope={"response": block}, fixture_id=int(fid))
+            except Exception:
+                continue
+            if rows:
+                rows_by_endpoint.setdefault(endpoint, []).extend(rows)
+                covered.setdefault(int(fid), set()).add(endpoint)
+    return rows_by_endpoint, covered
+
+
+def _store_verified_batch(
+    *,
+    raw_kwargs: dict[str, Any],
+    fixtures_rows: list[dict[str, Any]],
+    details_rows: list[dict[str, Any]],
+    endpoint_rows: dict[str, list[dict[str, Any]]],
+) -> None:
+    """RAW archive + CORE fixtures/details for one verified batch, in one transaction (blocking)."""
+    # Clear the verification flag in the same write as the fresh fixture data.
+    verified_at = datetime.now(timezone.utc)
+    for row in fixtures_rows:
+        row["needs_score_verification"] = False
+        row["verification_state"] = "verified"
+        row["verification_attempt_count"] = 0
+        row["verification_last_attempt_at"] = verified_at
+
+    with get_transaction() as conn:
+        upsert_raw(**raw_kwargs, conn=conn)
+        upsert_core(
+            full_table_name="core.fixtures",
+            rows=fixtures_rows,
+            conflict_cols=["id"],
+            update_cols=[
+                "league_id",
+                "season",
+                "round",
+                "date",
+                "api_timestamp",
+                "referee",
+                "timezone",
+                "venue_id",
+                "home_team_id",
+                "away_team_id",
+                "status_short",
+                "status_long",
+                "elapsed",
+                "goals_home",
+                "goals_away",
+                "score",
+                "needs_score_verification",
+                "verification_state",
+                "verification_attempt_count",
+                "verification_last_attempt_at",
+            ],
+            conn=conn,
+        )
+        # /fixtures?ids= already embeds events/lineups/statistics/players for the whole
+        # batch; persist them instead of discarding (no extra API calls).
+        if details_rows:
+            upsert_core(
+                full_table_name="core.fixture_details",
+                rows=details_rows,
+                conflict_cols=["fixture_id"],
+                update_cols=["events", "lineups", "statistics", "players"],
+                conn=conn,
+            )
+        # Same blocks into the per-endpoint tables, so the detail fetch can skip those endpoints.
+        for endpoint, _transform_fn, table, conflict_cols, update_cols in _DETAIL_ENDPOINT_SPECS:
+            if endpoint_rows.get(endpoint):
+                upsert_core(
+                    full_table_name=table,
+                    rows=endpoint_rows[endpoint],
+                    conflict_cols=conflict_cols,
+                    update_cols=update_cols,
+                    conn=conn,
+                )
+        conn.commit()
 
 
 async def run_auto_finish_verification(
@@ -286,18 +481,28 @@ async def run_auto_finish_verification(
     - Set needs_score_verification = FALSE on success
     - Only runs when daily_remaining >= min_daily_quota (quota guard)
     """
+    # Quota guard: only run when quota is healthy (one limiter snapshot; the property takes a lock)
+    daily_remaining = limiter.quota.daily_remaining
+
+    # No configured min_daily_quota can be below the floor: bail before parsing config or touching the DB.
+    if daily_remaining is not None and daily_remaining < _MIN_DAILY_QUOTA_FLOOR:
+        logger.info(
+            "auto_finish_verification_quota_guard",
+            daily_remaining=daily_remaining,
+            min_required=_MIN_DAILY_QUOTA_FLOOR,
+        )
+        return
+
     cfg = _load_config(config_path)
 
-    # Quota guard: only run when quota is healthy
-    quota = limiter.quota
-    if quota.daily_remaining is None:
+    if daily_remaining is None:
         # Prime quota from free /status endpoint (does NOT count toward quota).
         # This avoids crashing manual runs where limiter hasn't seen any headers yet.
         try:
             limiter.acquire_token()
             status_res = await client.get("/status")
             limiter.update_from_headers(status_res.headers)
-            quota = limiter.quota
+            daily_remaining = limiter.quota.daily_remaining
         except Exception as e:
             logger.warning(
                 "auto_finish_verification_quota_unknown",
@@ -306,7 +511,7 @@ async def run_auto_finish_verification(
             )
             return
 
-    if quota.daily_remaining is None:
+    if daily_remaining is None:
         logger.info(
             "auto_finish_verification_quota_unknown",
             daily_remaining=None,
@@ -314,10 +519,10 @@ async def run_auto_finish_verification(
         )
         return
 
-    if quota.daily_remaining < cfg.min_daily_quota:
+    if daily_remaining < cfg.min_daily_quota:
         logger.info(
             "auto_finish_verification_quota_guard",
-            daily_remaining=quota.daily_remaining,
+            daily_remaining=daily_remaining,
             min_required=cfg.min_daily_quota,
         )
         return
@@ -334,7 +539,7 @@ async def run_auto_finish_verification(
 
     verification_ids = _select_verification_fixture_ids(
         limit=cfg.max_fixtures_per_run,
-        tracked_league_ids=cfg.scoped_league_ids,
+        tracked_league_ids=cfg.scoped_league_ids_list,
     )
 
     if not verification_ids:
@@ -348,258 +553,228 @@ async def run_auto_finish_verification(
     fixtures_verified = 0
     details_fetched_count = 0
     details_endpoints_fetched = 0
-
-    for batch in _chunk(verification_ids, size=cfg.batch_size):
-        ids_param = "-".join(str(int(x)) for x in batch)
+    details_endpoints_embedded = 0
+    details_stop = asyncio.Event()
+    # (league, season) -> (team ids, venue ids) ensured so far this run. A later batch only
+    # re-runs ensure_fixtures_dependencies when it references a team or venue not yet covered.
+    ensured: dict[tuple[int, int], tuple[set[int], set[int]]] = {}
+    # Standalone RAW archive writes (early-exit paths) run in the background; awaited before completion.
+    raw_tasks: list[asyncio.Task[int]] = []
+    raw_slots = asyncio.Semaphore(_RAW_ARCHIVE_CONCURRENCY)
+
+    async def _archive_raw(raw_kwargs: dict[str, Any]) -> int:
+        async with raw_slots:
+            return await asyncio.to_thread(upsert_raw, **raw_kwargs)
+
+    async def _fetch_batch(batch: list[int]) -> tuple[dict[str, Any], APIResult, dict[str, Any]]:
+        # ids are already ints (_select_verification_fixture_ids casts them)
+        ids_param = "-".join([str(x) for x in batch])
         params = {"ids": ids_param}
-        label = f"/fixtures(ids={ids_param})"
-
-        try:
-            res, env = await _safe_get_envelope(
-                client=client,
-                limiter=limiter,
-                endpoint="/fixtures",
-                params=params,
-                label=label,
-            )
-            total_requests += 1
-        except EmergencyStopError as e:
-            logger.error("emergency_stop_daily_quota_low", job="auto_finish_verification", err=str(e))
-            break
-        except RateLimitError as e:
-            logger.warning("api_rate_limited_429", job="auto_finish_verification", err=str(e), sleep_seconds=5)
-            await asyncio.sleep(5)
-            continue
-        except (APIClientError, RuntimeError) as e:
-            logger.error("auto_finish_verification_api_failed", err=str(e), ids=len(batch))
-            continue
-
-        upsert_raw(
+        res, env = await _safe_get_envelope(
+            client=client,
+            limiter=limiter,
             endpoint="/fixtures",
-            requested_params=params,
-            status_code=res.status_code,
-            response_headers=res.headers,
-            body=env,
-        )
-
-        # Log batch fetch result for observability
-        response_count = len(env.get("response") or [])
-        logger.info(
-            "auto_finish_verification_batch_fetched",
-            fixture_ids=batch,
-            response_count=response_count,
-            api_status_code=res.status_code,
+            params=params,
+            label_factory=lambda: f"/fixtures(ids={ids_param})",
         )
+        return params, res, env
 
-        # Ensure dependencies exist (FK integrity) grouped per league+season
-        try:
-            grouped: dict[tuple[int, int], list[dict[str, Any]]] = {}
-            for it in env.get("response") or []:
-                try:
-                    lid = int((it.get("league") or {}).get("id") or -1)
-                    s = int((it.get("league") or {}).get("season") or 0)
-                except Exception:
-                    continue
-                if lid > 0 and s > 0:
-                    grouped.setdefault((lid, s), []).append(it)
-
-            for (lid, s), items in sorted(grouped.items(), key=lambda x: (x[0][0], x[0][1])):
-                await ensure_fixtures_dependencies(
-                    league_id=lid,
-                    season=s,
-                    fixtures_envelope={**env, "response": items},
-                    client=client,
-                    limiter=limiter,
-                    log_venues=False,
-                )
-        except Exception as e:
-            logger.error("auto_finish_verification_dependency_failed", err=str(e), ids=len(batch))
-            continue
+    # Two-stage pipeline: batch N+1's request is in flight while batch N is transformed and written.
+    batches = _chunk(verification_ids, size=cfg.batch_size)
+    next_batch = next(batches, None)
+    next_fetch = asyncio.create_task(_fetch_batch(next_batch)) if next_batch is not None else None
 
-        fixtures_rows, _ = transform_fixtures(env)
+    try:
+        while next_batch is not None and next_fetch is not None:
+            batch, fetch = next_batch, next_fetch
+            next_batch = next(batches, None)
+            next_fetch = asyncio.create_task(_fetch_batch(next_batch)) if next_batch is not None else None
 
-        # Detect IDs that were requested but not returned by the API.
-        # This happens in practice (200 OK but response omits some fixture IDs).
-        try:
-            returned_ids: set[int] = set()
-            for it in env.get("response") or []:
-                fx = (it.get("fixture") or {}) if isinstance(it, dict) else {}
-                fid = fx.get("id")
-                if fid is None:
-                    continue
-                returned_ids.add(int(fid))
-            requested_ids = {int(x) for x in batch}
-            missing_from_response = sorted(requested_ids - returned_ids)
-        except Exception:
-            missing_from_response = []
-
-        if missing_from_response:
-            logger.warning(
-                "auto_finish_verification_missing_ids_in_response",
-                requested_ids=batch,
-                missing_ids=missing_from_response,
-                response_count=len(env.get("response") or []),
-            )
             try:
-                max_attempts = int(os.getenv("VERIFICATION_MAX_ATTEMPTS", "3"))
-                _record_verification_attempt(fixture_ids=missing_from_response)
-
-                # If missing IDs hit max attempts, mark them not_found (same policy as empty response)
-                with get_transaction() as conn:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            SELECT id
-                            FROM core.fixtures
-                            WHERE id = ANY(%s)
-                              AND COALESCE(verification_attempt_count, 0) >= %s
-                              AND COALESCE(verification_state, 'pending') = 'pending'
-                            """,
-                            (missing_from_response, int(max_attempts)),
-                        )
-                        hit = [int(r[0]) for r in cur.fetchall()]
-                    conn.commit()
-                if hit:
-                    _mark_not_found(fixture_ids=hit)
-                    logger.info(
-                        "auto_finish_verification_marked_not_found",
-                        fixture_ids=hit,
-                        reason="missing_from_response_max_attempts",
-                        max_attempts=int(max_attempts),
-                    )
-            except Exception as e:
-                logger.error("auto_finish_verification_missing_ids_attempt_track_failed", missing_ids=missing_from_response, err=str(e))
+                params, res, env = await fetch
+                total_requests += 1
+            except EmergencyStopError as e:
+                logger.error("emergency_stop_daily_quota_low", job="auto_finish_verification", err=str(e))
+                break
+            except RateLimitError as e:
+                logger.warning("api_rate_limited_429", job="auto_finish_verification", err=str(e), sleep_seconds=5)
+                await asyncio.sleep(5)
+                continue
+            except (APIClientError, RuntimeError) as e:
+                logger.error("auto_finish_verification_api_failed", err=str(e), ids=len(batch))
+                continue
 
-        # Handle empty response (fixture not found in API or invalid)
-        if not fixtures_rows:
+            # RAW is archived in the same transaction as the CORE upsert on the success path;
+            # early-exit paths below archive it on its own, off the critical path.
+            raw_kwargs: dict[str, Any] = {
+                "endpoint": "/fixtures",
+                "requested_params": params,
+                "status_code": res.status_code,
+                "response_headers": res.headers,
+                "body": env,
+            }
+
+            # Log batch fetch result for observability
             response_count = len(env.get("response") or [])
-            logger.warning(
-                "auto_finish_verification_empty_response",
+            logger.info(
+                "auto_finish_verification_batch_fetched",
                 fixture_ids=batch,
                 response_count=response_count,
                 api_status_code=res.status_code,
             )
-            # Attempt tracking + not_found transition
+
+            # Ensure dependencies exist (FK integrity) grouped per league+season
             try:
-                max_attempts = int(os.getenv("VERIFICATION_MAX_ATTEMPTS", "3"))
-                _record_verification_attempt(fixture_ids=batch)
-
-                # Check which fixtures have hit max attempts -> mark not_found and clear flag
-                with get_transaction() as conn:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            SELECT id
-                            FROM core.fixtures
-                            WHERE id = ANY(%s)
-                              AND COALESCE(verification_attempt_count, 0) >= %s
-                              AND COALESCE(verification_state, 'pending') = 'pending'
-                            """,
-                            (batch, int(max_attempts)),
-                        )
-                        hit = [int(r[0]) for r in cur.fetchall()]
-                    conn.commit()
-                if hit:
-                    _mark_not_found(fixture_ids=hit)
-                    logger.info(
-                        "auto_finish_verification_marked_not_found",
-                        fixture_ids=hit,
-                        reason="empty_response_max_attempts",
-                        max_attempts=int(max_attempts),
+                grouped: dict[tuple[int, int], list[dict[str, Any]]] = {}
+                for it in env.get("response") or []:
+                    try:
+                        lid = int((it.get("league") or {}).get("id") or -1)
+                        s = int((it.get("league") or {}).get("season") or 0)
+                    except Exception:
+                        continue
+                    if lid > 0 and s > 0:
+                        grouped.setdefault((lid, s), []).append(it)
+
+                for (lid, s), items in sorted(grouped.items(), key=lambda x: (x[0][0], x[0][1])):
+                    # ensure_fixtures_dependencies only reads "response"; no need to copy the envelope
+                    group_env = {"response": items}
+                    team_ids = _extract_team_ids_from_fixtures_envelope(group_env)
+                    venue_ids = {int(v["id"]) for v in _extract_venue_rows_from_fixtures_envelope(group_env)}
+                    prev = ensured.get((lid, s))
+                    if prev is not None and team_ids <= prev[0] and venue_ids <= prev[1]:
+                        # League, teams and venues already ensured earlier in this run
+                        continue
+                    await ensure_fixtures_dependencies(
+                        league_id=lid,
+                        season=s,
+                        fixtures_envelope=group_env,
+                        client=client,
+                        limiter=limiter,
+                        log_venues=False,
                     )
-                else:
-                    logger.info(
-                        "auto_finish_verification_attempt_tracked",
-                        fixture_ids=batch,
-                        reason="empty_response_attempt_recorded",
+                    ensured[(lid, s)] = (
+                        team_ids | (prev[0] if prev else set()),
+                        venue_ids | (prev[1] if prev else set()),
                     )
             except Exception as e:
-                logger.error("auto_finish_verification_empty_response_handling_failed", fixture_ids=batch, err=str(e))
-            continue
+                logger.error("auto_finish_verification_dependency_failed", err=str(e), ids=len(batch))
+                raw_tasks.append(asyncio.create_task(_archive_raw(raw_kwargs)))
+                continue
 
-        try:
-            with get_transaction() as conn:
-                upsert_core(
-                    full_table_name="core.fixtures",
-                    rows=fixtures_rows,
-                    conflict_cols=["id"],
-                    update_cols=[
-                        "league_id",
-                        "season",
-                        "round",
-                        "date",
-                        "api_timestamp",
-                        "referee",
-                        "timezone",
-                        "venue_id",
-                        "home_team_id",
-                        "away_team_id",
-                        "status_short",
-                        "status_long",
-                        "elapsed",
-                        "goals_home",
-                        "goals_away",
-                        "score",
-                    ],
-                    conn=conn,
+            # CPU-bound reshaping off the event loop (overlaps with the in-flight next batch).
+            try:
+                fixtures_rows, details_rows = await asyncio.to_thread(transform_fixtures, env)
+                endpoint_rows, embedded = await asyncio.to_thread(_embedded_endpoint_rows, env)
+            except Exception as e:
+                # Keep the payload that failed to parse in RAW for inspection / replay.
+                logger.error("auto_finish_verification_transform_failed", err=str(e), ids=len(batch))
+                raw_tasks.append(asyncio.create_task(_archive_raw(raw_kwargs)))
+                continue
+
+            # Detect IDs that were requested but not returned by the API.
+            # This happens in practice (200 OK but response omits some fixture IDs).
+            try:
+                returned_ids: set[int] = set()
+                for it in env.get("response") or []:
+                    fx = (it.get("fixture") or {}) if isinstance(it, dict) else {}
+                    fid = fx.get("id")
+                    if fid is None:
+                        continue
+                    returned_ids.add(int(fid))
+                requested_ids = {int(x) for x in batch}
+                missing_from_response = sorted(requested_ids - returned_ids)
+            except Exception:
+                missing_from_response = []
+
+            if missing_from_response:
+                logger.warning(
+                    "auto_finish_verification_missing_ids_in_response",
+                    requested_ids=batch,
+                    missing_ids=missing_from_response,
+                    response_count=len(env.get("response") or []),
                 )
-                # Set needs_score_verification = FALSE for successfully verified fixtures
-                verified_ids = [row["id"] for row in fixtures_rows]
-                if verified_ids:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            """
-                            UPDATE core.fixtures
-                            SET needs_score_verification = FALSE,
-                                verification_state = 'verified',
-                                verification_attempt_count = 0,
-                                verification_last_attempt_at = NOW()
-                            WHERE id = ANY(%s)
-                            """,
-                            (verified_ids,),
+                try:
+                    # Attempt tracking; missing IDs that hit max attempts become not_found
+                    # (same policy as empty response).
+                    hit = _record_verification_attempt(fixture_ids=missing_from_response, max_attempts=max_attempts)
+                    if hit:
+                        logger.info(
+                            "auto_finish_verification_marked_not_found",
+                            fixture_ids=hit,
+                            reason="missing_from_response_max_attempts",
+                            max_attempts=int(max_attempts),
                         )
-                conn.commit()
-            fixtures_verified += len(fixtures_rows)
-
-            # Fetch details for verified fixtures (missing OR stale endpoints)
-            verified_fixture_ids = [row["id"] for row in fixtures_rows]
-            for fixture_id in verified_fixture_ids:
+                except Exception as e:
+                    logger.error("auto_finish_verification_missing_ids_attempt_track_failed", missing_ids=missing_from_response, err=str(e))
+
+            # Handle empty response (fixture not found in API or invalid)
+            if not fixtures_rows:
+                raw_tasks.append(asyncio.create_task(_archive_raw(raw_kwargs)))
+                response_count = len(env.get("response") or [])
+                logger.warning(
+                    "auto_finish_verification_empty_response",
+                    fixture_ids=batch,
+                    response_count=response_count,
+                    api_status_code=res.status_code,
+                )
+                # Attempt tracking + not_found transition
                 try:
-                    # Check which endpoints are missing or stale before fetching
-                    missing_or_stale = _missing_or_stale_detail_endpoints_for_fixture(
-                        fixture_id=fixture_id,
-                        stale_minutes=int(os.getenv("FIXTURE_DETAILS_STALE_MINUTES", "15")),
-                    )
-                    if not missing_or_stale:
-                        # All endpoints present and fresh, skip
-                        continue
-
-                    # _fetch_and_store_fixture_details already checks and skips if nothing to do
-                    await _fetch_and_store_fixture_details(
-                        client=client,
-                        limiter=limiter,
-                        fixture_id=fixture_id,
-                    )
-                    # Count fixtures that had details fetched (at least one endpoint was missing/stale)
-                    details_fetched_count += 1
-                    # Count exact number of endpoints fetched
-                    details_endpoints_fetched += len(missing_or_stale)
-                except EmergencyStopError:
-                    # Quota exhausted, stop processing
-                    raise
+                    # Fixtures that hit max attempts -> marked not_found and flag cleared
+                    hit = _record_verification_attempt(fixture_ids=batch, max_attempts=max_attempts)
+                    if hit:
+                        logger.info(
+                            "auto_finish_verification_marked_not_found",
+                            fixture_ids=hit,
+                            reason="empty_response_max_attempts",
+                            max_attempts=int(max_attempts),
+                        )
+                    else:
+                        logger.info(
+                            "auto_finish_verification_attempt_tracked",
+                            fixture_ids=batch,
+                            reason="empty_response_attempt_recorded",
+                        )
                 except Exception as e:
-                    # Details fetch failed, but verification succeeded
-                    # Log warning but don't fail the verification
-                    logger.warning(
-                        "auto_finish_verification_details_fetch_failed",
-                        fixture_id=fixture_id,
-                        err=str(e),
-                    )
-                    continue
+                    logger.error("auto_finish_verification_empty_response_handling_failed", fixture_ids=batch, err=str(e))
+                continue
 
-        except Exception as e:
-            logger.error("auto_finish_verification_db_failed", err=str(e), ids=len(batch))
-            continue
+            try:
+                await asyncio.to_thread(
+                    _store_verified_batch,
+                    raw_kwargs=raw_kwargs,
+                    fixtures_rows=fixtures_rows,
+                    details_rows=details_rows,
+                    endpoint_rows=endpoint_rows,
+                )
+                fixtures_verified += len(fixtures_rows)
+                details_endpoints_embedded += sum(len(eps) for eps in embedded.values())
+            except Exception as e:
+                logger.error("auto_finish_verification_db_failed", err=str(e), ids=len(batch))
+                continue
+
+            # Fetch details for verified fixtures (missing OR stale endpoints)
+            fetched, endpoints_fetched = await _fetch_details_for_verified(
+                client=client,
+                limiter=limiter,
+                fixture_ids=[row["id"] for row in fixtures_rows],
+                concurrency=cfg.detail_concurrency,
+                stop=details_stop,
+                embedded=embedded,
+            )
+            details_fetched_count += fetched
+            details_endpoints_fetched += endpoints_fetched
+            if details_stop.is_set():
+                logger.error("emergency_stop_daily_quota_low", job="auto_finish_verification", phase="details")
+                break
+    finally:
+        if next_fetch is not None:
+            # Loop stopped early (break or exception); don't spend quota on a batch that won't be processed.
+            next_fetch.cancel()
+            await asyncio.gather(next_fetch, return_exceptions=True)
+
+        for r in await asyncio.gather(*raw_tasks, return_exceptions=True):
+            if isinstance(r, BaseException):
+                logger.error("auto_finish_verification_raw_archive_failed", err=str(r))
 
     q = limiter.quota
     logger.info(
@@ -609,6 +784,7 @@ async def run_auto_finish_verification(
         fixtures_verified=fixtures_verified,
         details_fetched_count=details_fetched_count,
         details_endpoints_fetched=details_endpoints_fetched,
+        details_endpoints_embedded=details_endpoints_embedded,
         daily_remaining=q.daily_remaining,
         minute_remaining=q.minute_remaining,
     )
@@ -8,12 +8,12 @@ from pathlib import Path
 from typing import Any, Iterable
 
 import psycopg2.extras
-import yaml
 
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
 from src.transforms.fixtures import transform_fixtures
 from src.transforms.standings import transform_standings
+from src.utils.config import load_yaml_cached
 from src.utils.db import get_db_connection, get_transaction, query_scalar, upsert_core, upsert_raw
 from src.utils.logging import get_logger
 from src.utils.dependencies import (
@@ -39,7 +39,7 @@ class TrackedLeague:
 
 
 def _load_tracked_leagues(config_path: Path) -> list[TrackedLeague]:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     default_season = cfg.get("season")
     tracked = cfg.get("tracked_leagues") or []
     if not isinstance(tracked, list) or not tracked:
@@ -61,7 +61,7 @@ def _load_tracked_leagues(config_path: Path) -> list[TrackedLeague]:
 
 
 def _load_backfill_seasons(config_path: Path) -> list[int] | None:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     backfill = cfg.get("backfill") or {}
     seasons = backfill.get("seasons")
     if not isinstance(seasons, list) or not seasons:
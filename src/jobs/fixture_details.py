@@ -5,9 +5,7 @@ import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, Callable
 
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
@@ -17,6 +15,7 @@ from src.transforms.fixture_endpoints import (
     transform_fixture_players,
     transform_fixture_statistics,
 )
+from src.utils.config import load_yaml_cached
 from src.utils.db import get_db_connection, upsert_core, upsert_mart_coverage, upsert_raw
 from src.utils.logging import get_logger
 
@@ -24,8 +23,21 @@ from src.utils.logging import get_logger
 logger = get_logger(component="jobs_fixture_details")
 
 
-FINAL_STATUSES = {"FT", "AET", "PEN"}
+FINAL_STATUSES = frozenset({"FT", "AET", "PEN"})
+# SQL ANY(%s) parameter, built once (sorted for a stable statement text).
+_FINAL_STATUSES_LIST = sorted(FINAL_STATUSES)
 DETAIL_ENDPOINTS = ("/fixtures/players", "/fixtures/events", "/fixtures/statistics", "/fixtures/lineups")
+# (endpoint, transform, CORE table, conflict cols, update cols) for each per-fixture detail endpoint.
+_DETAIL_ENDPOINT_SPECS: tuple[tuple[str, Callable[..., list[dict[str, Any]]], str, list[str], list[str]], ...] = (
+    ("/fixtures/players", transform_fixture_players, "core.fixture_players", ["fixture_id", "team_id", "player_id"], ["player_name", "statistics", "update_utc"]),
+    ("/fixtures/events", transform_fixture_events, "core.fixture_events", ["fixture_id", "event_key"], ["time_elapsed", "time_extra", "team_id", "player_id", "assist_id", "type", "detail", "comments", "raw"]),
+    ("/fixtures/statistics", transform_fixture_statistics, "core.fixture_statistics", ["fixture_id", "team_id"], ["statistics", "update_utc"]),
+    ("/fixtures/lineups", transform_fixture_lineups, "core.fixture_lineups", ["fixture_id", "team_id"], ["formation", "start_xi", "substitutes", "coach", "colors"]),
+)
+
+# Coverage queries run in worker threads, each holding one pooled connection while it runs.
+# Stay below utils.db.POOL_MAXCONN so concurrent jobs still get a connection.
+_COVERAGE_CONCURRENCY = 3
 
 
 @dataclass(frozen=True)
@@ -49,7 +61,7 @@ def _daily_config_path_default() -> Path:
 
 
 def _load_tracked_league_ids(*, config_path: Path) -> set[int]:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     tracked = cfg.get("tracked_leagues") or []
     out: set[int] = set()
     if isinstance(tracked, list):
@@ -72,7 +84,7 @@ def _load_tracked_league_seasons(*, config_path: Path) -> list[tuple[int, int]]:
     Load tracked (league_id, season) pairs from daily config.
     Required for season-accurate backfills (do NOT cross-product league_ids x seasons).
     """
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     tracked = cfg.get("tracked_leagues") or []
     pairs: list[tuple[int, int]] = []
     if isinstance(tracked, list):
@@ -110,7 +122,8 @@ async def _safe_get_envelope(
 ) -> tuple[APIResult, dict[str, Any]]:
     backoff = 2.0
     for attempt in range(max_retries):
-        limiter.acquire_token()
+        # acquire_token() may sleep: keep it off the event loop so concurrent fetches progress.
+        await asyncio.to_thread(limiter.acquire_token)
         res = await client.get(endpoint, params=params)
         limiter.update_from_headers(res.headers)
         env = res.data or {}
@@ -141,37 +154,48 @@ def _missing_or_stale_detail_endpoints_for_fixture(
     This prevents kısmi/boş response'ların kalıcı hale gelmesini engeller
     (ör. 200 + empty response durumları).
     """
+    by_fixture = _missing_or_stale_detail_endpoints_bulk(fixture_ids=[int(fixture_id)], stale_minutes=stale_minutes)
+    return by_fixture.get(int(fixture_id), set())
+
+
+def _missing_or_stale_detail_endpoints_bulk(
+    *, fixture_ids: list[int], stale_minutes: int = 15
+) -> dict[int, set[str]]:
+    """
+    Batch form of `_missing_or_stale_detail_endpoints_for_fixture`: one RAW query for all ids.
+
+    Returns {fixture_id: missing_or_stale_endpoints} with an entry for every requested id
+    (an empty set means all detail endpoints are present and fresh).
+    """
+    if not fixture_ids:
+        return {}
     sql = """
-    SELECT r.endpoint, MAX(r.fetched_at) AS last_fetch
+    SELECT (r.requested_params->>'fixture')::bigint AS fixture_id, r.endpoint, MAX(r.fetched_at) AS last_fetch
     FROM raw.api_responses r
     WHERE r.endpoint = ANY(%s)
-      AND (r.requested_params->>'fixture')::bigint = %s
-    GROUP BY r.endpoint
+      AND (r.requested_params->>'fixture')::bigint = ANY(%s)
+    GROUP BY 1, 2
     """
-    now = _utc_now()
-    stale_cutoff = now - timedelta(minutes=int(stale_minutes))
-    stale: set[str] = set()
+    ids = [int(x) for x in fixture_ids]
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, (list(DETAIL_ENDPOINTS), int(fixture_id)))
+            cur.execute(sql, (list(DETAIL_ENDPOINTS), ids))
             rows = cur.fetchall()
         conn.commit()
-    # Build lookup of endpoint -> last_fetch
-    last_fetch: dict[str, datetime | None] = {str(ep): ts for ep, ts in rows}
-
-    for ep in DETAIL_ENDPOINTS:
-        lf = last_fetch.get(ep)
-        if lf is None:
-            stale.add(ep)  # missing
-            continue
-        try:
-            lf_dt = lf if isinstance(lf, datetime) else None
-        except Exception:
-            lf_dt = None
-        if lf_dt is None or lf_dt < stale_cutoff:
-            stale.add(ep)
-
-    return stale
+    # Build lookup of (fixture_id, endpoint) -> last_fetch
+    last_fetch: dict[tuple[int, str], datetime | None] = {(int(fid), str(ep)): ts for fid, ep, ts in rows}
+
+    stale_cutoff = _utc_now() - timedelta(minutes=int(stale_minutes))
+    out: dict[int, set[str]] = {}
+    for fid in ids:
+        stale: set[str] = set()
+        for ep in DETAIL_ENDPOINTS:
+            lf = last_fetch.get((fid, ep))
+            # Missing RAW row, or last fetch older than the stale window
+            if not isinstance(lf, datetime) or lf < stale_cutoff:
+                stale.add(ep)
+        out[fid] = stale
+    return out
 
 
 def _select_backfill_fixtures(*, days: int, limit: int, config_path: Path) -> list[FixtureWorkItem]:
@@ -198,7 +222,7 @@ def _select_backfill_fixtures(*, days: int, limit: int, config_path: Path) -> li
     with get_db_connection() as conn:
         with conn.cursor() as cur:
             tracked = sorted(_load_tracked_league_ids(config_path=config_path))
-            cur.execute(sql, (int(days), list(FINAL_STATUSES), tracked, int(limit)))
+            cur.execute(sql, (int(days), _FINAL_STATUSES_LIST, tracked, int(limit)))
             for fid, dt, st in cur.fetchall():
                 out.append(FixtureWorkItem(fixture_id=int(fid), date_utc=dt, status_short=st))
         conn.commit()
@@ -262,7 +286,7 @@ def _select_season_backfill_fixtures(*, limit: int, config_path: Path) -> list[F
     out: list[FixtureWorkItem] = []
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, tuple(flat + [list(FINAL_STATUSES), int(limit)]))
+            cur.execute(sql, tuple(flat + [_FINAL_STATUSES_LIST, int(limit)]))
             for fid, dt, st in cur.fetchall():
                 out.append(FixtureWorkItem(fixture_id=int(fid), date_utc=dt, status_short=st))
         conn.commit()
@@ -289,7 +313,7 @@ def _select_recent_finalize_fixtures(*, hours: int, limit: int, config_path: Pat
     with get_db_connection() as conn:
         with conn.cursor() as cur:
             tracked = sorted(_load_tracked_league_ids(config_path=config_path))
-            cur.execute(sql, (int(hours), list(FINAL_STATUSES), tracked, int(limit)))
+            cur.execute(sql, (int(hours), _FINAL_STATUSES_LIST, tracked, int(limit)))
             for fid, dt, st in cur.fetchall():
                 out.append(FixtureWorkItem(fixture_id=int(fid), date_utc=dt, status_short=st))
         conn.commit()
@@ -322,36 +346,37 @@ def _select_today_lineups_window(*, lookback_hours: int, lookahead_hours: int, l
     with get_db_connection() as conn:
         with conn.cursor() as cur:
             tracked = sorted(_load_tracked_league_ids(config_path=config_path))
-            cur.execute(sql, (int(lookback_hours), int(lookahead_hours), list(FINAL_STATUSES), tracked, int(limit)))
+            cur.execute(sql, (int(lookback_hours), int(lookahead_hours), _FINAL_STATUSES_LIST, tracked, int(limit)))
             for fid, dt, st in cur.fetchall():
                 out.append(FixtureWorkItem(fixture_id=int(fid), date_utc=dt, status_short=st))
         conn.commit()
     return out
 
 
-async def _fetch_and_store_fixture_details(*, client: APIClient, limiter: RateLimiter, fixture_id: int) -> None:
+async def _fetch_and_store_fixture_details(
+    *, client: APIClient, limiter: RateLimiter, fixture_id: int, endpoints: set[str] | None = None
+) -> None:
     """
     For a fixture, fetch and persist all four per-fixture endpoints:
     - /fixtures/players
     - /fixtures/events
     - /fixtures/statistics
     - /fixtures/lineups
+
+    `endpoints` restricts the fetch to a set the caller already knows is missing/stale
+    (skips the per-fixture RAW freshness query).
     """
-    # Force refresh if data missing OR stale (last fetch older than stale_minutes).
-    missing_or_stale = _missing_or_stale_detail_endpoints_for_fixture(
-        fixture_id=int(fixture_id), stale_minutes=int(os.getenv("FIXTURE_DETAILS_STALE_MINUTES", "15"))
-    )
+    if endpoints is None:
+        # Force refresh if data missing OR stale (last fetch older than stale_minutes).
+        missing_or_stale = _missing_or_stale_detail_endpoints_for_fixture(
+            fixture_id=int(fixture_id), stale_minutes=int(os.getenv("FIXTURE_DETAILS_STALE_MINUTES", "15"))
+        )
+    else:
+        missing_or_stale = set(endpoints)
     if not missing_or_stale:
         return
 
-    endpoints = [
-        ("/fixtures/players", transform_fixture_players, "core.fixture_players", ["fixture_id", "team_id", "player_id"], ["player_name", "statistics", "update_utc"]),
-        ("/fixtures/events", transform_fixture_events, "core.fixture_events", ["fixture_id", "event_key"], ["time_elapsed", "time_extra", "team_id", "player_id", "assist_id", "type", "detail", "comments", "raw"]),
-        ("/fixtures/statistics", transform_fixture_statistics, "core.fixture_statistics", ["fixture_id", "team_id"], ["statistics", "update_utc"]),
-        ("/fixtures/lineups", transform_fixture_lineups, "core.fixture_lineups", ["fixture_id", "team_id"], ["formation", "start_xi", "substitutes", "coach", "colors"]),
-    ]
-
-    for endpoint, transform_fn, table, conflict_cols, update_cols in endpoints:
+    for endpoint, transform_fn, table, conflict_cols, update_cols in _DETAIL_ENDPOINT_SPECS:
         if endpoint not in missing_or_stale:
             continue
         params = {"fixture": int(fixture_id)}
@@ -429,7 +454,7 @@ async def run_fixture_details_backfill_90d(*, client: APIClient, limiter: RateLi
             break
 
     # MART coverage for league/seasons touched
-    _update_mart_coverage_for_fixtures(processed_fixture_ids=processed)
+    await _update_mart_coverage_for_fixtures(processed_fixture_ids=processed)
 
     logger.info(
         "fixture_details_backfill_90d_complete",
@@ -474,7 +499,7 @@ async def run_fixture_details_backfill_season(*, client: APIClient, limiter: Rat
             logger.error("emergency_stop_daily_quota_low", job="fixture_details_backfill_season", err=str(e))
             break
 
-    _update_mart_coverage_for_fixtures(processed_fixture_ids=processed)
+    await _update_mart_coverage_for_fixtures(processed_fixture_ids=processed)
     logger.info(
         "fixture_details_season_backfill_complete",
         fixtures_selected=len(items),
@@ -545,7 +570,7 @@ async def run_fixture_details_recent_finalize(*, client: APIClient, limiter: Rat
         ok_lineups += 1
         processed_lineups.append(int(it.fixture_id))
 
-    _update_mart_coverage_for_fixtures(processed_fixture_ids=list(set(processed_finalize + processed_lineups)))
+    await _update_mart_coverage_for_fixtures(processed_fixture_ids=list(set(processed_finalize + processed_lineups)))
 
     logger.info(
         "fixture_details_recent_finalize_complete",
@@ -559,7 +584,7 @@ async def run_fixture_details_recent_finalize(*, client: APIClient, limiter: Rat
     )
 
 
-def _update_mart_coverage_for_fixtures(*, processed_fixture_ids: list[int]) -> None:
+async def _update_mart_coverage_for_fixtures(*, processed_fixture_ids: list[int]) -> None:
     if not processed_fixture_ids:
         return
     league_seasons: list[tuple[int, int]] = []
@@ -600,17 +625,22 @@ def _update_mart_coverage_for_fixtures(*, processed_fixture_ids: list[int]) -> N
         ("/fixtures/lineups", "core.fixture_lineups"),
     ]
 
-    for league_id, season in league_seasons:
-        for endpoint, table in endpoint_map:
+    def _calc_and_upsert(league_id: int, season: int, endpoint: str, table: str) -> None:
+        cov = calc.calculate_fixture_endpoint_coverage(
+            league_id=league_id,
+            season=season,
+            endpoint=endpoint,
+            core_table=table,
+            days=90,
+        )
+        upsert_mart_coverage(coverage_data=cov.to_dict())
+
+    sem = asyncio.Semaphore(_COVERAGE_CONCURRENCY)
+
+    async def _one(league_id: int, season: int, endpoint: str, table: str) -> None:
+        async with sem:
             try:
-                cov = calc.calculate_fixture_endpoint_coverage(
-                    league_id=league_id,
-                    season=season,
-                    endpoint=endpoint,
-                    core_table=table,
-                    days=90,
-                )
-                upsert_mart_coverage(coverage_data=cov)
+                await asyncio.to_thread(_calc_and_upsert, league_id, season, endpoint, table)
             except Exception as e:
                 logger.warning(
                     "fixture_endpoint_coverage_update_failed",
@@ -620,4 +650,13 @@ def _update_mart_coverage_for_fixtures(*, processed_fixture_ids: list[int]) -> N
                     err=str(e),
                 )
 
+    # Independent COUNT(*) scans per league/endpoint: let Postgres serve a few at once.
+    await asyncio.gather(
+        *(
+            _one(league_id, season, endpoint, table)
+            for league_id, season in league_seasons
+            for endpoint, table in endpoint_map
+        )
+    )
+
 
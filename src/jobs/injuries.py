@@ -4,11 +4,10 @@ import asyncio
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
 from src.transforms.injuries import transform_injuries
+from src.utils.config import load_yaml_cached
 from src.utils.db import upsert_core, upsert_mart_coverage, upsert_raw
 from src.utils.logging import get_logger
 
@@ -17,7 +16,7 @@ logger = get_logger(component="jobs_injuries")
 
 
 def _load_tracked_leagues(config_path: Path) -> list[dict[str, Any]]:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     tracked = cfg.get("tracked_leagues") or []
     if not isinstance(tracked, list) or not tracked:
         raise ValueError(f"Missing tracked_leagues in {config_path}")
@@ -151,7 +150,7 @@ async def run_injuries_hourly(*, client: APIClient, limiter: RateLimiter, config
 
             calc = CoverageCalculator()
             cov = calc.calculate_injuries_coverage(league_id=league_id, season=season)
-            upsert_mart_coverage(coverage_data=cov)
+            upsert_mart_coverage(coverage_data=cov.to_dict())
         except Exception as e:
             logger.warning("injuries_coverage_update_failed", league_id=league_id, season=season, err=str(e))
 
@@ -4,10 +4,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from src.collector.api_client import APIClient, APIResult
 from src.collector.rate_limiter import RateLimiter
+from src.utils.config import load_yaml_cached
 from src.utils.db import upsert_raw
 from src.utils.logging import get_logger
 
@@ -48,7 +47,7 @@ def _extract_league_ids_from_leagues_response(env: dict[str, Any]) -> set[int]:
 
 
 def _load_tracked_leagues(config_path: Path) -> list[TrackedLeague]:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     tracked = cfg.get("tracked_leagues") or []
     out: list[TrackedLeague] = []
     if not isinstance(tracked, list):
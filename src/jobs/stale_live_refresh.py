@@ -6,11 +6,10 @@ import os
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
 from src.transforms.fixtures import transform_fixtures
+from src.utils.config import load_yaml_cached
 from src.utils.db import get_db_connection, get_transaction, upsert_core, upsert_raw
 from src.utils.dependencies import ensure_fixtures_dependencies
 from src.utils.logging import get_logger
@@ -52,7 +51,7 @@ def _load_daily_tracked_league_ids(cfg: dict[str, Any], *, config_path: Path) ->
 
 
 def _load_live_tracked_league_ids(*, live_config_path: Path) -> set[int]:
-    cfg = yaml.safe_load(live_config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(live_config_path)
     jobs = cfg.get("jobs") or []
     for j in jobs:
         if not isinstance(j, dict):
@@ -81,7 +80,7 @@ def _load_live_tracked_league_ids(*, live_config_path: Path) -> set[int]:
 
 
 def _load_config(config_path: Path) -> StaleRefreshConfig:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
 
     # Find job-specific params (config-driven).
     threshold = 30
@@ -6,11 +6,10 @@ from datetime import timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
 from src.transforms.fixtures import transform_fixtures
+from src.utils.config import load_yaml_cached
 from src.utils.db import get_db_connection, get_transaction, upsert_core, upsert_raw
 from src.utils.dependencies import ensure_fixtures_dependencies
 from src.utils.logging import get_logger
@@ -54,7 +53,7 @@ def _load_daily_tracked_league_ids(cfg: dict[str, Any], *, config_path: Path) ->
 
 
 def _load_config(config_path: Path) -> StaleScheduledConfig:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
 
     # defaults (safe + conservative)
     threshold = 180  # 3 hours after scheduled kickoff window, treat NS/TBD as stale
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Set
 from typing import Any
 
 from src.collector.api_client import APIClient, APIResult
@@ -50,7 +51,7 @@ async def run_bootstrap_timezones(*, client: APIClient, limiter: RateLimiter) ->
     logger.info("bootstrap_timezones_complete", rows=len(rows))
 
 
-async def run_bootstrap_leagues(*, client: APIClient, limiter: RateLimiter, season: int, tracked_leagues: set[int]) -> None:
+async def run_bootstrap_leagues(*, client: APIClient, limiter: RateLimiter, season: int, tracked_leagues: Set[int]) -> None:
     res = await _fetch_and_store(client=client, limiter=limiter, endpoint="/leagues", params={"season": int(season)})
     rows = transform_leagues(res.data or {}, tracked_league_ids=tracked_leagues)
     upsert_core(
@@ -62,7 +63,7 @@ async def run_bootstrap_leagues(*, client: APIClient, limiter: RateLimiter, seas
     logger.info("bootstrap_leagues_complete", season=int(season), tracked_leagues=sorted(tracked_leagues), rows=len(rows))
 
 
-async def run_bootstrap_teams(*, client: APIClient, limiter: RateLimiter, season: int, tracked_leagues: set[int]) -> None:
+async def run_bootstrap_teams(*, client: APIClient, limiter: RateLimiter, season: int, tracked_leagues: Set[int]) -> None:
     total_teams = 0
     total_venues = 0
     for league_id in sorted(tracked_leagues):
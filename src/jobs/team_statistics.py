@@ -6,11 +6,11 @@ from pathlib import Path
 from typing import Any
 
 import psycopg2.extras
-import yaml
 
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
 from src.transforms.team_statistics import transform_team_statistics
+from src.utils.config import load_yaml_cached
 from src.utils.db import get_db_connection, upsert_core, upsert_mart_coverage, upsert_raw
 from src.utils.logging import get_logger
 from src.utils.scope_policy import filter_tracked_leagues_for_endpoint, get_league_types_map
@@ -20,7 +20,7 @@ logger = get_logger(component="jobs_team_statistics")
 
 
 def _load_tracked_leagues(config_path: Path) -> list[dict[str, Any]]:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     tracked = cfg.get("tracked_leagues") or []
     if not isinstance(tracked, list) or not tracked:
         raise ValueError(f"Missing tracked_leagues in {config_path}")
@@ -280,7 +280,7 @@ async def run_team_statistics_refresh(*, client: APIClient, limiter: RateLimiter
 
             calc = CoverageCalculator()
             cov = calc.calculate_team_statistics_coverage(league_id=league_id, season=season)
-            upsert_mart_coverage(coverage_data=cov)
+            upsert_mart_coverage(coverage_data=cov.to_dict())
         except Exception as e:
             logger.warning("team_statistics_coverage_update_failed", league_id=league_id, season=season, err=str(e))
 
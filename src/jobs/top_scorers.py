@@ -4,11 +4,10 @@ import asyncio
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import EmergencyStopError, RateLimiter
 from src.transforms.top_scorers import transform_top_scorers
+from src.utils.config import load_yaml_cached
 from src.utils.db import upsert_core, upsert_mart_coverage, upsert_raw
 from src.utils.logging import get_logger
 from src.utils.scope_policy import filter_tracked_leagues_for_endpoint, get_league_types_map
@@ -18,7 +17,7 @@ logger = get_logger(component="jobs_top_scorers")
 
 
 def _load_tracked_leagues(config_path: Path) -> list[dict[str, Any]]:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     tracked = cfg.get("tracked_leagues") or []
     if not isinstance(tracked, list) or not tracked:
         raise ValueError(f"Missing tracked_leagues in {config_path}")
@@ -155,7 +154,7 @@ async def run_top_scorers_daily(*, client: APIClient, limiter: RateLimiter, conf
 
             calc = CoverageCalculator()
             cov = calc.calculate_top_scorers_coverage(league_id=league_id, season=season)
-            upsert_mart_coverage(coverage_data=cov)
+            upsert_mart_coverage(coverage_data=cov.to_dict())
         except Exception as e:
             logger.warning("top_scorers_coverage_update_failed", league_id=league_id, season=season, err=str(e))
 
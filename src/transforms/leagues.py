@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Set
 from typing import Any
 
 from pydantic import BaseModel
@@ -27,7 +28,7 @@ class LeagueResponseItem(BaseModel):
 def transform_leagues(
     envelope: dict[str, Any],
     *,
-    tracked_league_ids: set[int] | None = None,
+    tracked_league_ids: Set[int] | None = None,
 ) -> list[dict[str, Any]]:
     """
     RAW -> CORE rows for core.leagues
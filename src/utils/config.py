@@ -7,6 +7,19 @@ from typing import Any
 import os
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; pure-Python SafeLoader otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_yaml_file(path: Path) -> dict[str, Any]:
+    """Parse a YAML file from its byte stream (libyaml decodes once; no intermediate str)."""
+    with path.open("rb") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
+# Parsed YAML documents keyed by resolved path -> ((st_mtime_ns, st_size), document).
+_YAML_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 @dataclass(frozen=True)
 class APIConfig:
@@ -40,7 +53,7 @@ def load_api_config(path: str | None = None) -> APIConfig:
     - project default `config/api.yaml`
     """
     cfg_path = Path(path or os.getenv("API_FOOTBALL_API_CONFIG") or (_project_root() / "config" / "api.yaml"))
-    cfg = yaml.safe_load(cfg_path.read_text(encoding="utf-8")) or {}
+    cfg = _parse_yaml_file(cfg_path)
     api = cfg.get("api") or {}
 
     base_url = api.get("base_url")
@@ -73,7 +86,7 @@ def load_rate_limiter_config(path: str | None = None) -> RateLimiterConfig:
     - project default `config/rate_limiter.yaml`
     """
     cfg_path = Path(path or os.getenv("API_FOOTBALL_RATE_LIMITER_CONFIG") or (_project_root() / "config" / "rate_limiter.yaml"))
-    cfg = yaml.safe_load(cfg_path.read_text(encoding="utf-8")) or {}
+    cfg = _parse_yaml_file(cfg_path)
     rl = cfg.get("rate_limiter") or {}
 
     token_bucket = rl.get("token_bucket_per_minute")
@@ -103,6 +116,26 @@ def load_rate_limiter_config(path: str | None = None) -> RateLimiterConfig:
 
 def load_yaml(path: str | Path) -> dict[str, Any]:
     p = Path(path)
-    return yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    return _parse_yaml_file(p)
 
 
+def load_yaml_cached(path: str | Path) -> dict[str, Any]:
+    """
+    Parse a YAML config file once per (mtime, size) and reuse the result.
+
+    Job runners re-read config/jobs/*.yaml on every scheduler fire; with this cache an
+    unchanged file costs one stat() instead of a read + parse. Edits on disk are picked
+    up on the next call.
+
+    The returned dict is shared between callers: treat it as read-only.
+    """
+    p = Path(path)
+    st = p.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    key = str(p)
+    hit = _YAML_CACHE.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    cfg = _parse_yaml_file(p)
+    _YAML_CACHE[key] = (sig, cfg)
+    return cfg
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from contextlib import contextmanager
 from typing import Any, Iterable
 
 import psycopg2
 import psycopg2.extras
+import psycopg2.errors
 from dotenv import load_dotenv
 from psycopg2 import sql
 from psycopg2.pool import ThreadedConnectionPool
@@ -20,6 +22,12 @@ except Exception:  # pragma: no cover
 _POOL: ThreadedConnectionPool | None = None
 logger = get_logger(component="db")
 
+# Pool size; jobs that hold connections from worker threads budget their concurrency against it.
+POOL_MAXCONN = 5
+
+# (backend_pid, statement name) pairs already PREPAREd on a pooled session.
+_PREPARED: set[tuple[int, str]] = set()
+
 
 def _build_dsn() -> str:
     load_dotenv()
@@ -47,7 +55,7 @@ def _build_dsn() -> str:
     return f"postgresql://{user}:{password}@{host}:{port}/{db}"
 
 
-def init_pool(minconn: int = 1, maxconn: int = 5) -> None:
+def init_pool(minconn: int = 1, maxconn: int = POOL_MAXCONN) -> None:
     global _POOL
     if _POOL is not None:
         return
@@ -63,6 +71,7 @@ def reset_pool() -> None:
             _POOL.closeall()
         finally:
             _POOL = None
+            _PREPARED.clear()
 
 
 @contextmanager
@@ -83,6 +92,21 @@ def get_db_connection():
         _POOL.putconn(conn)
 
 
+@contextmanager
+def _autocommit_connection():
+    """
+    Pooled connection in autocommit mode for single-statement reads:
+    no implicit BEGIN / explicit COMMIT round-trips around the query.
+    """
+    with get_db_connection() as conn:
+        conn.autocommit = True
+        try:
+            yield conn
+        finally:
+            # Pool users (get_db_connection/get_transaction) expect psycopg2's default.
+            conn.autocommit = False
+
+
 @contextmanager
 def get_transaction():
     """
@@ -114,8 +138,9 @@ def upsert_raw(
     endpoint: str,
     requested_params: dict[str, Any],
     status_code: int,
-    response_headers: dict[str, Any],
+    response_headers: Mapping[str, Any],
     body: dict[str, Any],
+    conn=None,
 ) -> int:
     """
     Insert an API response into RAW archive.
@@ -124,28 +149,35 @@ def upsert_raw(
     errors = body.get("errors") or []
     results = body.get("results")
 
-    with get_db_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO raw.api_responses (
-                  endpoint, requested_params, status_code, response_headers, body, errors, results
-                )
-                VALUES (%s, %s::jsonb, %s, %s::jsonb, %s::jsonb, %s::jsonb, %s)
-                RETURNING id
-                """,
-                (
-                    endpoint,
-                    psycopg2.extras.Json(requested_params),
-                    status_code,
-                    psycopg2.extras.Json(response_headers),
-                    psycopg2.extras.Json(body),
-                    psycopg2.extras.Json(errors),
-                    results,
-                ),
-            )
-            inserted_id = cur.fetchone()[0]
-        conn.commit()
+    stmt = """
+    INSERT INTO raw.api_responses (
+      endpoint, requested_params, status_code, response_headers, body, errors, results
+    )
+    VALUES (%s, %s::jsonb, %s, %s::jsonb, %s::jsonb, %s::jsonb, %s)
+    RETURNING id
+    """
+    params = (
+        endpoint,
+        psycopg2.extras.Json(requested_params),
+        status_code,
+        psycopg2.extras.Json(dict(response_headers)),
+        psycopg2.extras.Json(body),
+        psycopg2.extras.Json(errors),
+        results,
+    )
+
+    if conn is None:
+        with get_db_connection() as conn2:
+            with conn2.cursor() as cur:
+                cur.execute(stmt, params)
+                inserted_id = cur.fetchone()[0]
+            conn2.commit()
+        return int(inserted_id)
+
+    # Transaction-managed caller provided a connection.
+    with conn.cursor() as cur:
+        cur.execute(stmt, params)
+        inserted_id = cur.fetchone()[0]
     return int(inserted_id)
 
 
@@ -224,14 +256,71 @@ def upsert_core(
 
 
 def query_scalar(query: str, params: tuple[Any, ...] | None = None) -> Any:
-    with get_db_connection() as conn:
+    with _autocommit_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(query, params or ())
             row = cur.fetchone()
-        conn.commit()
     return row[0] if row else None
 
 
+def query_row(query: str, params: tuple[Any, ...] | None = None) -> tuple[Any, ...] | None:
+    """Like query_scalar, but returns the whole first row (one round-trip for several values)."""
+    with _autocommit_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params or ())
+            row = cur.fetchone()
+    return tuple(row) if row else None
+
+
+def query_all(query: str, params: tuple[Any, ...] | None = None) -> list[tuple[Any, ...]]:
+    """Like query_row, but returns every row (batched aggregates across leagues)."""
+    with _autocommit_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(query, params or ())
+            rows = cur.fetchall()
+    return [tuple(r) for r in rows]
+
+
+def _execute_prepared(conn, cur, stmt_name: str, prepare_sql: str, params: tuple[Any, ...]) -> None:
+    """
+    EXECUTE a server-side prepared statement, PREPAREing it on first use per session.
+    `prepare_sql` uses $1..$n placeholders (cast them explicitly, e.g. $1::bigint).
+    """
+    if not stmt_name.isidentifier():
+        raise ValueError(f"Invalid prepared statement name: {stmt_name!r}")
+    key = (conn.get_backend_pid(), stmt_name)
+    execute_sql = f"EXECUTE {stmt_name} ({', '.join(['%s'] * len(params))})" if params else f"EXECUTE {stmt_name}"
+    if key not in _PREPARED:
+        cur.execute(f"PREPARE {stmt_name} AS {prepare_sql}")
+        _PREPARED.add(key)
+    try:
+        cur.execute(execute_sql, params)
+    except psycopg2.errors.InvalidSqlStatementName:
+        # Session was replaced behind a reused backend pid; prepare again on this one.
+        if not conn.autocommit:
+            conn.rollback()
+        cur.execute(f"PREPARE {stmt_name} AS {prepare_sql}")
+        cur.execute(execute_sql, params)
+
+
+def query_scalar_prepared(stmt_name: str, prepare_sql: str, params: tuple[Any, ...] = ()) -> Any:
+    """query_scalar over a named server-side prepared statement (parse/plan once per session)."""
+    with _autocommit_connection() as conn:
+        with conn.cursor() as cur:
+            _execute_prepared(conn, cur, stmt_name, prepare_sql, params)
+            row = cur.fetchone()
+    return row[0] if row else None
+
+
+def query_row_prepared(stmt_name: str, prepare_sql: str, params: tuple[Any, ...] = ()) -> tuple[Any, ...] | None:
+    """query_row over a named server-side prepared statement (parse/plan once per session)."""
+    with _autocommit_connection() as conn:
+        with conn.cursor() as cur:
+            _execute_prepared(conn, cur, stmt_name, prepare_sql, params)
+            row = cur.fetchone()
+    return tuple(row) if row else None
+
+
 def upsert_mart_coverage(*, coverage_data: dict[str, Any], conn=None) -> None:
     """
     Insert/update mart.coverage_status (Phase 3 table).
@@ -4,7 +4,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
+from src.utils.config import load_yaml
 
 
 @lru_cache(maxsize=8)
@@ -25,7 +25,7 @@ def daily_tracked_leagues_from_jobs_dir(jobs_dir: str) -> tuple[set[int], int |
         return set(), None
 
     try:
-        cfg = yaml.safe_load(daily_path.read_text(encoding="utf-8")) or {}
+        cfg = load_yaml(daily_path)
     except Exception:
         return set(), None
 
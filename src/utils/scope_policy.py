@@ -4,8 +4,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
-import yaml
-
+from src.utils.config import load_yaml
 from src.utils.db import get_db_connection, query_scalar
 from src.utils.logging import get_logger
 
@@ -35,7 +34,7 @@ def _default_policy_path() -> Path:
 
 def load_scope_policy(path: Path | None = None) -> ScopePolicy:
     p = path or _default_policy_path()
-    raw = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    raw = load_yaml(p)
 
     version = int(raw.get("version") or 1)
     baseline = set(map(str, raw.get("baseline_enabled_endpoints") or []))
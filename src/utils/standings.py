@@ -6,11 +6,11 @@ from pathlib import Path
 from typing import Any
 
 import psycopg2.extras
-import yaml
 
 from src.collector.api_client import APIClient, APIClientError, APIResult, RateLimitError
 from src.collector.rate_limiter import RateLimiter
 from src.transforms.standings import transform_standings
+from src.utils.config import load_yaml_cached
 from src.utils.db import get_transaction, query_scalar, upsert_raw
 from src.utils.logging import get_logger
 from src.utils.dependencies import ensure_standings_dependencies, get_missing_team_ids_in_core
@@ -37,7 +37,7 @@ class StandingsSyncSummary:
 
 
 def _load_config(config_path: Path) -> list[TrackedLeague]:
-    cfg = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+    cfg = load_yaml_cached(config_path)
     default_season = cfg.get("season")
     tracked_leagues = cfg.get("tracked_leagues")
 
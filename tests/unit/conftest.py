@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+
+class FakeCursor:
+    """Records (sql, params) on its connection and returns the connection's canned rows."""
+
+    def __init__(self, conn: FakeConn) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> FakeCursor:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self._conn.executed.append((sql, params))
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        # Each call consumes one canned row; None once they run out (like an exhausted cursor).
+        return self._conn.fetchone_rows.pop(0) if self._conn.fetchone_rows else None
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return list(self._conn.fetchall_rows)
+
+
+class FakeConn:
+    def __init__(self, pid: int = 1) -> None:
+        self.pid = pid
+        self.autocommit = False
+        self.executed: list[tuple[str, Any]] = []
+        self.fetchone_rows: list[tuple[Any, ...]] = []
+        self.fetchall_rows: list[tuple[Any, ...]] = []
+        self.commits = 0
+
+    def get_backend_pid(self) -> int:
+        return self.pid
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        return None
+
+
+class FakeDB:
+    """Stands in for get_transaction / get_db_connection: every checkout yields `conn`."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._monkeypatch = monkeypatch
+        self.conn = FakeConn()
+        self.checkouts = 0
+
+    def patch(self, module: Any, name: str = "get_transaction") -> FakeConn:
+        @contextmanager
+        def _checkout():
+            self.checkouts += 1
+            yield self.conn
+
+        self._monkeypatch.setattr(module, name, _checkout)
+        return self.conn
+
+    def reconnect(self, *, pid: int) -> FakeConn:
+        """Later checkouts yield a fresh session with backend `pid`."""
+        self.conn = FakeConn(pid)
+        return self.conn
+
+
+@pytest.fixture
+def fake_db(monkeypatch: pytest.MonkeyPatch) -> FakeDB:
+    return FakeDB(monkeypatch)
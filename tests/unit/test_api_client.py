@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import os
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 
-from collector.api_client import APIClient
+from collector.api_client import APIClient, RateLimitError
 
 
 @pytest.mark.asyncio
@@ -42,3 +43,29 @@ async def test_get_only():
     await client.aclose()
 
 
+@pytest.mark.asyncio
+async def test_get_or_create_reuses_instance_until_closed(monkeypatch):
+    monkeypatch.setenv("API_FOOTBALL_KEY", "test-key")
+    a = APIClient.get_or_create()
+    b = APIClient.get_or_create()
+    assert a is b
+    await a.aclose()
+
+    c = APIClient.get_or_create()
+    assert c is not a
+    await c.aclose()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_carries_retry_after(monkeypatch):
+    monkeypatch.setenv("API_FOOTBALL_KEY", "test-key")
+    client = APIClient()
+    await client._client.aclose()
+    client._client = httpx.AsyncClient(
+        base_url="https://example.invalid",
+        transport=httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "12"})),
+    )
+    with pytest.raises(RateLimitError) as exc:
+        await client.get("/fixtures")
+    await client.aclose()
+    assert exc.value.retry_after == 12.0
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from src.jobs.auto_finish_stale_fixtures import _load_config
 
 
@@ -37,6 +39,7 @@ def test_load_config_reads_params_and_tracked_leagues(tmp_path: Path) -> None:
     assert cfg.max_fixtures_per_run == 2500
     assert cfg.dry_run is True
     assert cfg.scoped_league_ids == {39, 206}
+    assert cfg.scoped_league_ids_list == [39, 206]
 
 
 def test_load_config_applies_guardrails(tmp_path: Path) -> None:
@@ -162,3 +165,211 @@ def test_load_config_filters_invalid_league_ids(tmp_path: Path) -> None:
     # Only valid IDs should remain
     assert cfg.scoped_league_ids == {39, 78, 140}
 
+
+
+def test_load_config_malformed_param_falls_back_to_defaults(tmp_path: Path) -> None:
+    """A malformed param falls back to its own default; valid params are kept."""
+    daily_yaml = tmp_path / "daily.yaml"
+    daily_yaml.write_text(
+        "\n".join(
+            [
+                "jobs:",
+                "- job_id: auto_finish_stale_fixtures",
+                "  params:",
+                "    threshold_hours: soon",
+                "    safety_lag_hours: 5",
+                "    dry_run: true",
+                "",
+                "tracked_leagues:",
+                "- id: 39",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    cfg = _load_config(daily_yaml)
+    assert cfg.threshold_hours == 2
+    assert cfg.safety_lag_hours == 5
+    assert cfg.max_fixtures_per_run == 1000
+    assert cfg.dry_run is True
+    assert cfg.try_fetch_first is False
+
+
+def test_db_only_run_claims_and_updates_in_one_statement(tmp_path: Path, fake_db) -> None:
+    """DB-only runs use a single SKIP LOCKED claim+update instead of select-then-update."""
+    import asyncio
+
+    import src.jobs.auto_finish_stale_fixtures as mod
+
+    daily_yaml = tmp_path / "daily.yaml"
+    daily_yaml.write_text("tracked_leagues:\n- id: 39\n", encoding="utf-8")
+    conn = fake_db.patch(mod)
+    conn.fetchone_rows = [(2, [39])]
+
+    asyncio.run(mod.run_auto_finish_stale_fixtures(config_path=daily_yaml))
+
+    assert len(conn.executed) == 1
+    sql, _ = conn.executed[0]
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "UPDATE core.fixtures" in sql
+
+
+def test_load_config_is_built_once_per_file_version(tmp_path: Path) -> None:
+    """Unchanged daily.yaml returns the cached config; edits are picked up."""
+    daily_yaml = tmp_path / "daily.yaml"
+    daily_yaml.write_text("tracked_leagues:\n- id: 39\n", encoding="utf-8")
+
+    a = _load_config(daily_yaml)
+    assert _load_config(daily_yaml) is a
+    assert a.scoped_league_ids == frozenset({39})
+
+    daily_yaml.write_text("tracked_leagues:\n- id: 39\n- id: 140\n", encoding="utf-8")
+    b = _load_config(daily_yaml)
+    assert b is not a
+    assert b.scoped_league_ids_list == [39, 140]
+
+
+def test_fetched_fixtures_are_applied_in_one_statement(fake_db, monkeypatch) -> None:
+    """API-fetched fixtures go through a single UPDATE that also clears the verification flag."""
+    import src.jobs.auto_finish_stale_fixtures as mod
+
+    statements: list[tuple[str, list]] = []
+
+    def _fake_execute_values(cur, sql, values, *, template, fetch):
+        statements.append((sql, values))
+        return [(39,), (140,)]
+
+    conn = fake_db.patch(mod)
+    monkeypatch.setattr(mod.psycopg2.extras, "execute_values", _fake_execute_values)
+
+    item = {
+        "fixture": {"id": 1, "status": {"short": "FT", "long": "Match Finished", "elapsed": 90}},
+        "goals": {"home": 2, "away": 1},
+        "score": {"fulltime": {"home": 2, "away": 1}},
+    }
+    fetched = {1: mod._project_fixture_for_finish(item), 2: {**mod._project_fixture_for_finish(item), "id": 2}}
+    result = mod._auto_finish_fixtures(fixture_ids=[1, 2], dry_run=False, fetched_data=fetched)
+
+    assert len(statements) == 1 and conn.commits == 1
+    assert "needs_score_verification = FALSE" in statements[0][0]
+    assert [v[:6] for v in statements[0][1]] == [
+        (1, "FT", "Match Finished", 90, 2, 1),
+        (2, "FT", "Match Finished", 90, 2, 1),
+    ]
+    assert result["updated_count"] == 2
+    assert result["leagues_affected"] == 2
+    assert result["marked_for_verification"] == 0
+
+
+def test_missing_ids_update_is_chunked_in_one_transaction(fake_db, monkeypatch) -> None:
+    """Large fallback updates run as bounded-size statements inside a single transaction."""
+    import src.jobs.auto_finish_stale_fixtures as mod
+
+    conn = fake_db.patch(mod)
+    conn.fetchone_rows = [(2, [39]), (2, [39]), (1, [39])]
+    monkeypatch.setattr(mod, "_UPDATE_CHUNK_SIZE", 2)
+
+    result = mod._auto_finish_fixtures(fixture_ids=[1, 2, 3, 4, 5], dry_run=False)
+
+    assert [len(params[0]) for _, params in conn.executed] == [2, 2, 1]
+    assert fake_db.checkouts == 1
+    assert result["updated_count"] == 5
+    assert result["leagues_affected"] == 1
+
+
+def test_api_batches_run_concurrently_and_stop_on_emergency(monkeypatch) -> None:
+    """Batches overlap up to the configured bound; an emergency stop skips batches not yet started."""
+    import asyncio
+    from types import SimpleNamespace
+
+    import src.jobs.auto_finish_stale_fixtures as mod
+    from src.collector.rate_limiter import EmergencyStopError
+
+    state = {"active": 0, "peak": 0, "calls": 0}
+
+    class _Client:
+        async def get(self, path: str, params: dict):
+            state["calls"] += 1
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            ids = [int(x) for x in params["ids"].split("-")]
+            return SimpleNamespace(headers={}, data={"response": [{"fixture": {"id": i}} for i in ids]})
+
+    class _Limiter:
+        def __init__(self, stop_after: int | None = None) -> None:
+            self.n = 0
+            self.stop_after = stop_after
+
+        def acquire_token(self) -> None:
+            self.n += 1
+            if self.stop_after is not None and self.n > self.stop_after:
+                raise EmergencyStopError("quota low")
+
+        def update_from_headers(self, headers) -> None:
+            return None
+
+    monkeypatch.setenv("AUTO_FINISH_CONCURRENCY", "3")
+
+    ids = list(range(1, 201))  # 10 batches of 20
+    out = asyncio.run(mod._try_fetch_fixtures_batch_from_api(fixture_ids=ids, client=_Client(), limiter=_Limiter()))
+    assert sorted(out) == ids
+    assert 1 < state["peak"] <= 3
+
+    state["calls"] = 0
+    monkeypatch.setenv("AUTO_FINISH_CONCURRENCY", "1")
+    out = asyncio.run(
+        mod._try_fetch_fixtures_batch_from_api(fixture_ids=ids, client=_Client(), limiter=_Limiter(stop_after=2))
+    )
+    assert state["calls"] == 2
+    assert len(out) == 40
+
+
+def test_aimd_window_halves_on_overload_and_grows_back() -> None:
+    from src.jobs.auto_finish_stale_fixtures import _AimdWindow
+
+    w = _AimdWindow(4)
+    w.on_overload()
+    w.on_overload()
+    w.on_overload()
+    assert w.limit == 1.0
+    for _ in range(10):
+        w.on_success()
+    assert w.limit == 4.0
+
+
+def test_low_quota_pause_from_minute_headers() -> None:
+    import httpx
+
+    from src.jobs.auto_finish_stale_fixtures import _low_quota_pause_seconds
+
+    assert _low_quota_pause_seconds(httpx.Headers({"X-RateLimit-Limit": "300", "X-RateLimit-Remaining": "120"})) == 0.0
+    # threshold = 30: 26 slots short at 0.2s/slot
+    assert _low_quota_pause_seconds(httpx.Headers({"X-RateLimit-Limit": "300", "X-RateLimit-Remaining": "5"})) == pytest.approx(5.2)
+    assert _low_quota_pause_seconds(httpx.Headers({"X-RateLimit-Remaining": "1"})) == 0.0
+
+
+def test_stale_status_literal_matches_partial_index_predicate() -> None:
+    """The candidate query's IN list must match migration 27 literally for the partial index to apply."""
+    from src.jobs.auto_finish_stale_fixtures import _STALE_STATUSES_SQL_IN
+
+    migration = Path(__file__).resolve().parents[2] / "db" / "schemas" / "27_fixtures_stale_partial_index.sql"
+    assert f"WHERE status_short IN {_STALE_STATUSES_SQL_IN};" in migration.read_text(encoding="utf-8")
+
+
+def test_still_live_api_fixtures_are_not_finished_but_touched(fake_db) -> None:
+    """Fixtures the API still reports as live are neither applied nor force-finished; only updated_at is bumped."""
+    import src.jobs.auto_finish_stale_fixtures as mod
+
+    conn = fake_db.patch(mod)
+
+    live = mod._project_fixture_for_finish({"fixture": {"id": 7, "status": {"short": "2H", "elapsed": 67}}})
+    result = mod._auto_finish_fixtures(fixture_ids=[7], dry_run=False, fetched_data={7: live})
+
+    assert result["updated_count"] == 0
+    assert result["still_live_skipped"] == 1
+    assert result["marked_for_verification"] == 0
+    # Restarts the safety-lag clock so the next run doesn't re-fetch it immediately.
+    assert conn.executed == [(mod._TOUCH_STILL_LIVE_SQL, ([7], mod._STALE_STATUSES_LIST))]
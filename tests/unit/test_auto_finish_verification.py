@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.collector.api_client import APIResult
+from src.collector.rate_limiter import EmergencyStopError, RateLimiter
+import src.jobs.auto_finish_verification as afv
+
+
+@pytest.fixture
+def run_verification(tmp_path, monkeypatch):
+    """Run the job over `fixture_ids` (one id per batch) with `get` standing in for _safe_get_envelope."""
+    cfg_path = tmp_path / "daily.yaml"
+    cfg_path.write_text(
+        "tracked_leagues:\n  - id: 39\njobs:\n  - job_id: auto_finish_verification\n    params:\n      batch_size: 1\n",
+        encoding="utf-8",
+    )
+    limiter = RateLimiter(max_tokens=10, refill_rate=10.0, emergency_stop_threshold=1)
+    limiter.update_from_headers({"x-ratelimit-requests-remaining": "70000", "X-RateLimit-Remaining": "200"})
+
+    async def _no_details(**_kw):
+        return 0, 0
+
+    monkeypatch.setattr(afv, "_reconcile_not_found", lambda *, max_attempts: 0)
+    monkeypatch.setattr(afv, "_fetch_details_for_verified", _no_details)
+
+    async def _run(fixture_ids: list[int], get) -> None:
+        monkeypatch.setattr(afv, "_select_verification_fixture_ids", lambda *, limit, tracked_league_ids: fixture_ids)
+        monkeypatch.setattr(afv, "_safe_get_envelope", get)
+        await afv.run_auto_finish_verification(client=None, limiter=limiter, config_path=cfg_path)
+
+    return _run
+
+
+@pytest.mark.asyncio
+async def test_details_fetch_runs_concurrently_and_skips_fresh(monkeypatch) -> None:
+    monkeypatch.setattr(
+        afv,
+        "_missing_or_stale_detail_endpoints_bulk",
+        lambda *, fixture_ids, stale_minutes: {
+            fid: (set() if fid == 3 else {"/fixtures/events", "/fixtures/lineups"}) for fid in fixture_ids
+        },
+    )
+    in_flight = 0
+    peak = 0
+    called: list[int] = []
+
+    async def _fake_fetch(*, client, limiter, fixture_id, endpoints):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        called.append(fixture_id)
+
+    monkeypatch.setattr(afv, "_fetch_and_store_fixture_details", _fake_fetch)
+
+    stop = asyncio.Event()
+    fetched, endpoints = await afv._fetch_details_for_verified(
+        client=None, limiter=None, fixture_ids=[1, 2, 3, 4, 5], concurrency=2, stop=stop
+    )
+
+    assert sorted(called) == [1, 2, 4, 5]
+    assert peak == 2
+    assert (fetched, endpoints) == (4, 8)
+    assert not stop.is_set()
+
+
+@pytest.mark.asyncio
+async def test_details_fetch_emergency_stop_sets_event(monkeypatch) -> None:
+    monkeypatch.setattr(
+        afv,
+        "_missing_or_stale_detail_endpoints_bulk",
+        lambda *, fixture_ids, stale_minutes: {fid: {"/fixtures/events"} for fid in fixture_ids},
+    )
+    called: list[int] = []
+
+    async def _fake_fetch(*, client, limiter, fixture_id, endpoints):
+        called.append(fixture_id)
+        raise EmergencyStopError("quota low")
+
+    monkeypatch.setattr(afv, "_fetch_and_store_fixture_details", _fake_fetch)
+
+    stop = asyncio.Event()
+    fetched, endpoints = await afv._fetch_details_for_verified(
+        client=None, limiter=None, fixture_ids=[1, 2, 3], concurrency=1, stop=stop
+    )
+
+    assert stop.is_set()
+    assert called == [1]
+    assert (fetched, endpoints) == (0, 0)
+
+
+
+@pytest.mark.asyncio
+async def test_details_fetch_skips_endpoints_embedded_in_batch(monkeypatch) -> None:
+    monkeypatch.setattr(
+        afv,
+        "_missing_or_stale_detail_endpoints_bulk",
+        lambda *, fixture_ids, stale_minutes: {fid: {"/fixtures/events", "/fixtures/lineups"} for fid in fixture_ids},
+    )
+    called: list[tuple[int, set[str]]] = []
+
+    async def _fake_fetch(*, client, limiter, fixture_id, endpoints):
+        called.append((fixture_id, endpoints))
+
+    monkeypatch.setattr(afv, "_fetch_and_store_fixture_details", _fake_fetch)
+
+    fetched, endpoints = await afv._fetch_details_for_verified(
+        client=None,
+        limiter=None,
+        fixture_ids=[1, 2],
+        concurrency=2,
+        stop=asyncio.Event(),
+        embedded={1: {"/fixtures/events", "/fixtures/lineups"}, 2: {"/fixtures/events"}},
+    )
+
+    assert called == [(2, {"/fixtures/lineups"})]
+    assert (fetched, endpoints) == (1, 1)
+
+
+def test_embedded_endpoint_rows_cover_only_non_empty_blocks() -> None:
+    env = {
+        "response": [
+            {
+                "fixture": {"id": 9},
+                "events": [{"time": {"elapsed": 12}, "team": {"id": 1}, "player": {"id": 5}, "type": "Goal", "detail": "Normal Goal"}],
+                "lineups": [],
+            }
+        ]
+    }
+
+    rows_by_endpoint, covered = afv._embedded_endpoint_rows(env)
+
+    assert covered == {9: {"/fixtures/events"}}
+    assert list(rows_by_endpoint) == ["/fixtures/events"]
+    assert [(r["fixture_id"], r["type"]) for r in rows_by_endpoint["/fixtures/events"]] == [(9, "Goal")]
+
+def test_missing_or_stale_bulk_classifies_all_ids_in_one_query(fake_db, monkeypatch) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    import src.jobs.fixture_details as fd
+
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(fd, "_utc_now", lambda: now)
+    fresh = now - timedelta(minutes=1)
+    old = now - timedelta(hours=2)
+    rows = [(1, ep, fresh) for ep in fd.DETAIL_ENDPOINTS] + [(2, "/fixtures/events", old), (2, "/fixtures/lineups", fresh)]
+    conn = fake_db.patch(fd, "get_db_connection")
+    conn.fetchall_rows = rows
+
+    out = fd._missing_or_stale_detail_endpoints_bulk(fixture_ids=[1, 2, 3], stale_minutes=15)
+
+    assert len(conn.executed) == 1
+    _, params = conn.executed[0]
+    assert params[1] == [1, 2, 3]
+    assert out[1] == set()
+    assert out[2] == {"/fixtures/events", "/fixtures/players", "/fixtures/statistics"}
+    assert out[3] == set(fd.DETAIL_ENDPOINTS)
+
+
+def test_record_attempt_marks_not_found_in_one_statement(fake_db) -> None:
+    conn = fake_db.patch(afv)
+    conn.fetchall_rows = [(10, False), (11, True)]
+
+    hit = afv._record_verification_attempt(fixture_ids=[10, 11], max_attempts=3)
+
+    assert hit == [11]
+    assert len(conn.executed) == 1
+    sql, params = conn.executed[0]
+    assert "'not_found'" in sql and "verification_attempt_count" in sql
+    assert params == (3, [10, 11])
+
+
+def test_load_config_cached_until_file_changes(tmp_path) -> None:
+    cfg_path = tmp_path / "daily.yaml"
+    cfg_path.write_text(
+        "tracked_leagues:\n  - id: 39\njobs:\n  - job_id: auto_finish_verification\n    params:\n      batch_size: 10\n",
+        encoding="utf-8",
+    )
+    first = afv._load_config(cfg_path)
+    assert afv._load_config(cfg_path) is first
+    assert first.batch_size == 10
+    assert first.scoped_league_ids == frozenset({39})
+
+    cfg_path.write_text(
+        "tracked_leagues:\n  - id: 39\njobs:\n  - job_id: auto_finish_verification\n    params:\n      batch_size: 5\n",
+        encoding="utf-8",
+    )
+    assert afv._load_config(cfg_path).batch_size == 5
+
+
+def test_chunk_is_lazy_and_keeps_remainder() -> None:
+    chunks = afv._chunk(list(range(45)), size=20)
+    assert next(chunks) == list(range(20))
+    assert [len(c) for c in chunks] == [20, 5]
+    assert list(afv._chunk([1, 2], size=0)) == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_run_prefetches_next_batch_and_cancels_on_emergency_stop(run_verification, monkeypatch) -> None:
+    events: list[str] = []
+
+    async def _fake_get(*, client, limiter, endpoint, params, label_factory):
+        events.append(f"fetch:{params['ids']}")
+        if params["ids"] == "3":
+            raise EmergencyStopError("quota low")
+        await asyncio.sleep(0)
+        return APIResult(status_code=200, data={}, headers={}), {"response": []}
+
+    monkeypatch.setattr(afv, "transform_fixtures", lambda env: ([{"id": 1}], []))
+    monkeypatch.setattr(afv, "_store_verified_batch", lambda **kw: events.append("store"))
+    monkeypatch.setattr(afv, "_record_verification_attempt", lambda *, fixture_ids, max_attempts: [])
+
+    await run_verification([1, 2, 3, 4], _fake_get)
+
+    # Batch 2 is requested before batch 1 is stored; batch 4 is never requested after the stop on batch 3.
+    assert events[:2] == ["fetch:1", "fetch:2"]
+    assert events.count("store") == 2
+    assert "fetch:4" not in events
+
+
+def test_load_config_malformed_params_fall_back_per_key(tmp_path) -> None:
+    cfg_path = tmp_path / "daily.yaml"
+    cfg_path.write_text(
+        "tracked_leagues:\n  - id: 39\njobs:\n  - job_id: auto_finish_verification\n    params:\n"
+        "      min_daily_quota: lots\n      batch_size: 50\n      max_fixtures_per_run: '300'\n      detail_concurrency: null\n",
+        encoding="utf-8",
+    )
+    cfg = afv._load_config(cfg_path)
+    assert cfg.min_daily_quota == 50000
+    assert cfg.batch_size == 20
+    assert cfg.max_fixtures_per_run == 300
+    assert cfg.detail_concurrency == 4
+
+
+@pytest.mark.asyncio
+async def test_run_ensures_dependencies_once_per_league_season_unless_new_teams(run_verification, monkeypatch) -> None:
+    teams_by_fixture = {1: (10, 11), 2: (11, 10), 3: (10, 12)}
+
+    async def _fake_get(*, client, limiter, endpoint, params, label_factory):
+        fid = int(params["ids"])
+        home, away = teams_by_fixture[fid]
+        item = {
+            "fixture": {"id": fid, "venue": {"id": 5}},
+            "league": {"id": 39, "season": 2024},
+            "teams": {"home": {"id": home}, "away": {"id": away}},
+        }
+        return APIResult(status_code=200, data={}, headers={}), {"response": [item]}
+
+    ensure_calls: list[set[int]] = []
+
+    async def _fake_ensure(*, league_id, season, fixtures_envelope, client, limiter, log_venues):
+        ensure_calls.append(afv._extract_team_ids_from_fixtures_envelope(fixtures_envelope))
+
+    monkeypatch.setattr(afv, "ensure_fixtures_dependencies", _fake_ensure)
+    monkeypatch.setattr(afv, "transform_fixtures", lambda env: ([{"id": 1}], []))
+    monkeypatch.setattr(afv, "_store_verified_batch", lambda **kw: None)
+
+    await run_verification([1, 2, 3], _fake_get)
+
+    # Fixture 2 reuses teams 10/11 and venue 5 -> skipped; fixture 3 brings team 12 -> ensured again.
+    assert ensure_calls == [{10, 11}, {10, 12}]
+
+
+@pytest.mark.asyncio
+async def test_safe_get_envelope_builds_label_only_on_error() -> None:
+    class _Client:
+        def __init__(self, data):
+            self.data = data
+
+        async def get(self, endpoint, params=None):
+            return APIResult(status_code=200, data=self.data, headers={})
+
+    limiter = RateLimiter(max_tokens=10, refill_rate=10.0, emergency_stop_threshold=1)
+    built: list[str] = []
+
+    def _label() -> str:
+        built.append("x")
+        return "/fixtures(ids=1-2)"
+
+    await afv._safe_get_envelope(
+        client=_Client({"response": []}), limiter=limiter, endpoint="/fixtures", params={}, label_factory=_label
+    )
+    assert built == []
+
+    with pytest.raises(RuntimeError, match=r"api_errors:/fixtures\(ids=1-2\)"):
+        await afv._safe_get_envelope(
+            client=_Client({"errors": {"token": "bad"}}), limiter=limiter, endpoint="/fixtures", params={}, label_factory=_label
+        )
+    assert built == ["x"]
+
+
+@pytest.mark.asyncio
+async def test_safe_get_envelope_rate_limit_backoff_is_jittered(monkeypatch) -> None:
+    class _Client:
+        def __init__(self):
+            self.calls = 0
+
+        async def get(self, endpoint, params=None):
+            self.calls += 1
+            data = {"errors": {"rateLimit": "too many"}} if self.calls < 3 else {"response": []}
+            return APIResult(status_code=200, data=data, headers={})
+
+    sleeps: list[float] = []
+
+    async def _fake_sleep(s):
+        sleeps.append(s)
+
+    bounds: list[tuple[float, float]] = []
+
+    def _fake_uniform(lo, hi):
+        bounds.append((lo, hi))
+        return hi / 2
+
+    monkeypatch.setattr(afv.asyncio, "sleep", _fake_sleep)
+    monkeypatch.setattr(afv.random, "uniform", _fake_uniform)
+
+    limiter = RateLimiter(max_tokens=10, refill_rate=10.0, emergency_stop_threshold=1)
+    await afv._safe_get_envelope(
+        client=_Client(), limiter=limiter, endpoint="/fixtures", params={}, label_factory=lambda: "/fixtures"
+    )
+
+    assert bounds == [(0.5, 2.0), (0.5, 4.0)]
+    assert sleeps == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_run_archives_empty_responses_in_background(run_verification, monkeypatch) -> None:
+    async def _fake_get(*, client, limiter, endpoint, params, label_factory):
+        return APIResult(status_code=200, data={}, headers={}), {"response": []}
+
+    archived: list[dict] = []
+
+    def _fake_upsert_raw(**kw):
+        archived.append(kw["requested_params"])
+        if kw["requested_params"]["ids"] == "2":
+            raise RuntimeError("db down")
+        return 1
+
+    monkeypatch.setattr(afv, "_record_verification_attempt", lambda *, fixture_ids, max_attempts: [])
+    monkeypatch.setattr(afv, "upsert_raw", _fake_upsert_raw)
+
+    # A failing background archive write is logged, not raised.
+    await run_verification([1, 2], _fake_get)
+
+    assert sorted(p["ids"] for p in archived) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_safe_get_envelopes_acquire_tokens_off_the_event_loop() -> None:
+    import threading
+
+    import src.jobs.fixture_details as fd
+    from src.collector.api_client import APIResult
+
+    loop_thread = threading.current_thread()
+    acquired_on: list[threading.Thread] = []
+
+    class _Limiter:
+        def acquire_token(self) -> None:
+            acquired_on.append(threading.current_thread())
+
+        def update_from_headers(self, headers) -> None:
+            return None
+
+    class _Client:
+        async def get(self, endpoint, params=None):
+            return APIResult(status_code=200, data={"response": []}, headers={})
+
+    await afv._safe_get_envelope(
+        client=_Client(), limiter=_Limiter(), endpoint="/fixtures", params={}, label_factory=lambda: "/fixtures"
+    )
+    await fd._safe_get_envelope(
+        client=_Client(), limiter=_Limiter(), endpoint="/fixtures/events", params={}, label="/fixtures/events"
+    )
+
+    assert len(acquired_on) == 2
+    assert all(t is not loop_thread for t in acquired_on)
+
+
+@pytest.mark.asyncio
+async def test_run_archives_raw_when_transform_fails(run_verification, monkeypatch) -> None:
+    async def _fake_get(*, client, limiter, endpoint, params, label_factory):
+        return APIResult(status_code=200, data={}, headers={}), {"response": [{"fixture": {"id": int(params["ids"])}}]}
+
+    def _transform(env):
+        if env["response"][0]["fixture"]["id"] == 1:
+            raise ValueError("bad payload")
+        return [{"id": 2}], []
+
+    archived: list[dict] = []
+    stored: list[list[dict]] = []
+    monkeypatch.setattr(afv, "transform_fixtures", _transform)
+    monkeypatch.setattr(afv, "upsert_raw", lambda **kw: archived.append(kw["requested_params"]))
+    monkeypatch.setattr(afv, "_store_verified_batch", lambda **kw: stored.append(kw["fixtures_rows"]))
+
+    await run_verification([1, 2], _fake_get)
+
+    # The unparseable batch is kept in RAW and the run moves on to the next batch.
+    assert archived == [{"ids": "1"}]
+    assert stored == [[{"id": 2}]]
+
+
+@pytest.mark.asyncio
+async def test_run_cancels_prefetch_when_the_loop_raises(run_verification, monkeypatch) -> None:
+    cancelled: list[str] = []
+
+    async def _fake_get(*, client, limiter, endpoint, params, label_factory):
+        if params["ids"] == "2":
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(params["ids"])
+                raise
+        return APIResult(status_code=200, data={}, headers={}), {"response": []}
+
+    async def _boom(**_kw):
+        raise RuntimeError("details blew up")
+
+    monkeypatch.setattr(afv, "transform_fixtures", lambda env: ([{"id": 1}], []))
+    monkeypatch.setattr(afv, "_store_verified_batch", lambda **kw: None)
+    monkeypatch.setattr(afv, "_fetch_details_for_verified", _boom)
+
+    with pytest.raises(RuntimeError, match="details blew up"):
+        await run_verification([1, 2], _fake_get)
+
+    assert cancelled == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_one_raw_archive_write_in_flight(run_verification, monkeypatch) -> None:
+    import threading
+    import time
+
+    async def _fake_get(*, client, limiter, endpoint, params, label_factory):
+        return APIResult(status_code=200, data={}, headers={}), {"response": []}
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "calls": 0}
+
+    def _fake_upsert_raw(**kw):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+            state["calls"] += 1
+        return 1
+
+    monkeypatch.setattr(afv, "_record_verification_attempt", lambda *, fixture_ids, max_attempts: [])
+    monkeypatch.setattr(afv, "upsert_raw", _fake_upsert_raw)
+
+    await run_verification([1, 2, 3, 4], _fake_get)
+
+    assert state["calls"] == 4
+    assert state["peak"] == 1
+
+
+def test_worker_connections_fit_the_pool() -> None:
+    import src.jobs.fixture_details as fd
+    from src.utils.db import POOL_MAXCONN
+
+    # Event loop connection + background RAW writes + an overlapping fixture_details coverage fan-out.
+    assert 1 + afv._RAW_ARCHIVE_CONCURRENCY + fd._COVERAGE_CONCURRENCY <= POOL_MAXCONN
@@ -41,3 +41,17 @@ async def test_auto_finish_verification_primes_quota_when_unknown(tmp_path: Path
     # Should not raise TypeError when daily_remaining is None initially.
     await run_auto_finish_verification(client=client, limiter=limiter, config_path=cfg_path)
 
+
+
+@pytest.mark.asyncio
+async def test_auto_finish_verification_skips_config_below_quota_floor(tmp_path: Path, monkeypatch) -> None:
+    limiter = RateLimiter(max_tokens=10, refill_rate=10.0, emergency_stop_threshold=1)
+    limiter.update_from_headers({"x-ratelimit-requests-remaining": "500", "X-RateLimit-Remaining": "200"})
+
+    def _boom(_path):
+        raise AssertionError("config must not be loaded below the quota floor")
+
+    monkeypatch.setattr("src.jobs.auto_finish_verification._load_config", _boom)
+
+    # Missing config file would raise if it were read.
+    await run_auto_finish_verification(client=FakeClient(), limiter=limiter, config_path=tmp_path / "missing.yaml")
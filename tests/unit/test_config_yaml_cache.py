@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.utils.config import load_yaml_cached
+
+
+def test_load_yaml_cached_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    p = tmp_path / "daily.yaml"
+    p.write_text("season: 2025\n", encoding="utf-8")
+
+    first = load_yaml_cached(p)
+    assert first == {"season": 2025}
+    assert load_yaml_cached(p) is first
+
+    p.write_text("season: 2026\ntracked_leagues: []\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = load_yaml_cached(p)
+    assert second == {"season": 2026, "tracked_leagues": []}
+
+
+def test_load_yaml_cached_empty_file_is_empty_dict(tmp_path: Path) -> None:
+    p = tmp_path / "empty.yaml"
+    p.write_text("", encoding="utf-8")
+    assert load_yaml_cached(p) == {}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -15,23 +16,26 @@ class _Calc(CoverageCalculator):
         self._league_name = league_name
         self._scheduled_in_window = 1
 
-    def _query_actual_fixtures(self, league_id: int, season: int) -> int:
-        return self._actual
-
-    def _query_raw_count_24h(self, league_id: int, season: int) -> int:
-        return self._raw
-
-    def _query_last_update(self, league_id: int, season: int):
-        return self._last_update
+    def _query_coverage_row(self, league_id: int, season: int):
+        return self._actual, self._last_update, self._raw, self._league_name, self._scheduled_in_window
+
+    def _query_coverage_rows(self, pairs, *, preaggregated: bool = False):
+        return {
+            p: (
+                self._actual,
+                self._last_update,
+                self._raw,
+                self._league_name,
+                self._scheduled_in_window,
+                self._calculate_lag_minutes(self._last_update),
+            )
+            for p in pairs
+            if p[0] == 39
+        }
 
     def _query_league_name(self, league_id: int):
         return self._league_name
 
-    def _query_scheduled_fixtures_in_window(
-        self, *, league_id: int, season: int, lookback_days: int, lookahead_days: int
-    ) -> int:
-        return int(self._scheduled_in_window)
-
 
 def test_coverage_formula_basic(tmp_path: Path) -> None:
     cfg = tmp_path / "coverage.yaml"
@@ -44,15 +48,16 @@ def test_coverage_formula_basic(tmp_path: Path) -> None:
     calc = _Calc(cfg, actual=375, raw=380, last_update=last_update, league_name="Premier League")
     cov = calc.calculate_fixtures_coverage(39, 2024)
 
-    assert cov["expected_count"] == 380
-    assert cov["actual_count"] == 375
-    assert cov["count_coverage"] == round(375 / 380 * 100, 2)
-    assert cov["raw_count"] == 380
-    assert cov["pipeline_coverage"] == round(375 / 380 * 100, 2)
-    assert cov["lag_minutes"] >= 15
-    assert cov["freshness_coverage"] > 0
-    assert cov["overall_coverage"] > 0
-    assert cov["flags"]["no_matches_scheduled"] is False
+    assert cov.league_name == "Premier League"
+    assert cov.expected_count == 380
+    assert cov.actual_count == 375
+    assert cov.count_coverage == round(375 / 380 * 100, 2)
+    assert cov.raw_count == 380
+    assert cov.pipeline_coverage == round(375 / 380 * 100, 2)
+    assert cov.lag_minutes >= 15
+    assert cov.freshness_coverage > 0
+    assert cov.overall_coverage > 0
+    assert cov.flags["no_matches_scheduled"] is False
 
 
 def test_coverage_edge_cases_no_expected_or_raw(tmp_path: Path) -> None:
@@ -65,11 +70,138 @@ def test_coverage_edge_cases_no_expected_or_raw(tmp_path: Path) -> None:
     cov = calc.calculate_fixtures_coverage(39, 2024)
 
     # expected_count=0 is treated as "unknown"; we don't emit a misleading 0% count coverage.
-    assert cov["expected_count"] is None
-    assert cov["count_coverage"] is None
-    assert cov["pipeline_coverage"] == 0.0
-    assert cov["lag_minutes"] == 9999
+    assert cov.expected_count is None
+    assert cov.count_coverage is None
+    assert cov.pipeline_coverage == 0.0
+    assert cov.lag_minutes == 9999
     # actual_count=0 must NOT be masked as "no_matches_scheduled"
-    assert cov["flags"]["no_matches_scheduled"] is False
+    assert cov.flags["no_matches_scheduled"] is False
+
+
+
+
+def test_calculate_all_matches_per_league(tmp_path: Path) -> None:
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures:\n  39: 380\n", encoding="utf-8")
+
+    last_update = datetime.now(timezone.utc) - timedelta(minutes=15)
+    calc = _Calc(cfg, actual=375, raw=380, last_update=last_update)
+    batch = calc.calculate_all([(39, 2024), (140, 2024), (39, 2024)])
+
+    assert [c.league_id for c in batch] == [39, 140]
+    assert batch[0] == calc.calculate_fixtures_coverage(39, 2024)
+    # Pairs without any rows fall back to zero counts.
+    assert batch[1].actual_count == 0
+    assert batch[1].last_update is None
+
+
+def test_coverage_config_is_parsed_once_per_file_version(tmp_path: Path) -> None:
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures:\n  39: 380\n", encoding="utf-8")
+
+    a = CoverageCalculator(cfg)
+    b = CoverageCalculator(cfg)
+    assert a.config is b.config
+
+    st = cfg.stat()
+    cfg.write_text("expected_fixtures:\n  39: 306\n", encoding="utf-8")
+    os.utime(cfg, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    c = CoverageCalculator(cfg)
+    assert c.config.expected_fixtures[39] == 306
+
+
+def test_coverage_result_to_dict_matches_mart_columns(tmp_path: Path) -> None:
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures:\n  39: 380\n", encoding="utf-8")
+
+    cov = _Calc(cfg, actual=10, raw=5, last_update=None).calculate_fixtures_coverage(39, 2024)
+    d = cov.to_dict()
+    assert d["core_count"] == d["actual_count"] == 10
+    assert d["endpoint"] == "/fixtures"
+    assert d["flags"]["scheduled_fixtures_in_window"] == 1
+
+
+class _RowCalc(CoverageCalculator):
+    def _query_injuries_coverage_row(self, league_id: int, season: int):
+        return 12, datetime.now(timezone.utc) - timedelta(minutes=30), 1, "Premier League"
+
+    def _query_fixture_endpoint_coverage_row(self, *, league_id: int, season: int, endpoint: str, core_table: str, days: int):
+        return 10, 8, 6, datetime.now(timezone.utc) - timedelta(minutes=5), 3, "Premier League"
+
+
+def test_injuries_coverage_from_single_row(tmp_path: Path) -> None:
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures: {}\n", encoding="utf-8")
+
+    cov = _RowCalc(cfg).calculate_injuries_coverage(39, 2024)
+    assert cov.league_name == "Premier League"
+    assert cov.actual_count == 1
+    assert cov.core_count == 12
+    assert cov.raw_count == 1
+    assert cov.pipeline_coverage == 100.0
+    assert cov.lag_minutes >= 30
+
+
+def test_fixture_endpoint_coverage_from_single_row(tmp_path: Path) -> None:
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures: {}\n", encoding="utf-8")
+
+    cov = _RowCalc(cfg).calculate_fixture_endpoint_coverage(
+        league_id=39, season=2024, endpoint="/fixtures/events", core_table="core.fixture_events"
+    )
+    assert cov.endpoint == "/fixtures/events"
+    assert cov.expected_count == 10
+    assert cov.actual_count == 8
+    assert cov.count_coverage == 80.0
+    assert cov.core_count == 6
+    assert cov.pipeline_coverage == 75.0
+    assert cov.raw_count == 3
+
+
+def test_league_name_lookup_is_cached(tmp_path: Path, monkeypatch) -> None:
+    import coverage.calculator as calc_mod
+
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures: {}\n", encoding="utf-8")
+    calls: list[int] = []
+
+    def _fake_query(name: str, sql: str, params: tuple) -> str:
+        calls.append(params[0])
+        return "Premier League"
+
+    monkeypatch.setattr(calc_mod, "query_scalar_prepared", _fake_query)
+    monkeypatch.setattr(calc_mod, "_LEAGUE_NAMES", {})
+    calc = CoverageCalculator(cfg)
+
+    assert calc._query_league_name(39) == "Premier League"
+    assert calc._query_league_name(39) == "Premier League"
+    assert calls == [39]
+
+
+def test_last_update_is_formatted_as_utc_z(tmp_path: Path) -> None:
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures: {}\n", encoding="utf-8")
+
+    last_update = datetime(2025, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+    cov = _Calc(cfg, actual=1, raw=1, last_update=last_update).calculate_fixtures_coverage(39, 2024)
+    assert cov.last_update == "2025-01-01T12:00:05.000000Z"
+    assert datetime.fromisoformat(cov.last_update.replace("Z", "+00:00")) == last_update
+
+
+def test_fixtures_coverage_is_one_round_trip(tmp_path: Path, monkeypatch) -> None:
+    import coverage.calculator as calc_mod
+
+    cfg = tmp_path / "coverage.yaml"
+    cfg.write_text("expected_fixtures: {}\nfixtures_freshness:\n  schedule_lookback_days: 3\n", encoding="utf-8")
+    calls: list[tuple] = []
+
+    def _fake_row(name: str, sql: str, params: tuple):
+        calls.append((name, params))
+        return 10, None, 2, "Premier League", 0
 
+    monkeypatch.setattr(calc_mod, "query_row_prepared", _fake_row)
+    cov = CoverageCalculator(cfg).calculate_fixtures_coverage(39, 2024)
 
+    assert calls == [("cov_fixtures_row", (39, 2024, 3, 7))]
+    assert cov.flags["scheduled_fixtures_in_window"] == 0
+    assert cov.flags["no_matches_scheduled"] is True
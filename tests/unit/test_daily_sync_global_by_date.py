@@ -127,9 +127,18 @@ async def test_daily_sync_global_by_date_paging_groups_and_dedups(tmp_path: Path
     async def _fake_backfill_missing_venues_for_fixtures(*, venue_ids: list[int], client, limiter, dry_run: bool, max_to_fetch: int) -> int:
         return 0
 
+    class _FakeCov:
+        def __init__(self, league_id: int, season: int) -> None:
+            self.league_id = league_id
+            self.season = season
+            self.overall_coverage = None
+
+        def to_dict(self) -> dict[str, Any]:
+            return {"league_id": self.league_id, "season": self.season, "endpoint": "/fixtures", "overall_coverage": None}
+
     class _FakeCovCalc:
-        def calculate_fixtures_coverage(self, league_id: int, season: int) -> dict[str, Any]:
-            return {"league_id": league_id, "season": season, "endpoint": "/fixtures", "overall_coverage": None}
+        def calculate_all(self, leagues: list[tuple[int, int]], *, preaggregated: bool = False) -> list[_FakeCov]:
+            return [_FakeCov(league_id, season) for league_id, season in leagues]
 
     monkeypatch.setattr(daily_sync_mod, "upsert_raw", _fake_upsert_raw)
     monkeypatch.setattr(daily_sync_mod, "upsert_core", _fake_upsert_core)
@@ -138,6 +147,7 @@ async def test_daily_sync_global_by_date_paging_groups_and_dedups(tmp_path: Path
     monkeypatch.setattr(daily_sync_mod, "backfill_missing_venues_for_fixtures", _fake_backfill_missing_venues_for_fixtures)
     monkeypatch.setattr(daily_sync_mod, "ensure_fixtures_dependencies", _fake_ensure_fixtures_dependencies)
     monkeypatch.setattr(daily_sync_mod, "_refresh_mart_views", lambda conn: None)
+    monkeypatch.setattr(daily_sync_mod, "_refresh_league_counts_view", lambda conn: None)
     monkeypatch.setattr(daily_sync_mod, "_count_existing", lambda conn, table, id_col, ids: 0)
 
     # Dummy transaction context manager
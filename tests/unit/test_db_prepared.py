@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+import utils.db as db
+
+
+def test_prepare_once_per_session(fake_db, monkeypatch) -> None:
+    fake_db.patch(db, "get_db_connection")
+    monkeypatch.setattr(db, "_PREPARED", set())
+
+    logs = []
+    for pid in (101, 101, 202):
+        conn = fake_db.reconnect(pid=pid)
+        conn.fetchone_rows = [(42,)]
+        assert db.query_scalar_prepared("t_stmt", "SELECT $1::int", (7,)) == 42
+        logs.append(conn.executed)
+
+    prepares = [[q for q, _ in log if q.startswith("PREPARE")] for log in logs]
+    assert prepares == [["PREPARE t_stmt AS SELECT $1::int"], [], ["PREPARE t_stmt AS SELECT $1::int"]]
+    assert logs[1] == [("EXECUTE t_stmt (%s)", (7,))]
+
+
+def test_prepared_statement_name_must_be_identifier(fake_db) -> None:
+    with pytest.raises(ValueError):
+        db._execute_prepared(fake_db.conn, fake_db.conn.cursor(), "x; DROP TABLE y", "SELECT 1", ())
+
+
+def test_reads_run_in_autocommit_and_restore_default(fake_db) -> None:
+    conn = fake_db.patch(db, "get_db_connection")
+    conn.fetchone_rows = [(42,)]
+    seen: list[bool] = []
+    cursor = conn.cursor
+
+    def _cursor():
+        seen.append(conn.autocommit)
+        return cursor()
+
+    conn.cursor = _cursor  # type: ignore[method-assign]
+
+    assert db.query_scalar("SELECT 1") == 42
+    assert seen == [True]
+    assert conn.autocommit is False
+
+
+def test_upsert_raw_uses_caller_transaction(fake_db, monkeypatch) -> None:
+    def _no_pool():
+        raise AssertionError("must not check out a second connection")
+
+    monkeypatch.setattr(db, "get_db_connection", _no_pool)
+    conn = fake_db.conn
+    conn.fetchone_rows = [(42,)]
+
+    inserted = db.upsert_raw(
+        endpoint="/fixtures",
+        requested_params={"ids": "1-2"},
+        status_code=200,
+        response_headers={},
+        body={"response": []},
+        conn=conn,
+    )
+
+    assert inserted == 42
+    assert len(conn.executed) == 1
+    assert "INSERT INTO raw.api_responses" in conn.executed[0][0]
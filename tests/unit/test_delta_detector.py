@@ -62,3 +62,47 @@ def test_cache_expiry_results_in_changed_true() -> None:
     assert d.has_changed(1, {"status": "FT", "goals_home": 2, "goals_away": 1, "elapsed": 90}) is True
 
 
+def test_cache_key_is_bytes_and_readable_as_str_key() -> None:
+    r = fakeredis.FakeRedis(decode_responses=True)
+    d = DeltaDetector(r)
+
+    assert d._key(123) == b"fixture:123"
+    d.update_cache(123, {"status": "1H", "goals_home": 0, "goals_away": 0, "elapsed": 5})
+    assert r.exists("fixture:123") == 1
+
+
+def test_get_diff_reuses_read_from_has_changed() -> None:
+    r = fakeredis.FakeRedis(decode_responses=True)
+    d = DeltaDetector(r)
+    d.update_cache(1, {"status": "1H", "goals_home": 0, "goals_away": 0, "elapsed": 10})
+
+    calls = {"get": 0}
+    real_get = r.get
+
+    def _counting_get(key):
+        calls["get"] += 1
+        return real_get(key)
+
+    r.get = _counting_get  # type: ignore[method-assign]
+
+    current = {"status": "1H", "goals_home": 0, "goals_away": 1, "elapsed": 12}
+    assert d.has_changed(1, current) is True
+    diff = d.get_diff(1, current)
+
+    assert calls["get"] == 1
+    assert diff == {"goals_away": {"old": 0, "new": 1}, "elapsed": {"old": 10, "new": 12}}
+
+
+def test_update_cache_many_sets_all_keys_with_ttl() -> None:
+    r = fakeredis.FakeRedis(decode_responses=True)
+    d = DeltaDetector(r, ttl_seconds=60)
+
+    states = {
+        1: {"status": "1H", "goals_home": 1, "goals_away": 0, "elapsed": 10},
+        2: {"status": "HT", "goals_home": 0, "goals_away": 0, "elapsed": 45},
+    }
+    d.update_cache_many(states)
+
+    for fid, state in states.items():
+        assert d.has_changed(fid, state) is False
+        assert 0 < r.ttl(f"fixture:{fid}") <= 60
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+import src.coverage.calculator as calc_mod
+import src.jobs.fixture_details as fd
+
+
+@pytest.mark.asyncio
+async def test_endpoint_coverage_runs_concurrently_within_bound(fake_db, monkeypatch) -> None:
+    league_seasons = [(39, 2025), (140, 2025), (78, 2025)]
+
+    fake_db.patch(fd, "get_db_connection").fetchall_rows = league_seasons
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+    upserts: list[tuple[int, str]] = []
+
+    class _FakeCov:
+        def __init__(self, league_id: int, endpoint: str) -> None:
+            self.league_id = league_id
+            self.endpoint = endpoint
+
+        def to_dict(self) -> dict[str, Any]:
+            return {"league_id": self.league_id, "endpoint": self.endpoint}
+
+    class _FakeCalc:
+        def calculate_fixture_endpoint_coverage(self, *, league_id: int, season: int, endpoint: str, core_table: str, days: int):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return _FakeCov(league_id, endpoint)
+
+    monkeypatch.setattr(fd, "upsert_mart_coverage", lambda *, coverage_data: upserts.append((coverage_data["league_id"], coverage_data["endpoint"])))
+    monkeypatch.setattr(calc_mod, "CoverageCalculator", _FakeCalc)
+
+    await fd._update_mart_coverage_for_fixtures(processed_fixture_ids=[1, 2, 3])
+
+    assert len(upserts) == len(league_seasons) * len(fd.DETAIL_ENDPOINTS)
+    assert 1 < state["peak"] <= fd._COVERAGE_CONCURRENCY
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+import src.jobs.fixture_details as fd
+
+
+@pytest.fixture
+def stub_db(fake_db, monkeypatch):
+    conn = fake_db.patch(fd, "get_db_connection")
+    conn.fetchall_rows = [(101, datetime(2025, 1, 1, tzinfo=timezone.utc), "FT")]
+    monkeypatch.setattr(fd, "_load_tracked_league_ids", lambda *, config_path: {39, 140})
+    monkeypatch.setattr(fd, "_load_tracked_league_seasons", lambda *, config_path: [(39, 2024), (140, 2024)])
+    return conn
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda p: fd._select_backfill_fixtures(days=90, limit=10, config_path=p),
+        lambda p: fd._select_season_backfill_fixtures(limit=10, config_path=p),
+        lambda p: fd._select_recent_finalize_fixtures(hours=48, limit=10, config_path=p),
+        lambda p: fd._select_today_lineups_window(lookback_hours=6, lookahead_hours=6, limit=10, config_path=p),
+    ],
+    ids=["backfill_90d", "season_backfill", "recent_finalize", "today_lineups"],
+)
+def test_selectors_run_one_query_and_build_work_items(stub_db, call) -> None:
+    items = call(Path("daily.yaml"))
+
+    assert items == [fd.FixtureWorkItem(fixture_id=101, date_utc=datetime(2025, 1, 1, tzinfo=timezone.utc), status_short="FT")]
+    assert len(stub_db.executed) == 1
+    _, params = stub_db.executed[0]
+    assert fd._FINAL_STATUSES_LIST in list(params)
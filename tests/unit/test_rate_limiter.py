@@ -3,6 +3,8 @@ from __future__ import annotations
 import threading
 import time
 
+import httpx
+
 from collector.rate_limiter import RateLimiter
 
 
@@ -57,3 +59,22 @@ def test_thread_safety():
     assert 39.0 <= remaining <= 40.1
 
 
+def test_update_from_headers_is_case_insensitive_for_httpx_headers():
+    limiter = RateLimiter(max_tokens=300, refill_rate=0.0001, initial_tokens=300)
+    headers = httpx.Headers({"X-RateLimit-Requests-Remaining": "7400", "x-ratelimit-remaining": "12"})
+
+    limiter.update_from_headers(headers)
+
+    assert limiter.quota.daily_remaining == 7400
+    assert limiter.quota.minute_remaining == 12
+    assert limiter.tokens <= 12.1
+
+
+def test_update_from_headers_refills_before_clamping():
+    limiter = RateLimiter(max_tokens=10, refill_rate=10.0, initial_tokens=0)
+    time.sleep(0.3)  # ~3 tokens accrued but not yet materialized
+
+    limiter.update_from_headers({"X-RateLimit-Remaining": "1"})
+
+    # Accrued tokens are clamped to the API's view instead of being added on top later.
+    assert limiter.tokens < 1.5
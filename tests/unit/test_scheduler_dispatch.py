@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from src.collector import scheduler as sched
+
+
+def test_every_configured_job_has_a_dispatch_entry() -> None:
+    jobs = [j for p in sched._job_files() for j in sched._load_jobs_from_yaml(p)]
+    assert jobs
+
+    for j in jobs:
+        if j.type == "live_loop":
+            continue
+        assert j.job_id in sched._DISPATCH.get(j.type, {}), (j.type, j.job_id)
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_id_raises_at_run_time() -> None:
+    job = sched.Job(
+        job_id="does_not_exist",
+        enabled=True,
+        type="incremental_daily",
+        endpoint=None,
+        params={},
+        interval=None,
+        dependencies=[],
+        filters={},
+        mode={},
+    )
+    runner = sched._build_runner(job, client=None, limiter=None)  # type: ignore[arg-type]
+
+    with pytest.raises(ValueError, match="Unknown incremental_daily job_id"):
+        await runner()
+
+
+def test_identical_cron_schedules_share_one_trigger() -> None:
+    tz = sched.ZoneInfo("UTC")
+    a = sched._to_trigger({"type": "cron", "cron": "0 3 * * *"}, tz)
+    b = sched._to_trigger({"type": "cron", "cron": " 0 3 * * * "}, tz)
+    assert a is b
+    assert sched._to_trigger({"type": "cron", "cron": "0 4 * * *"}, tz) is not a
+
+
+def test_season_and_tracked_leagues_are_parsed_at_load_time() -> None:
+    jobs = [j for p in sched._job_files() for j in sched._load_jobs_from_yaml(p)]
+    by_id = {j.job_id: j for j in jobs}
+    bl = by_id.get("bootstrap_leagues")
+    if bl is None:
+        pytest.skip("bootstrap_leagues not configured")
+    assert isinstance(bl.cached_tracked, frozenset) and bl.cached_tracked
+    assert isinstance(bl.cached_season, int)
+
+
+def test_scheduler_tz_is_cached_and_falls_back_to_utc(monkeypatch) -> None:
+    monkeypatch.setenv("SCHEDULER_TIMEZONE", "Not/AZone")
+    tz = sched._scheduler_tz()
+    assert tz.key == "UTC"
+    assert sched._scheduler_tz() is tz
+    assert sched._scheduler_tz_for.cache_info().hits >= 1